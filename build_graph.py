@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Content-hash build graph for the schedule -> travel -> fatigue -> figures/reports pipeline.
+
+Each stage declares the files it reads (data inputs plus the code and config
+that shape its result) and the files it writes. A stage's fingerprint is the
+SHA-256 of its command and the contents of all of its inputs; a stage is
+skipped when the fingerprint matches the last successful run and its outputs
+are still the files that run produced. Because downstream fingerprints are
+taken from content, a rerun that produces byte-identical output stops the
+rebuild there.
+
+Dependencies are derived from outputs -> inputs; stages whose dependencies
+are satisfied run concurrently (the two validators, the four figures, ...).
+
+Usage:
+    python3 build_graph.py                 # bring everything up to date
+    python3 build_graph.py figure_04       # one stage and whatever it depends on
+    python3 build_graph.py --dry-run       # show what would run
+    python3 build_graph.py --force --jobs 4
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+STATE_DIR = '.build'
+STATE_FILE = os.path.join(STATE_DIR, 'state.json')
+LOG_DIR = os.path.join(STATE_DIR, 'logs')
+
+TRAVEL_FILE = 'nd_womens_basketball_2025_2026.csv'
+CORRECTED_FILE = 'nd_womens_basketball_2025_2026_CORRECTED.csv'
+FATIGUE_FILE = 'nd_womens_basketball_2025_2026_with_fatigue_metrics.csv'
+
+TRAVEL_CODE = ['travel_engine.py', 'venues.py', 'travel_modes.py', 'road_routing.py']
+CUBE_CODE = ['rollup_cube.py', 'season_dataset.py']
+CUBE_FILES = ['rollup_cube.csv', 'rollup_cube.manifest.json']  # Refreshed by generate_fatigue_metrics.py
+FIGURE_FILES = {
+    '01': '01_travel_analysis.png',
+    '02': '02_schedule_timeline.png',
+    '03': '03_travel_frequency.png',
+    '04': '04_fatigue_assessment.png',
+}
+
+# Stage -> command, inputs (data, code and config; missing optional files hash as absent) and outputs
+STAGES = {
+    'travel': {
+        'command': ['fix_virginia_geocoding.py'],
+        'inputs': ['fix_virginia_geocoding.py', *TRAVEL_CODE, 'road_graph.gr'],
+        'outputs': [CORRECTED_FILE],
+    },
+    'schedule': {
+        'command': ['-c', f"import shutil; shutil.copyfile('{CORRECTED_FILE}', '{TRAVEL_FILE}')"],
+        'inputs': [CORRECTED_FILE],
+        'outputs': [TRAVEL_FILE],
+    },
+    'fatigue': {
+        'command': ['generate_fatigue_metrics.py'],
+        'inputs': [TRAVEL_FILE, 'generate_fatigue_metrics.py', 'fatigue_model.py', 'season_timeline.py',
+                   'game_records.py', 'schedule_loader.py', *TRAVEL_CODE, *CUBE_CODE],
+        'outputs': [FATIGUE_FILE, *CUBE_FILES],
+    },
+    **{
+        f'figure_{number}': {
+            'command': ['visualize_metrics.py', number],
+            'inputs': [FATIGUE_FILE, 'visualize_metrics.py', 'schedule_loader.py', *CUBE_CODE],
+            'outputs': [png],
+        }
+        for number, png in FIGURE_FILES.items()
+    },
+    'validate_trips': {
+        'command': ['validate_all_trips.py'],
+        'inputs': [TRAVEL_FILE, 'validate_all_trips.py', 'schedule_loader.py', *TRAVEL_CODE, 'road_graph.gr'],
+        'outputs': [],
+    },
+    'validate_visualization': {
+        'command': ['validate_visualization_data.py'],
+        'inputs': [TRAVEL_FILE, FATIGUE_FILE, 'validate_visualization_data.py', 'schedule_diff.py', 'schedule_loader.py'],
+        'outputs': [],
+    },
+    'reports': {
+        'command': ['report_generator.py'],
+        'inputs': [TRAVEL_FILE, FATIGUE_FILE, 'report_generator.py', 'fatigue_model.py', *TRAVEL_CODE,
+                   *CUBE_CODE, 'templates/TEAM_BRIEFING.md.tmpl', 'templates/TRIP_VALIDATION_REPORT.md.tmpl',
+                   'templates/VISUALIZATION_VALIDATION_REPORT.md.tmpl'],
+        'outputs': ['TEAM_BRIEFING.md', 'TRIP_VALIDATION_REPORT.md', 'VISUALIZATION_VALIDATION_REPORT.md'],
+    },
+    'sensitivity': {
+        'command': ['fatigue_sensitivity.py'],
+        'inputs': [FATIGUE_FILE, 'fatigue_sensitivity.py', 'fatigue_model.py', 'schedule_loader.py'],
+        'outputs': ['nd_womens_basketball_2025_2026_fatigue_sensitivity.csv'],
+    },
+    'delay_simulation': {
+        'command': ['travel_delay_simulation.py'],
+        'inputs': [TRAVEL_FILE, FATIGUE_FILE, 'travel_delay_simulation.py', 'fatigue_model.py',
+                   'schedule_loader.py'],
+        'outputs': ['nd_womens_basketball_2025_2026_fatigue_simulation.csv'],
+    },
+    'impulse_response': {
+        'command': ['impulse_response.py'],
+        'inputs': [TRAVEL_FILE, FATIGUE_FILE, 'impulse_response.py', 'season_timeline.py', 'game_records.py',
+                   'jet_lag.py', 'acc_single_round_robin_2025_2026.csv', *TRAVEL_CODE, *CUBE_CODE],
+        'outputs': ['nd_womens_basketball_2025_2026_impulse_response.csv'],
+    },
+    'postseason_simulation': {
+        'command': ['postseason_simulation.py'],
+        'inputs': [TRAVEL_FILE, 'postseason_simulation.py', 'fatigue_model.py', 'schedule_loader.py',
+                   'game_records.py', *TRAVEL_CODE],
+        'outputs': ['nd_womens_basketball_2025_2026_postseason_projection.csv'],
+    },
+}
+
+
+def file_hash(path, cache):
+    """SHA-256 of a file ('absent' if missing), reusing cached hashes while size and mtime are unchanged"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return 'absent'
+    cached = cache.get(path)
+    if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+        return cached['sha256']
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    cache[path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest}
+    return digest
+
+
+def stage_fingerprint(name, stage, cache):
+    """Hash of a stage's command and input contents"""
+    digest = hashlib.sha256(json.dumps([name, stage['command']]).encode())
+    for path in stage['inputs']:
+        digest.update(f"{path}:{file_hash(path, cache)}\n".encode())
+    return digest.hexdigest()
+
+
+def dependencies(stages=STAGES):
+    """{stage: set of stages producing one of its inputs}"""
+    producers = {output: name for name, stage in stages.items() for output in stage['outputs']}
+    return {name: {producers[path] for path in stage['inputs'] if path in producers and producers[path] != name}
+            for name, stage in stages.items()}
+
+
+def select(targets, deps):
+    """The target stages plus everything upstream of them"""
+    selected = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in deps:
+            raise ValueError(f"Unknown stage '{name}' (known: {', '.join(deps)})")
+        if name not in selected:
+            selected.add(name)
+            pending.extend(deps[name])
+    return selected
+
+
+def is_fresh(name, stage, state, cache):
+    """True when the last run had the same fingerprint and its outputs are untouched"""
+    record = state['stages'].get(name)
+    if not record or record['fingerprint'] != stage_fingerprint(name, stage, cache):
+        return False
+    return all(file_hash(path, cache) == record['outputs'].get(path) for path in stage['outputs'])
+
+
+def run_stage(name, stage):
+    """Run one stage's command, logging its output; returns (return code, seconds)"""
+    os.makedirs(LOG_DIR, exist_ok=True)
+    start = time.perf_counter()
+    with open(os.path.join(LOG_DIR, f'{name}.log'), 'w') as log:
+        result = subprocess.run([sys.executable, *stage['command']], stdout=log, stderr=subprocess.STDOUT)
+    return result.returncode, time.perf_counter() - start
+
+
+def build(targets=None, jobs=None, force=False, dry_run=False, stages=STAGES):
+    """Bring the selected stages up to date; returns {stage: (status, seconds)}"""
+    try:
+        with open(STATE_FILE) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = {'stages': {}, 'files': {}}
+    cache = state['files']
+    deps = dependencies(stages)
+    remaining = select(targets or list(stages), deps)
+    results = {}
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        while remaining or running:
+            for name in sorted(remaining):
+                if any(dep in remaining or dep in running for dep in deps[name]):
+                    continue
+                remaining.discard(name)
+                if any(results[dep][0] in ('failed', 'blocked') for dep in deps[name] if dep in results):
+                    results[name] = ('blocked', 0.0)
+                elif not force and is_fresh(name, stages[name], state, cache):
+                    results[name] = ('skipped', 0.0)
+                elif dry_run:
+                    results[name] = ('would run', 0.0)
+                else:
+                    # Fingerprint the inputs as they are when the stage starts
+                    fingerprint = stage_fingerprint(name, stages[name], cache)
+                    running[pool.submit(run_stage, name, stages[name])] = (name, fingerprint)
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, fingerprint = running.pop(future)
+                code, seconds = future.result()
+                if code == 0:
+                    state['stages'][name] = {
+                        'fingerprint': fingerprint,
+                        'outputs': {path: file_hash(path, cache) for path in stages[name]['outputs']},
+                    }
+                    results[name] = ('ran', seconds)
+                else:
+                    state['stages'].pop(name, None)
+                    results[name] = ('failed', seconds)
+
+    if not dry_run:
+        os.makedirs(STATE_DIR, exist_ok=True)
+        with open(STATE_FILE, 'w') as f:
+            json.dump(state, f, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild only the pipeline stages whose inputs changed")
+    parser.add_argument('targets', nargs='*', help="Stages to bring up to date (default: all)")
+    parser.add_argument('--jobs', type=int, help="Stages to run in parallel (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="Rerun every selected stage")
+    parser.add_argument('--dry-run', action='store_true', help="Only report which stages would run")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = build(args.targets, args.jobs, args.force, args.dry_run)
+    elapsed = time.perf_counter() - start
+
+    icons = {'ran': '✓', 'skipped': '·', 'would run': '→', 'failed': '❌', 'blocked': '⛔'}
+    print("=" * 100)
+    print("BUILD GRAPH")
+    print("=" * 100)
+    for name in STAGES:
+        if name in results:
+            status, seconds = results[name]
+            timing = f"{seconds:6.2f}s" if status in ('ran', 'failed') else ""
+            log = f"  (see {os.path.join(LOG_DIR, name + '.log')})" if status == 'failed' else ""
+            print(f"  {icons[status]} {name:24s} {status:10s} {timing}{log}")
+    counts = {status: sum(1 for s, _ in results.values() if s == status) for status in icons}
+    print(f"\nRan: {counts['ran']} | Skipped: {counts['skipped']} | Failed: {counts['failed']} | "
+          f"Blocked: {counts['blocked']} | Wall time: {elapsed:.2f}s")
+    print("=" * 100)
+    sys.exit(1 if counts['failed'] else 0)
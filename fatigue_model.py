@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Parametric, vectorized fatigue scoring.
+
+The thresholds and weights of the fatigue score live in a declarative spec
+(FATIGUE_SPEC). compile_spec() turns one spec - or a whole grid of them -
+into threshold/points arrays, and evaluate() scores every game with
+broadcast bin-and-lookup operations, so G parameter settings x N games are
+scored in one computation. The single-spec helpers below (travel_component,
+score_schedule, ...) use the default spec and broadcast over leading axes,
+e.g. a (scenarios x games) array.
+"""
+
+import copy
+import itertools
+
+import numpy as np
+
+# Each binned component scores a value by counting how many thresholds it
+# passes and looking the count up in its points list.
+FATIGUE_SPEC = {
+    # Component 1: Travel intensity (0-30 points) by leg distance in miles
+    'travel': {
+        'thresholds': [('>', 0), ('>=', 500), ('>=', 1000), ('>=', 2500)],
+        'points': [0, 5, 15, 25, 30],
+    },
+    # Component 2: Timezone impact (0-20 points)
+    'timezone': {
+        'points_per_unit': 5,
+    },
+    # Component 3: Rest days (0-20 points) - fewer days = more fatigue
+    'rest': {
+        'thresholds': [('>', 1), ('>', 2), ('>', 3)],
+        'points': [20, 10, 5, 0],
+    },
+    # Component 4: Consecutive away games (0-30 points) among the previous `window` games
+    'consecutive': {
+        'window': 2,
+        'thresholds': [('>=', 1), ('>=', 2)],
+        'points_away': [0, 15, 30],
+        'points_home': [0, 0, 30],
+    },
+    'max_score': 100,
+    'levels': {
+        'thresholds': [30, 50, 70],
+        'labels': ['LOW', 'MODERATE', 'HIGH', 'VERY HIGH'],
+    },
+}
+
+FATIGUE_LEVELS = np.array(FATIGUE_SPEC['levels']['labels'])
+
+COMPONENT_COLUMNS = {
+    'travel': 'Travel_Fatigue_Component',
+    'timezone': 'Timezone_Fatigue_Component',
+    'rest': 'Rest_Fatigue_Component',
+    'consecutive': 'Consecutive_Game_Fatigue',
+}
+
+
+def _stack(specs, path, dtype=float):
+    """Stack one spec field across the grid, requiring the same shape everywhere"""
+    values = []
+    for spec in specs:
+        value = spec
+        for key in path:
+            value = value[key]
+        values.append(value)
+    try:
+        return np.array(values, dtype=dtype)
+    except ValueError:
+        raise ValueError(f"Spec field '{'.'.join(path)}' must have the same length in every grid setting")
+
+
+def _compile_thresholds(specs, component):
+    """Strictness flags and edges (G x K) for a binned component"""
+    thresholds = [spec[component]['thresholds'] for spec in specs]
+    for t in thresholds:
+        for op, _ in t:
+            if op not in ('>', '>='):
+                raise ValueError(f"Unsupported threshold operator '{op}' in '{component}'")
+    try:
+        strict = np.array([[op == '>' for op, _ in t] for t in thresholds], dtype=bool)
+        edges = np.array([[value for _, value in t] for t in thresholds], dtype=float)
+    except ValueError:
+        raise ValueError(f"'{component}' must have the same number of thresholds in every grid setting")
+    return strict, edges
+
+
+def compile_spec(specs=FATIGUE_SPEC):
+    """Compile a spec (or list of specs) into G-stacked threshold and points arrays"""
+    specs = [specs] if isinstance(specs, dict) else list(specs)
+    windows = {spec['consecutive']['window'] for spec in specs}
+    labels = {tuple(spec['levels']['labels']) for spec in specs}
+    if len(windows) != 1 or len(labels) != 1:
+        raise ValueError("Consecutive window and level labels must be the same in every grid setting")
+
+    compiled = {'size': len(specs), 'window': windows.pop(), 'labels': np.array(labels.pop())}
+    for component in ('travel', 'rest', 'consecutive'):
+        compiled[component + '_strict'], compiled[component + '_edges'] = _compile_thresholds(specs, component)
+    compiled['travel_points'] = _stack(specs, ['travel', 'points'])
+    compiled['rest_points'] = _stack(specs, ['rest', 'points'])
+    compiled['consecutive_points_away'] = _stack(specs, ['consecutive', 'points_away'])
+    compiled['consecutive_points_home'] = _stack(specs, ['consecutive', 'points_home'])
+    compiled['timezone_per_unit'] = _stack(specs, ['timezone', 'points_per_unit'])
+    compiled['max_score'] = _stack(specs, ['max_score'])
+    compiled['level_edges'] = _stack(specs, ['levels', 'thresholds'])
+
+    for component in ('travel', 'rest'):
+        if compiled[component + '_points'].shape[1] != compiled[component + '_edges'].shape[1] + 1:
+            raise ValueError(f"'{component}' needs one more points entry than thresholds")
+    return compiled
+
+
+def _bin_index(values, strict, edges, gridded=False):
+    """Number of thresholds each value passes; result has shape (G, *values.shape).
+
+    gridded=True means values already carry the leading grid axis.
+    """
+    values = np.asarray(values, dtype=float)
+    if not gridded:
+        values = values[None]
+    expand = (slice(None),) + (None,) * (values.ndim - 1) + (slice(None),)
+    x = values[..., None]
+    passed = np.where(strict[expand], x > edges[expand], x >= edges[expand])
+    return passed.sum(axis=-1)
+
+
+def _lookup(points, index):
+    """points[g, index[g, ...]] for every grid setting g"""
+    grid = np.arange(points.shape[0]).reshape((-1,) + (1,) * (index.ndim - 1))
+    return points[grid, index]
+
+
+def prior_away_count(is_away, window=2):
+    """Away games among the previous `window` games (along the last axis)"""
+    is_away = np.asarray(is_away, dtype=bool)
+    prior = np.zeros(is_away.shape, dtype=int)
+    for lag in range(1, window + 1):
+        prior[..., lag:] += is_away[..., :-lag]
+    return prior
+
+
+def evaluate(compiled, miles, timezones, days_rest, is_away):
+    """Fatigue components, score and level index for every grid setting x game"""
+    is_away = np.asarray(is_away, dtype=bool)
+    grid_shape = (-1,) + (1,) * is_away.ndim
+
+    travel = _lookup(compiled['travel_points'],
+                     _bin_index(miles, compiled['travel_strict'], compiled['travel_edges']))
+    timezone = compiled['timezone_per_unit'].reshape(grid_shape) * np.asarray(timezones, dtype=float)[None]
+    rest = _lookup(compiled['rest_points'],
+                   _bin_index(days_rest, compiled['rest_strict'], compiled['rest_edges']))
+    prior = _bin_index(prior_away_count(is_away, compiled['window']),
+                       compiled['consecutive_strict'], compiled['consecutive_edges'])
+    consecutive = np.where(is_away[None],
+                           _lookup(compiled['consecutive_points_away'], prior),
+                           _lookup(compiled['consecutive_points_home'], prior))
+
+    score = np.minimum(compiled['max_score'].reshape(grid_shape), travel + timezone + rest + consecutive)
+    level_index = _bin_index(score, np.zeros(compiled['level_edges'].shape, dtype=bool),
+                             compiled['level_edges'], gridded=True)
+    return {
+        'travel': travel,
+        'timezone': timezone,
+        'rest': rest,
+        'consecutive': consecutive,
+        'score': score,
+        'level_index': level_index,
+    }
+
+
+def spec_grid(axes, base=FATIGUE_SPEC):
+    """Every combination of parameter overrides as (settings, spec) pairs.
+
+    axes maps dotted spec paths to candidate values, e.g.
+    {'timezone.points_per_unit': [3, 5, 7], 'consecutive.points_away': [[0, 10, 20], [0, 15, 30]]}
+    """
+    paths = list(axes)
+    grid = []
+    for values in itertools.product(*(axes[path] for path in paths)):
+        spec = copy.deepcopy(base)
+        for path, value in zip(paths, values):
+            *parents, leaf = path.split('.')
+            target = spec
+            for key in parents:
+                target = target[key]
+            if leaf not in target:
+                raise KeyError(f"Unknown fatigue spec field '{path}'")
+            target[leaf] = value
+        grid.append((dict(zip(paths, values)), spec))
+    return grid
+
+
+_DEFAULT = compile_spec(FATIGUE_SPEC)
+
+
+def travel_component(miles):
+    """Travel intensity (0-30 points) from leg distance"""
+    return _lookup(_DEFAULT['travel_points'],
+                   _bin_index(miles, _DEFAULT['travel_strict'], _DEFAULT['travel_edges']))[0].astype(int)
+
+
+def timezone_component(timezones):
+    """Timezone impact (5 points per timezone crossed)"""
+    return np.asarray(timezones) * int(_DEFAULT['timezone_per_unit'][0])
+
+
+def rest_component(days_rest):
+    """Rest days (0-20 points) - fewer days = more fatigue; accepts fractional days"""
+    return _lookup(_DEFAULT['rest_points'],
+                   _bin_index(days_rest, _DEFAULT['rest_strict'], _DEFAULT['rest_edges']))[0].astype(int)
+
+
+def consecutive_component(is_away):
+    """Consecutive away games (0-30 points) from the games before each game"""
+    is_away = np.asarray(is_away, dtype=bool)
+    prior = _bin_index(prior_away_count(is_away, _DEFAULT['window']),
+                       _DEFAULT['consecutive_strict'], _DEFAULT['consecutive_edges'])
+    return np.where(is_away,
+                    _lookup(_DEFAULT['consecutive_points_away'], prior)[0],
+                    _lookup(_DEFAULT['consecutive_points_home'], prior)[0]).astype(int)
+
+
+def days_rest_from_dates(day_numbers):
+    """Days since the previous game (0 for the first game) from sorted day numbers"""
+    day_numbers = np.asarray(day_numbers)
+    days_rest = np.zeros(day_numbers.shape, dtype=int)
+    days_rest[..., 1:] = np.diff(day_numbers, axis=-1)
+    return days_rest
+
+
+def fatigue_score(travel, timezone, rest, consecutive):
+    """Overall fatigue score (capped at the spec's max_score) from the four components"""
+    return np.minimum(int(_DEFAULT['max_score'][0]), travel + timezone + rest + consecutive)
+
+
+def fatigue_level(score):
+    """Fatigue level category for each score"""
+    edges = _DEFAULT['level_edges'][0]
+    return _DEFAULT['labels'][np.searchsorted(edges, np.asarray(score), side='right')]
+
+
+def score_schedule(miles, timezones, days_rest, is_away):
+    """All fatigue components and the overall score for a schedule (or a batch of them)"""
+    travel = travel_component(miles)
+    timezone = timezone_component(timezones)
+    rest = rest_component(days_rest)
+    consecutive = consecutive_component(is_away)
+    return {
+        'Travel_Fatigue_Component': travel,
+        'Timezone_Fatigue_Component': timezone,
+        'Rest_Fatigue_Component': rest,
+        'Consecutive_Game_Fatigue': consecutive,
+        'Overall_Fatigue_Score': fatigue_score(travel, timezone, rest, consecutive),
+    }
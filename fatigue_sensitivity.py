@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Fatigue weight-sensitivity sweep.
+
+Evaluates a grid of fatigue parameter settings (see fatigue_model.FATIGUE_SPEC)
+against every game in one broadcast computation, then reports how much the
+top-10 fatigue games and the Fatigue_Level distribution move with each weight.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+import fatigue_model
+import schedule_loader
+
+# Candidate values for each swept spec field (every combination is evaluated)
+SWEEP_AXES = {
+    'travel.points': [[0, 3, 10, 20, 25], [0, 5, 15, 25, 30], [0, 8, 20, 30, 35]],
+    'timezone.points_per_unit': [3, 5, 7, 10],
+    'rest.points': [[15, 8, 4, 0], [20, 10, 5, 0], [25, 15, 8, 0]],
+    'consecutive.points_away': [[0, 10, 20], [0, 15, 30], [0, 20, 40]],
+}
+TOP_N = 10
+
+
+def top_games(scores, n=TOP_N):
+    """Indices of the n highest scores per grid setting (ties keep schedule order)"""
+    return np.argsort(-scores, axis=-1, kind='stable')[..., :n]
+
+
+def run_sweep(df, axes=SWEEP_AXES):
+    """Score every grid setting x game; returns (settings, evaluation, baseline index)"""
+    grid = fatigue_model.spec_grid(axes)
+    compiled = fatigue_model.compile_spec([spec for _, spec in grid])
+    evaluation = fatigue_model.evaluate(
+        compiled,
+        df['Travel_Distance_Miles'].values,
+        df['Timezones_Crossed'].values,
+        df['Days_Rest_Since_Last'].values,
+        (df['Home_Away'] == 'Away').values,
+    )
+    settings = [setting for setting, _ in grid]
+    baseline = next((i for i, (_, spec) in enumerate(grid) if spec == fatigue_model.FATIGUE_SPEC), None)
+    if baseline is None:
+        raise ValueError("Sweep axes must include the FATIGUE_SPEC value of every swept field "
+                         "(the baseline the other settings are compared with)")
+    return settings, evaluation, baseline
+
+
+def summarize(df, settings, evaluation, baseline):
+    """One row per grid setting: parameters, top-10 overlap with baseline and level counts"""
+    scores = evaluation['score']
+    top = top_games(scores)
+    in_baseline_top = np.isin(top, top[baseline])
+    labels = fatigue_model.FATIGUE_LEVELS
+    level_counts = (evaluation['level_index'][..., None] == np.arange(len(labels))).sum(axis=1)
+
+    summary = pd.DataFrame([{path: str(value) for path, value in setting.items()} for setting in settings])
+    summary['Top10_Overlap'] = in_baseline_top.sum(axis=1)
+    for i, label in enumerate(labels):
+        summary[f'{label.title().replace(" ", "_")}_Games'] = level_counts[:, i]
+    summary['Top10_Games'] = [
+        ', '.join(str(n) for n in df['Game_Number'].values[row]) for row in top
+    ]
+    return summary
+
+
+if __name__ == "__main__":
+    df = schedule_loader.load_csv('nd_womens_basketball_2025_2026_with_fatigue_metrics.csv')
+    output_file = 'nd_womens_basketball_2025_2026_fatigue_sensitivity.csv'
+
+    start = time.perf_counter()
+    settings, evaluation, baseline = run_sweep(df)
+    elapsed = time.perf_counter() - start
+    summary = summarize(df, settings, evaluation, baseline)
+    summary.to_csv(output_file, index=False)
+
+    print("=" * 100)
+    print("FATIGUE WEIGHT SENSITIVITY - NOTRE DAME WOMEN'S BASKETBALL 2025-2026")
+    print("=" * 100)
+    print(f"Parameter settings: {len(settings)} | Games: {len(df)} | Time: {elapsed * 1000:.1f} ms")
+
+    print("\n🎚️  SENSITIVITY BY PARAMETER (averaged over all other settings)")
+    print("-" * 100)
+    for path in SWEEP_AXES:
+        print(f"\n{path}:")
+        for value, group in summary.groupby(path, sort=False):
+            print(f"  {value:22s} | Top-10 overlap: {group['Top10_Overlap'].mean():4.1f}/{TOP_N} | "
+                  f"VERY HIGH: {group['Very_High_Games'].mean():4.1f} | HIGH: {group['High_Games'].mean():4.1f} | "
+                  f"MODERATE: {group['Moderate_Games'].mean():4.1f} | LOW: {group['Low_Games'].mean():4.1f}")
+
+    print("\n🔴 MOST ROBUST HIGH-FATIGUE GAMES (share of settings with the game in the top 10)")
+    print("-" * 100)
+    top_share = np.bincount(top_games(evaluation['score']).ravel(), minlength=len(df)) / len(settings)
+    for i in np.argsort(-top_share, kind='stable')[:TOP_N]:
+        row = df.iloc[i]
+        print(f"Game {row['Game_Number']:2.0f} | {row['Game_Date']:%Y-%m-%d} | {row['Opponent']:20s} | "
+              f"Baseline: {row['Overall_Fatigue_Score']:3.0f} | In top 10: {100 * top_share[i]:5.1f}%")
+
+    print("\n" + "=" * 100)
+    print(f"✓ Sweep results saved to: {output_file}")
+    print("=" * 100)
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Compact typed game records.
+
+GameRecord is a __slots__ record for code that handles one game at a time.
+GameBatch stores many games as one NumPy structured array (about 25 bytes
+per game) with venue, opponent and sport names interned into shared
+string tables, dates as int32 day numbers (days since 1970-01-01), enums
+as uint8 codes and distances / hours as float32.
+
+Both convert to and from the TRAVEL_FIELDS row dicts used by
+travel_engine, DataFrames and the travel CSV; writing a batch back out
+reproduces the CSV byte for byte.
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+import travel_engine
+import travel_modes
+from venues import city_coords
+
+HOME_AWAY = ['Home', 'Away', 'Neutral']
+DIRECTIONS = ['Home', 'North', 'South', 'Eastbound', 'Westbound', 'Unknown']
+MODES = [travel_modes.NO_TRAVEL_MODE, *travel_modes.TRAVEL_MODES]
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+GAME_DTYPE = np.dtype([
+    ('game_number', np.int32),
+    ('sport', np.uint8),
+    ('opponent', np.uint16),
+    ('date', np.int32),         # Days since 1970-01-01
+    ('venue', np.uint16),
+    ('home_away', np.uint8),
+    ('miles', np.float32),
+    ('hours', np.float32),
+    ('timezones', np.uint8),
+    ('direction', np.uint8),
+    ('mode', np.uint8),
+])
+
+
+def day_number(iso_date):
+    """'2025-11-05' -> days since 1970-01-01"""
+    return date.fromisoformat(iso_date).toordinal() - EPOCH_ORDINAL
+
+
+def iso_date(day):
+    """Days since 1970-01-01 -> '2025-11-05'"""
+    return date.fromordinal(int(day) + EPOCH_ORDINAL).isoformat()
+
+
+class GameRecord:
+    """One game's travel row with fixed attributes instead of a per-game dict"""
+
+    __slots__ = ('game_number', 'sport', 'opponent', 'date', 'location', 'home_away',
+                 'miles', 'hours', 'timezones', 'direction', 'mode')
+
+    def __init__(self, game_number, sport, opponent, date, location, home_away,
+                 miles=0.0, hours=0.0, timezones=0, direction='Home', mode=travel_modes.NO_TRAVEL_MODE):
+        self.game_number = game_number
+        self.sport = sport
+        self.opponent = opponent
+        self.date = date
+        self.location = location
+        self.home_away = home_away
+        self.miles = miles
+        self.hours = hours
+        self.timezones = timezones
+        self.direction = direction
+        self.mode = mode
+
+    @classmethod
+    def from_row(cls, row):
+        """From a TRAVEL_FIELDS dict (travel_engine rows or csv.DictReader rows)"""
+        return cls(int(row['Game_Number']), row['Sport'], row['Opponent'], row['Game_Date'], row['Location'],
+                   row['Home_Away'], float(row['Travel_Distance_Miles']), float(row['Travel_Duration_Hours']),
+                   int(row['Timezones_Crossed']), row['Travel_Direction'],
+                   row.get('Travel_Mode', travel_modes.NO_TRAVEL_MODE))
+
+    def to_row(self):
+        """TRAVEL_FIELDS dict, rounded the way travel_engine writes it"""
+        return {
+            'Game_Number': self.game_number,
+            'Sport': self.sport,
+            'Opponent': self.opponent,
+            'Game_Date': self.date,
+            'Location': self.location,
+            'Home_Away': self.home_away,
+            'Travel_Distance_Miles': round(self.miles, 1) if self.miles else 0,
+            'Travel_Duration_Hours': round(self.hours, 2) if self.hours else 0,
+            'Timezones_Crossed': self.timezones,
+            'Travel_Direction': self.direction,
+            'Travel_Mode': self.mode,
+        }
+
+    def __repr__(self):
+        return (f"GameRecord({self.game_number}, {self.opponent!r}, {self.date}, {self.location!r}, "
+                f"{self.home_away}, {self.miles:.1f} mi)")
+
+
+class StringTable:
+    """Interned strings <-> small integer codes"""
+
+    def __init__(self, values=()):
+        self.values = []
+        self.codes = {}
+        for value in values:
+            self.code(value)
+
+    def code(self, value):
+        if value not in self.codes:
+            self.codes[value] = len(self.values)
+            self.values.append(value)
+        return self.codes[value]
+
+    def encode(self, values):
+        return np.fromiter((self.code(v) for v in values), dtype=np.int64, count=len(values))
+
+    def decode(self, codes):
+        return np.asarray(self.values, dtype=object)[codes]
+
+
+class GameBatch:
+    """Columnar batch of games backed by one GAME_DTYPE structured array"""
+
+    def __init__(self, data, venues, opponents, sports):
+        self.data = data
+        self.venues = venues
+        self.opponents = opponents
+        self.sports = sports
+
+    @staticmethod
+    def _tables():
+        return StringTable(city_coords), StringTable(), StringTable([travel_engine.SPORT])
+
+    @staticmethod
+    def _enum(values, labels):
+        lookup = {label: i for i, label in enumerate(labels)}
+        try:
+            return np.fromiter((lookup[v] for v in values), dtype=np.uint8, count=len(values))
+        except KeyError as e:
+            raise ValueError(f"Unknown value {e.args[0]!r} (expected one of {labels})") from None
+
+    @classmethod
+    def from_columns(cls, columns):
+        """From TRAVEL_FIELDS column -> sequence mapping"""
+        venues, opponents, sports = cls._tables()
+        n = len(columns['Game_Number'])
+        data = np.empty(n, dtype=GAME_DTYPE)
+        data['game_number'] = columns['Game_Number']
+        data['sport'] = sports.encode(list(columns['Sport']))
+        data['opponent'] = opponents.encode(list(columns['Opponent']))
+        data['date'] = (np.asarray(columns['Game_Date'], dtype='datetime64[D]') - np.datetime64(0, 'D')).astype(np.int32)
+        data['venue'] = venues.encode(list(columns['Location']))
+        data['home_away'] = cls._enum(list(columns['Home_Away']), HOME_AWAY)
+        data['miles'] = columns['Travel_Distance_Miles']
+        data['hours'] = columns['Travel_Duration_Hours']
+        data['timezones'] = columns['Timezones_Crossed']
+        data['direction'] = cls._enum(list(columns['Travel_Direction']), DIRECTIONS)
+        data['mode'] = cls._enum(list(columns.get('Travel_Mode', [travel_modes.NO_TRAVEL_MODE] * n)), MODES)
+        return cls(data, venues, opponents, sports)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """From TRAVEL_FIELDS dicts or GameRecords"""
+        rows = [r.to_row() if isinstance(r, GameRecord) else r for r in rows]
+        fields = [f for f in travel_engine.TRAVEL_FIELDS if not rows or f in rows[0]]
+        return cls.from_columns({field: [row[field] for row in rows] for field in fields})
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """From a travel DataFrame (TRAVEL_FIELDS columns)"""
+        return cls.from_columns({column: df[column].to_numpy() for column in travel_engine.TRAVEL_FIELDS
+                                 if column in df.columns})
+
+    @classmethod
+    def read_csv(cls, path):
+        """Load a travel CSV"""
+        return cls.from_dataframe(pd.read_csv(path, keep_default_na=False, na_values=['']))
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self.record(index)
+        return GameBatch(self.data[index], self.venues, self.opponents, self.sports)
+
+    def __iter__(self):
+        return (self.record(i) for i in range(len(self.data)))
+
+    def record(self, i):
+        """GameRecord for the i-th game"""
+        game = self.data[i]
+        return GameRecord(int(game['game_number']), self.sports.values[game['sport']],
+                          self.opponents.values[game['opponent']], iso_date(game['date']),
+                          self.venues.values[game['venue']], HOME_AWAY[game['home_away']],
+                          float(game['miles']), float(game['hours']), int(game['timezones']),
+                          DIRECTIONS[game['direction']], MODES[game['mode']])
+
+    def away_mask(self):
+        return self.data['home_away'] == HOME_AWAY.index('Away')
+
+    def to_dataframe(self):
+        """Decoded travel DataFrame (miles rounded to 0.1, hours to 0.01)"""
+        d = self.data
+        return pd.DataFrame({
+            'Game_Number': d['game_number'],
+            'Sport': self.sports.decode(d['sport']),
+            'Opponent': self.opponents.decode(d['opponent']),
+            'Game_Date': (d['date'].astype('datetime64[D]')).astype(str),
+            'Location': self.venues.decode(d['venue']),
+            'Home_Away': np.asarray(HOME_AWAY, dtype=object)[d['home_away']],
+            'Travel_Distance_Miles': d['miles'].astype(float).round(1),
+            'Travel_Duration_Hours': d['hours'].astype(float).round(2),
+            'Timezones_Crossed': d['timezones'].astype(int),
+            'Travel_Direction': np.asarray(DIRECTIONS, dtype=object)[d['direction']],
+            'Travel_Mode': np.asarray(MODES, dtype=object)[d['mode']],
+        })
+
+    def to_rows(self):
+        """TRAVEL_FIELDS dicts, as travel_engine.build_travel_rows returns them"""
+        return [record.to_row() for record in self]
+
+    def to_csv(self, path):
+        """Write the travel CSV in the same format as fix_virginia_geocoding.py"""
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=travel_engine.TRAVEL_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.to_rows())
+
+    def nbytes(self):
+        """Bytes held by the array and the string tables"""
+        tables = sum(sys.getsizeof(v) for t in (self.venues, self.opponents, self.sports) for v in t.values)
+        return self.data.nbytes + tables
+
+
+def dict_rows_nbytes(rows):
+    """Approximate bytes held by a list of row dicts (dicts, keys shared, values counted)"""
+    return sys.getsizeof(rows) + sum(sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row.values())
+                                     for row in rows)
+
+
+if __name__ == "__main__":
+    source = 'nd_womens_basketball_2025_2026.csv'
+    with open(source, newline='') as f:
+        rows = list(csv.DictReader(f))
+    batch = GameBatch.read_csv(source)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'roundtrip.csv')
+        batch.to_csv(path)
+        identical = open(path, 'rb').read() == open(source, 'rb').read()
+
+    # League-archive scale: replicate the season to a million games
+    copies = 1_000_000 // len(batch) + 1
+    big = GameBatch(np.tile(batch.data, copies), batch.venues, batch.opponents, batch.sports)
+    start = time.perf_counter()
+    away_miles = big.data['miles'][big.away_mask()].sum(dtype=np.float64)
+    elapsed = time.perf_counter() - start
+
+    per_dict = dict_rows_nbytes(rows) / len(rows)
+    per_record = GAME_DTYPE.itemsize
+    print("=" * 100)
+    print("COMPACT GAME RECORDS")
+    print("=" * 100)
+    print(f"Games: {len(batch)} | CSV round trip identical: {'✓' if identical else '❌'}")
+    print(f"Memory per game: dict row ~{per_dict:,.0f} bytes | GameBatch {per_record} bytes "
+          f"({per_dict / per_record:.0f}x smaller)")
+    print(f"{len(big):,} games: {big.data.nbytes / 1e6:.1f} MB as a batch vs ~{per_dict * len(big) / 1e9:.1f} GB as dicts")
+    print(f"Away miles over {len(big):,} games: {away_miles:,.0f} in {elapsed * 1000:.1f} ms")
+    print(f"\nFirst games: {batch[0]} | {batch[1]}")
+    print("=" * 100)
@@ -2,104 +2,49 @@ import csv
 import pandas as pd
 from datetime import datetime, timedelta
 
+import fatigue_model
+import rollup_cube
+import schedule_loader
+import season_timeline
+
 # Read the main schedule
-df = pd.read_csv('nd_womens_basketball_2025_2026.csv')
-df['Game_Date'] = pd.to_datetime(df['Game_Date'])
+# Travel metrics stay float64: they are summed into the cumulative columns and written back out
+df = schedule_loader.load_csv('nd_womens_basketball_2025_2026.csv', schema={
+    **schedule_loader.SCHEMA, 'Travel_Distance_Miles': 'float64', 'Travel_Duration_Hours': 'float64'})
 
-# Create derived metrics CSV
-derived_data = []
+# Daily location timeline; days rest since the previous game, nights away and
+# timezone adaptation are read from it
+timeline = season_timeline.TeamTimeline.from_travel(df)
+timeline_metrics = timeline.game_metrics()
+days_rest = timeline_metrics['Days_Rest_Since_Last'].values
 
-for idx, row in df.iterrows():
-    # Travel Frequency: Games within 7 days with travel
-    days_since_last = (row['Game_Date'] - df[df.index < idx]['Game_Date'].max()).days if idx > 0 else 0
-    
-    # Cumulative travel at this point in season
-    cumulative_miles = df[df.index <= idx]['Travel_Distance_Miles'].sum()
-    cumulative_hours = df[df.index <= idx]['Travel_Duration_Hours'].sum()
-    
-    # Days rest since previous game
-    if idx > 0:
-        prev_date = df.iloc[idx-1]['Game_Date']
-        days_rest = (row['Game_Date'] - prev_date).days
-    else:
-        days_rest = 0
-    
-    # Fatigue Score (0-100): higher = more fatigue
-    # Based on: travel miles, travel hours, days rest, consecutive away games, timezone changes
-    fatigue_score = 0
-    
-    # Component 1: Travel intensity (0-30 points)
-    if row['Travel_Distance_Miles'] == 0:
-        travel_fatigue = 0
-    elif row['Travel_Distance_Miles'] < 500:
-        travel_fatigue = 5
-    elif row['Travel_Distance_Miles'] < 1000:
-        travel_fatigue = 15
-    elif row['Travel_Distance_Miles'] < 2500:
-        travel_fatigue = 25
-    else:
-        travel_fatigue = 30
-    
-    # Component 2: Timezone impact (0-20 points)
-    timezone_fatigue = row['Timezones_Crossed'] * 5
-    
-    # Component 3: Rest days (0-20 points) - fewer days = more fatigue
-    if days_rest <= 1:
-        rest_fatigue = 20
-    elif days_rest == 2:
-        rest_fatigue = 10
-    elif days_rest <= 3:
-        rest_fatigue = 5
-    else:
-        rest_fatigue = 0
-    
-    # Component 4: Consecutive away games (0-30 points)
-    consecutive_away = 0
-    for j in range(max(0, idx-2), idx):
-        if df.iloc[j]['Home_Away'] == 'Away':
-            consecutive_away += 1
-    
-    if consecutive_away >= 2:
-        consecutive_fatigue = 30
-    elif consecutive_away == 1 and row['Home_Away'] == 'Away':
-        consecutive_fatigue = 15
-    else:
-        consecutive_fatigue = 0
-    
-    fatigue_score = min(100, travel_fatigue + timezone_fatigue + rest_fatigue + consecutive_fatigue)
-    
-    # Determine fatigue level category
-    if fatigue_score >= 70:
-        fatigue_level = "VERY HIGH"
-    elif fatigue_score >= 50:
-        fatigue_level = "HIGH"
-    elif fatigue_score >= 30:
-        fatigue_level = "MODERATE"
-    else:
-        fatigue_level = "LOW"
-    
-    derived_data.append({
-        'Game_Number': row['Game_Number'],
-        'Game_Date': row['Game_Date'].date(),
-        'Opponent': row['Opponent'],
-        'Home_Away': row['Home_Away'],
-        'Days_Rest_Since_Last': days_rest,
-        'Travel_Distance_Miles': row['Travel_Distance_Miles'],
-        'Travel_Duration_Hours': row['Travel_Duration_Hours'],
-        'Timezones_Crossed': row['Timezones_Crossed'],
-        'Travel_Direction': row['Travel_Direction'],
-        'Cumulative_Distance_Miles': round(cumulative_miles, 1),
-        'Cumulative_Hours': round(cumulative_hours, 1),
-        'Travel_Fatigue_Component': travel_fatigue,
-        'Timezone_Fatigue_Component': timezone_fatigue,
-        'Rest_Fatigue_Component': rest_fatigue,
-        'Consecutive_Game_Fatigue': consecutive_fatigue,
-        'Overall_Fatigue_Score': fatigue_score,
-        'Fatigue_Level': fatigue_level,
-    })
+# Fatigue Score (0-100): higher = more fatigue
+# Based on: travel miles, days rest, consecutive away games, timezone changes.
+# Thresholds and weights are declared in fatigue_model.FATIGUE_SPEC.
+components = fatigue_model.score_schedule(
+    df['Travel_Distance_Miles'].values,
+    df['Timezones_Crossed'].values,
+    days_rest,
+    (df['Home_Away'] == 'Away').values,
+)
 
 # Create dataframe and save
-derived_df = pd.DataFrame(derived_data)
+derived_df = pd.DataFrame({
+    'Game_Number': df['Game_Number'],
+    'Game_Date': df['Game_Date'].dt.date,
+    'Opponent': df['Opponent'],
+    'Home_Away': df['Home_Away'],
+    'Days_Rest_Since_Last': days_rest,
+    'Travel_Distance_Miles': df['Travel_Distance_Miles'],
+    'Travel_Duration_Hours': df['Travel_Duration_Hours'],
+    'Timezones_Crossed': df['Timezones_Crossed'],
+    'Travel_Direction': df['Travel_Direction'],
+    # Cumulative travel at this point in season
+    'Cumulative_Distance_Miles': df['Travel_Distance_Miles'].cumsum().round(1),
+    'Cumulative_Hours': df['Travel_Duration_Hours'].cumsum().round(1),
+    **components,
+    'Fatigue_Level': fatigue_model.fatigue_level(components['Overall_Fatigue_Score']),
+})
 derived_df.to_csv('nd_womens_basketball_2025_2026_with_fatigue_metrics.csv', index=False)
 
 print("=" * 100)
@@ -151,20 +96,25 @@ if len(recovery_windows) > 0:
 else:
     print("Limited recovery windows identified - schedule is relatively condensed")
 
+# Nights away and timezone adaptation from the daily timeline
+print("\n🧳 NIGHTS AWAY & TIMEZONE ADAPTATION")
+print("-" * 100)
+print(f"Nights away from home: {int(timeline.away_nights().sum())} | "
+      f"Travel days: {int(timeline.data['traveling'].sum())} | "
+      f"Most nights away in a week: {timeline_metrics['Nights_Away_Last_7'].max()}")
+unadapted = timeline_metrics[(timeline_metrics['Offset_From_Home'] != 0) & (timeline_metrics['Days_At_Offset'] <= 1)]
+for idx, row in unadapted.iterrows():
+    print(f"Game {derived_df.loc[idx, 'Game_Number']:2.0f} | {row['Game_Date']} | {row['Venue']:20s} | "
+          f"{row['Offset_From_Home']:+d} h from home, {row['Days_At_Offset']} day(s) to adapt")
+
 # Month-by-month analysis
 print("\n📅 FATIGUE BY MONTH")
 print("-" * 100)
-derived_df['Month'] = pd.to_datetime(derived_df['Game_Date']).dt.to_period('M')
-for month, group in derived_df.groupby('Month'):
-    avg_fatigue = group['Overall_Fatigue_Score'].mean()
-    max_fatigue = group['Overall_Fatigue_Score'].max()
-    games_count = len(group)
-    away_count = (group['Home_Away'] == 'Away').sum()
-    travel_miles = group['Travel_Distance_Miles'].sum()
-    
+monthly = rollup_cube.rollup(rollup_cube.load_cube(), 'Month', team='Notre Dame', season='2025-2026')
+for month, row in monthly.iterrows():
     print(f"\n{month}:")
-    print(f"  Games: {games_count} (Away: {away_count}) | Travel: {travel_miles:.0f} miles | "
-          f"Avg Fatigue: {avg_fatigue:.1f} | Max Fatigue: {max_fatigue:.0f}")
+    print(f"  Games: {row['Games']:.0f} (Away: {row['Away_Sum']:.0f}) | Travel: {row['Miles_Sum']:.0f} miles | "
+          f"Avg Fatigue: {row['Fatigue_Mean']:.1f} | Max Fatigue: {row['Fatigue_Max']:.0f}")
 
 print("\n" + "=" * 100)
 print(f"✓ Extended metrics saved to: nd_womens_basketball_2025_2026_with_fatigue_metrics.csv")
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Banister fitness-fatigue impulse-response model over daily game and travel load.
+
+Every day of a team's timeline (season_timeline) carries a load impulse: a
+game, hours traveled and hours of timezone shift, weighted by IMPULSE_SPEC.
+Fitness and fatigue are the load convolved with exponential decay kernels of
+different time constants, counting loads up to the day before:
+
+    fitness(t) = sum_{s < t} load(s) * exp(-(t - s) / fitness_tau)
+    fatigue(t) = sum_{s < t} load(s) * exp(-(t - s) / fatigue_tau)
+    form(t)    = k_fitness * fitness(t) - k_fatigue * fatigue(t)
+
+Unlike the Cumulative_* columns of the fatigue file, a November road trip has
+all but vanished from fatigue by March. All teams are convolved at once on a
+shared day axis, for any number of time constants: directly (a lower
+triangular Toeplitz product) for short series and with FFTs from FFT_MIN_DAYS
+on. fit_time_constants() scores a whole (fitness_tau x fatigue_tau) grid in one
+batch, solving the baseline and gains of every grid point by least squares.
+
+Usage:
+    python3 impulse_response.py                # Notre Dame per-game file + generated ACC slate
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+import jet_lag
+import season_timeline
+from game_records import iso_date
+
+IMPULSE_SPEC = {
+    'game_load': 10.0,            # Load units per game played
+    'travel_load_per_hour': 2.0,  # Per hour traveled that day
+    'timezone_load_per_hour': 3.0,  # Per hour of UTC-offset change overnight
+    'fitness_tau': 42.0,          # Days
+    'fatigue_tau': 7.0,
+    'k_fitness': 1.0,
+    'k_fatigue': 2.0,
+}
+
+FFT_MIN_DAYS = 128  # Direct Toeplitz products below this series length, FFT from it on
+FITNESS_TAUS = np.arange(14, 71, 4, dtype=float)
+FATIGUE_TAUS = np.arange(2, 16, 1, dtype=float)
+LEAGUE_TEAMS = 360  # Division I scale for the timing benchmark
+
+TRAVEL_FILE = 'nd_womens_basketball_2025_2026.csv'
+FATIGUE_FILE = 'nd_womens_basketball_2025_2026_with_fatigue_metrics.csv'
+OUTPUT_FILE = 'nd_womens_basketball_2025_2026_impulse_response.csv'
+
+
+def load_grid(timelines, spec=IMPULSE_SPEC):
+    """(teams x days) daily load impulses on a shared day axis and the first day"""
+    first_day = min(t.first_day for t in timelines)
+    last_day = max(t.first_day + len(t) - 1 for t in timelines)
+    grid = np.zeros((len(timelines), last_day - first_day + 1))
+    for i, timeline in enumerate(timelines):
+        data = timeline.data
+        shift = np.abs(np.diff(data['utc_offset'].astype(float), prepend=float(data['utc_offset'][0])))
+        start = timeline.first_day - first_day
+        grid[i, start:start + len(timeline)] = (
+            spec['game_load'] * (data['game'] != season_timeline.NO_GAME)
+            + spec['travel_load_per_hour'] * data['travel_hours']
+            + spec['timezone_load_per_hour'] * shift
+        )
+    return grid, first_day
+
+
+def decay_kernels(taus, n_days):
+    """(taus x days) exp(-t / tau) with a zero at t = 0 (a day's load counts from the next day)"""
+    t = np.arange(n_days, dtype=float)
+    kernels = np.exp(-t / np.asarray(taus, dtype=float)[:, None])
+    kernels[:, 0] = 0.0
+    return kernels
+
+
+def impulse_response(loads, taus):
+    """(taus x teams x days) decayed sums of the (teams x days) loads for each time constant"""
+    loads = np.atleast_2d(np.asarray(loads, dtype=float))
+    n_days = loads.shape[1]
+    kernels = decay_kernels(np.atleast_1d(taus), n_days)
+    if n_days < FFT_MIN_DAYS:
+        lag = np.arange(n_days)[:, None] - np.arange(n_days)[None, :]
+        toeplitz = np.where(lag >= 0, kernels[:, np.maximum(lag, 0)], 0.0)  # (taus x day x source day)
+        return np.einsum('kij,tj->kti', toeplitz, loads)
+    size = 1 << (2 * n_days - 1).bit_length()
+    spectrum = np.fft.rfft(kernels, size)[:, None, :] * np.fft.rfft(loads, size)[None, :, :]
+    return np.fft.irfft(spectrum, size)[..., :n_days]
+
+
+def banister(loads, spec=IMPULSE_SPEC):
+    """Fitness, fatigue and form (teams x days) for one parameter set"""
+    fitness, fatigue = impulse_response(loads, [spec['fitness_tau'], spec['fatigue_tau']])
+    return fitness, fatigue, spec['k_fitness'] * fitness - spec['k_fatigue'] * fatigue
+
+
+def game_responses(timelines, teams, spec=IMPULSE_SPEC):
+    """One row per game of every team: the day's load and fitness, fatigue and form going into the game"""
+    grid, first_day = load_grid(timelines, spec)
+    fitness, fatigue, form = banister(grid, spec)
+    frames = []
+    for i, (team, timeline) in enumerate(zip(teams, timelines)):
+        columns = timeline.game_days - first_day
+        frames.append(pd.DataFrame({
+            'Team': team,
+            'Game_Date': [iso_date(d) for d in timeline.game_days],
+            'Daily_Load': grid[i, columns].round(2),
+            'Fitness': fitness[i, columns].round(2),
+            'Fatigue': fatigue[i, columns].round(2),
+            'Form': form[i, columns].round(2),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def fit_time_constants(loads, team_index, day_index, target, fitness_taus=FITNESS_TAUS, fatigue_taus=FATIGUE_TAUS):
+    """Least-squares baseline and gains for every (fitness_tau, fatigue_tau) pair, best fit first.
+
+    target ~ baseline + k_fitness * fitness - k_fatigue * fatigue, observed at (team_index, day_index).
+    """
+    fitness = impulse_response(loads, fitness_taus)[:, team_index, day_index]  # (F x observations)
+    fatigue = impulse_response(loads, fatigue_taus)[:, team_index, day_index]  # (G x observations)
+    target = np.asarray(target, dtype=float)
+    n_fit, n_fat = len(fitness), len(fatigue)
+
+    # Design matrices for every grid point at once: (F x G x observations x 3)
+    design = np.stack(np.broadcast_arrays(np.ones((1, 1, len(target))), fitness[:, None, :],
+                                          -fatigue[None, :, :]), axis=-1)
+    gram = np.einsum('fgoi,fgoj->fgij', design, design) + 1e-9 * np.eye(3)
+    moment = np.einsum('fgoi,o->fgi', design, target)
+    coefficients = np.linalg.solve(gram, moment[..., None])[..., 0]
+    residuals = target - np.einsum('fgoi,fgi->fgo', design, coefficients)
+    sse = (residuals ** 2).sum(axis=-1)
+    total = ((target - target.mean()) ** 2).sum()
+
+    grid = pd.DataFrame({
+        'Fitness_Tau': np.repeat(fitness_taus, n_fat),
+        'Fatigue_Tau': np.tile(fatigue_taus, n_fit),
+        'Baseline': coefficients[..., 0].ravel().round(3),
+        'K_Fitness': coefficients[..., 1].ravel().round(4),
+        'K_Fatigue': coefficients[..., 2].ravel().round(4),
+        'RMSE': np.sqrt(sse / len(target)).ravel().round(3),
+        'R2': (1 - sse / total).ravel().round(4) if total else 0.0,
+    })
+    return grid.sort_values('RMSE', kind='stable', ignore_index=True)
+
+
+if __name__ == "__main__":
+    travel = season_timeline.read_travel(TRAVEL_FILE)
+    timeline = season_timeline.TeamTimeline.from_travel(travel)
+    games = game_responses([timeline], ['Notre Dame'])
+    fatigue = pd.read_csv(FATIGUE_FILE)
+    nd = pd.concat([fatigue[['Game_Number', 'Game_Date', 'Opponent', 'Home_Away', 'Cumulative_Hours',
+                             'Overall_Fatigue_Score']], games.drop(columns=['Team', 'Game_Date'])], axis=1)
+    nd.drop(columns=['Cumulative_Hours', 'Overall_Fatigue_Score']).to_csv(OUTPUT_FILE, index=False)
+
+    print("=" * 100)
+    print("FITNESS-FATIGUE IMPULSE RESPONSE")
+    print("=" * 100)
+    print(f"Load: {IMPULSE_SPEC['game_load']:g}/game + {IMPULSE_SPEC['travel_load_per_hour']:g}/travel hour + "
+          f"{IMPULSE_SPEC['timezone_load_per_hour']:g}/timezone hour | tau fitness {IMPULSE_SPEC['fitness_tau']:g} d, "
+          f"fatigue {IMPULSE_SPEC['fatigue_tau']:g} d | form = {IMPULSE_SPEC['k_fitness']:g} x fitness - "
+          f"{IMPULSE_SPEC['k_fatigue']:g} x fatigue")
+
+    print("\n📉 NOTRE DAME: DECAYING FATIGUE VS CUMULATIVE HOURS")
+    print("-" * 100)
+    for _, row in nd.iterrows():
+        print(f"Game {row['Game_Number']:2d} | {row['Game_Date']} | {row['Opponent']:20s} | {row['Home_Away']:7s} | "
+              f"cumulative {row['Cumulative_Hours']:5.1f} h | fitness {row['Fitness']:6.1f} | "
+              f"fatigue {row['Fatigue']:5.1f} | form {row['Form']:+6.1f}")
+
+    # Which time constants best explain the rule-based score? (readiness = 100 - fatigue score)
+    grid, first_day = load_grid([timeline])
+    start = time.perf_counter()
+    fits = fit_time_constants(grid, np.zeros(len(timeline.game_days), dtype=int), timeline.game_days - first_day,
+                              100 - fatigue['Overall_Fatigue_Score'].to_numpy())
+    elapsed = time.perf_counter() - start
+    print(f"\n🎯 TIME-CONSTANT GRID FIT ({len(fits)} pairs in {elapsed * 1000:.1f} ms; "
+          f"target: 100 - Overall_Fatigue_Score on game days)")
+    print("-" * 100)
+    for _, row in fits.head(5).iterrows():
+        print(f"  fitness tau {row['Fitness_Tau']:4.0f} d | fatigue tau {row['Fatigue_Tau']:4.0f} d | "
+              f"baseline {row['Baseline']:6.1f} | k_fitness {row['K_Fitness']:+.3f} | "
+              f"k_fatigue {row['K_Fatigue']:+.3f} | RMSE {row['RMSE']:.2f} | R2 {row['R2']:.3f}")
+
+    league = jet_lag.slate_timelines()
+    league_games = game_responses(list(league.values()), list(league))
+    print(f"\n🌐 GENERATED CONFERENCE SLATE ({jet_lag.SLATE_FILE})")
+    print("-" * 100)
+    worst = league_games.groupby('Team')['Form'].agg(['mean', 'min']).sort_values('mean')
+    for team, row in worst.head(6).iterrows():
+        print(f"  {team:16s} mean form {row['mean']:+6.1f} (lowest {row['min']:+6.1f})")
+
+    # League-scale timing: the slate's loads replicated to Division I size over a full grid of taus
+    league_grid, _ = load_grid(list(league.values()))
+    copies = LEAGUE_TEAMS // len(league_grid) + 1
+    big = np.tile(league_grid, (copies, 1))[:LEAGUE_TEAMS]
+    long = np.tile(big, (1, 3))  # Three seasons back to back
+    taus = np.concatenate([FITNESS_TAUS, FATIGUE_TAUS])
+    for loads in (big, long):
+        start = time.perf_counter()
+        impulse_response(loads, taus)
+        elapsed = time.perf_counter() - start
+        method = 'FFT' if loads.shape[1] >= FFT_MIN_DAYS else 'direct'
+        print(f"\n⏱️  {len(loads)} teams x {loads.shape[1]} days x {len(taus)} time constants ({method}) "
+              f"in {elapsed * 1000:.1f} ms")
+
+    print(f"\n✅ Per-game fitness, fatigue and form saved to: {OUTPUT_FILE}")
+    print("=" * 100)
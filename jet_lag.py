@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Direction-aware jet-lag model simulated at daily resolution.
+
+Each team carries a body-clock state: the UTC offset its circadian rhythm is
+entrained to. Every day the clock moves toward the local offset of where the
+team sleeps (season_timeline), by at most JET_LAG_SPEC's advance rate after
+eastward travel (the body must shift earlier, which is slower) and its delay
+rate after westward travel. The recurrence is advanced one day at a time for
+every team at once, so a league of a few hundred teams over a full season is
+a few hundred vectorized steps.
+
+The misalignment on a game day (local offset minus body clock, positive after
+eastward travel) is turned into a jet-lag penalty with separate points per
+hour east and west. Unlike the flat Timezone_Fatigue_Component, a West Coast
+swing still costs points at the next home game if the clock has not yet
+re-entrained.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+import season_timeline
+import travel_engine
+from game_records import iso_date
+from venues import DEFAULT_TIMEZONE, team_venues, timezone_offsets
+
+JET_LAG_SPEC = {
+    'advance_hours_per_day': 0.67,  # Eastward re-entrainment (phase advance), ~1.5 days per zone
+    'delay_hours_per_day': 1.0,     # Westward re-entrainment (phase delay), ~1 day per zone
+    'points_per_hour_east': 6,
+    'points_per_hour_west': 4,
+    'max_points': 20,
+}
+
+SLATE_FILE = 'acc_single_round_robin_2025_2026.csv'
+LEAGUE_TEAMS = 360  # Division I scale for the timing benchmark
+
+
+def offset_grid(timelines):
+    """(teams x days) local UTC offsets on a shared day axis, the first day and each team's home offset"""
+    first_day = min(t.first_day for t in timelines)
+    last_day = max(t.first_day + len(t) - 1 for t in timelines)
+    homes = np.array([timezone_offsets.get(t.venues.values[t.home], DEFAULT_TIMEZONE) for t in timelines],
+                     dtype=float)
+    grid = np.repeat(homes[:, None], last_day - first_day + 1, axis=1)
+    for i, timeline in enumerate(timelines):
+        start = timeline.first_day - first_day
+        grid[i, start:start + len(timeline)] = timeline.data['utc_offset']
+    return grid, first_day, homes
+
+
+def simulate_body_clock(local_offsets, initial=None, spec=JET_LAG_SPEC):
+    """Misalignment (local - body clock, hours) at the start of each day and the body clock after it"""
+    local = np.asarray(local_offsets, dtype=float)
+    clock = local[:, 0].copy() if initial is None else np.asarray(initial, dtype=float).copy()
+    misalignment = np.empty_like(local)
+    body = np.empty_like(local)
+    for day in range(local.shape[1]):
+        gap = local[:, day] - clock
+        misalignment[:, day] = gap
+        clock += np.clip(gap, -spec['delay_hours_per_day'], spec['advance_hours_per_day'])
+        body[:, day] = clock
+    return misalignment, body
+
+
+def jet_lag_penalty(misalignment, spec=JET_LAG_SPEC):
+    """Points for a misalignment: eastward (positive) hours cost more than westward"""
+    misalignment = np.asarray(misalignment, dtype=float)
+    points = np.where(misalignment > 0, spec['points_per_hour_east'] * misalignment,
+                      -spec['points_per_hour_west'] * misalignment)
+    return np.minimum(spec['max_points'], np.round(points)).astype(int)
+
+
+def game_jet_lag(timelines, teams, spec=JET_LAG_SPEC):
+    """One row per game of every team: local offset, body clock, signed jet lag and penalty"""
+    grid, first_day, homes = offset_grid(timelines)
+    misalignment, body = simulate_body_clock(grid, homes, spec)
+    frames = []
+    for i, (team, timeline) in enumerate(zip(teams, timelines)):
+        columns = timeline.game_days - first_day
+        lag = misalignment[i, columns]
+        positions = timeline.game_days - timeline.first_day
+        frames.append(pd.DataFrame({
+            'Team': team,
+            'Game_Date': [iso_date(d) for d in timeline.game_days],
+            'Venue': timeline.venues.decode(timeline.data['venue'][positions]),
+            'UTC_Offset': grid[i, columns].astype(int),
+            'Body_Clock_Offset': (grid[i, columns] - lag).round(2),
+            'Jet_Lag_Hours': lag.round(2),
+            'Jet_Lag_Direction': np.where(lag > 0, 'East', np.where(lag < 0, 'West', '')),
+            'Jet_Lag_Penalty': jet_lag_penalty(lag, spec),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def slate_schedules(slate_file=SLATE_FILE):
+    """{team: games in date order} for every team of a generated conference slate (schedule_generator.py)"""
+    slate = pd.read_csv(slate_file)
+    schedules = {}
+    for team in sorted(set(slate['Home_Team']) | set(slate['Away_Team'])):
+        games = slate[(slate['Home_Team'] == team) | (slate['Away_Team'] == team)].sort_values('Game_Date')
+        schedules[team] = [{'date': row['Game_Date'], 'location': row['Location'],
+                            'opponent': row['Away_Team'] if row['Home_Team'] == team else row['Home_Team'],
+                            'home_away': 'Home' if row['Home_Team'] == team else 'Away'}
+                           for _, row in games.iterrows()]
+    return schedules
+
+
+def slate_timelines(slate_file=SLATE_FILE):
+    """{team: TeamTimeline} for every team of a generated conference slate (schedule_generator.py)"""
+    timelines = {}
+    for team, schedule in slate_schedules(slate_file).items():
+        rows = travel_engine.build_travel_rows(schedule, home_location=team_venues[team])
+        timelines[team] = season_timeline.TeamTimeline.from_travel(pd.DataFrame(rows), team_venues[team])
+    return timelines
+
+
+if __name__ == "__main__":
+    seasons = season_timeline.season_timelines()
+    keys = list(seasons)
+    games = game_jet_lag([seasons[k] for k in keys], [k[1] for k in keys])
+
+    print("=" * 100)
+    print("JET-LAG RECOVERY MODEL")
+    print("=" * 100)
+    print(f"Re-entrainment: {JET_LAG_SPEC['advance_hours_per_day']} h/day eastward, "
+          f"{JET_LAG_SPEC['delay_hours_per_day']} h/day westward | Penalty: "
+          f"{JET_LAG_SPEC['points_per_hour_east']} pts/h east, {JET_LAG_SPEC['points_per_hour_west']} pts/h west "
+          f"(max {JET_LAG_SPEC['max_points']})")
+
+    fatigue_file = 'nd_womens_basketball_2025_2026_with_fatigue_metrics.csv'
+    fatigue = pd.read_csv(fatigue_file)[['Game_Number', 'Game_Date', 'Opponent', 'Timezone_Fatigue_Component']]
+    nd = games[games['Team'] == 'Notre Dame'].merge(fatigue, on='Game_Date')
+    print("\n🕐 NOTRE DAME GAMES WITH A BODY-CLOCK OFFSET OR TIMEZONE POINTS")
+    print("-" * 100)
+    for _, row in nd[(nd['Jet_Lag_Hours'] != 0) | (nd['Timezone_Fatigue_Component'] != 0)].iterrows():
+        print(f"Game {row['Game_Number']:2d} | {row['Game_Date']} | {row['Venue']:20s} | UTC{row['UTC_Offset']:+d} | "
+              f"body UTC{row['Body_Clock_Offset']:+.1f} | lag {row['Jet_Lag_Hours']:+.1f} h {row['Jet_Lag_Direction']:4s} | "
+              f"penalty {row['Jet_Lag_Penalty']:2d} (flat timezone points {row['Timezone_Fatigue_Component']})")
+    print(f"Season total: {nd['Jet_Lag_Penalty'].sum()} jet-lag points vs "
+          f"{nd['Timezone_Fatigue_Component'].sum()} flat timezone points")
+
+    league = slate_timelines()
+    league_games = game_jet_lag(list(league.values()), list(league))
+    print(f"\n🌐 GENERATED CONFERENCE SLATE ({SLATE_FILE})")
+    print("-" * 100)
+    totals = league_games.groupby('Team')['Jet_Lag_Penalty'].agg(['sum', 'max']).sort_values('sum', ascending=False)
+    for team, row in totals.head(6).iterrows():
+        print(f"  {team:16s} {row['sum']:3d} jet-lag points (worst game {row['max']})")
+
+    # League-scale timing: the slate's offset grid replicated to Division I size
+    grid, _, homes = offset_grid(list(league.values()))
+    copies = LEAGUE_TEAMS // len(grid) + 1
+    big_grid, big_homes = np.tile(grid, (copies, 1))[:LEAGUE_TEAMS], np.tile(homes, copies)[:LEAGUE_TEAMS]
+    start = time.perf_counter()
+    simulate_body_clock(big_grid, big_homes)
+    elapsed = time.perf_counter() - start
+    print(f"\n⏱️  {LEAGUE_TEAMS} teams x {big_grid.shape[1]} days simulated in {elapsed * 1000:.1f} ms")
+    print("=" * 100)
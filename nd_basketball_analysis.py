@@ -1,9 +1,11 @@
 import csv
-import pandas as pd
 from datetime import datetime, timedelta
 
+import rollup_cube
+import schedule_loader
+
 # Read the schedule
-df = pd.read_csv('/tmp/nd_womens_basketball_2025_2026.csv')
+df = schedule_loader.load_csv('nd_womens_basketball_2025_2026.csv')
 
 print("=" * 80)
 print("NOTRE DAME WOMEN'S BASKETBALL 2025-2026 SEASON - TRAVEL & FATIGUE ANALYSIS")
@@ -32,21 +34,18 @@ print(f"Maximum Timezones in Single Trip: {df['Timezones_Crossed'].max()}")
 
 # Travel Direction Distribution
 print("\n🧭 TRAVEL DIRECTION DISTRIBUTION")
-direction_counts = df[df['Home_Away'] != 'Home']['Travel_Direction'].value_counts()
+direction_counts = df[df['Home_Away'] != 'Home']['Travel_Direction'].cat.remove_unused_categories().value_counts()
 for direction, count in direction_counts.items():
     print(f"  {direction}: {count} games")
 
 # High Travel Intensity Periods (3+ away games in calendar month)
 print("\n⚠️  HIGH TRAVEL INTENSITY PERIODS")
-df['Game_Date'] = pd.to_datetime(df['Game_Date'])
-df['Month'] = df['Game_Date'].dt.to_period('M')
-
-for month, group in df.groupby('Month'):
-    away_count = (group['Home_Away'] == 'Away').sum()
+# Monthly travel comes from the materialized rollup cube (travel is only recorded on away legs)
+monthly = rollup_cube.rollup(rollup_cube.load_cube(), 'Month', team='Notre Dame', season='2025-2026')
+for month, row in monthly.iterrows():
+    away_count = int(row['Away_Sum'])
     if away_count >= 2:
-        travel_miles = group[group['Home_Away'] == 'Away']['Travel_Distance_Miles'].sum()
-        travel_hours = group[group['Home_Away'] == 'Away']['Travel_Duration_Hours'].sum()
-        print(f"  {month}: {away_count} away games, {travel_miles:.0f} miles, {travel_hours:.1f} hours")
+        print(f"  {month}: {away_count} away games, {row['Miles_Sum']:.0f} miles, {row['Hours_Sum']:.1f} hours")
 
 # Consecutive Game Fatigue Analysis
 print("\n💪 CONSECUTIVE GAME FATIGUE INDICATORS")
@@ -2,6 +2,9 @@ import csv
 from datetime import datetime
 import math
 
+import road_routing
+import travel_modes
+
 # Notre Dame location (South Bend, IN)
 ND_LOCATION = (41.7033, -86.2390)
 ND_TIMEZONE = -6  # Central Time
@@ -80,6 +83,9 @@ timezone_offsets = {
     "Louisville, KY": -6,  # Central
 }
 
+# Road drive times for short-haul venue pairs (empty unless a local road graph is present)
+road_drive_times = road_routing.short_haul_drive_times(city_coords)
+
 def calculate_distance(coord1, coord2):
     """Calculate distance between two coordinates using Haversine formula (returns miles)"""
     lat1, lon1 = coord1
@@ -97,27 +103,24 @@ def calculate_distance(coord1, coord2):
     
     return R * c
 
-def calculate_travel_metrics(origin, destination):
-    """Calculate travel distance and duration between two cities"""
-    if origin not in city_coords or destination not in city_coords:
-        return None, None
-    
-    origin_coords = city_coords[origin]
-    dest_coords = city_coords[destination]
-    
-    # Calculate distance in miles
-    distance = calculate_distance(origin_coords, dest_coords)
-    
-    # Estimate travel time (assuming average speed of 55 mph for driving, 500 mph for flying)
-    # For simplicity, we'll use a rough driving estimate
-    if distance < 500:
-        # Driving estimate
-        travel_time = distance / 55
-    else:
-        # Flying estimate (including airport time, flight, and ground transportation)
-        travel_time = (distance / 500) + 4  # 4 hours for airport/ground transport
-    
-    return distance, travel_time
+def calculate_travel_metrics(legs):
+    """Calculate travel distance, duration and mode for a batch of (origin, destination) legs"""
+    distances = []
+    drive_hours = []
+    for origin, destination in legs:
+        if origin not in city_coords or destination not in city_coords:
+            distances.append(0.0)
+            drive_hours.append(float('nan'))
+            continue
+
+        # Calculate distance in miles
+        distances.append(calculate_distance(city_coords[origin], city_coords[destination]))
+        # Road network drive time for bus legs when a local road graph is present
+        drive_hours.append(road_drive_times.get((origin, destination), (float('nan'),))[0])
+
+    # Pick bus / commercial / charter for every leg at once
+    modes, travel_times, _ = travel_modes.choose_modes(distances, drive_hours)
+    return distances, travel_times, modes
 
 def get_travel_direction(origin, destination):
     """Determine travel direction"""
@@ -144,6 +147,7 @@ def count_timezones_crossed(origin, destination):
 
 # Prepare data for CSV
 csv_data = []
+legs = []
 previous_location = "South Bend, IN"
 game_number = 1
 
@@ -154,15 +158,12 @@ for i, game in enumerate(games):
     location = game["location"]
     home_away = game["home_away"]
     
-    # Calculate travel metrics from previous location
-    distance, travel_time = calculate_travel_metrics(previous_location, location)
+    # Travel from previous location (home games: no travel, we assume travel from South Bend)
+    legs.append((previous_location, location) if home_away != "Home" else (location, location))
     travel_direction = get_travel_direction(previous_location, location)
     timezones = count_timezones_crossed(previous_location, location)
     
-    # For home games, we assume travel from South Bend
     if home_away == "Home":
-        distance = 0
-        travel_time = 0
         travel_direction = "Home"
         timezones = 0
     
@@ -173,15 +174,23 @@ for i, game in enumerate(games):
         "Game_Date": game_date,
         "Location": location,
         "Home_Away": home_away,
-        "Travel_Distance_Miles": round(distance, 1) if distance else 0,
-        "Travel_Duration_Hours": round(travel_time, 2) if travel_time else 0,
+        "Travel_Distance_Miles": 0,
+        "Travel_Duration_Hours": 0,
         "Timezones_Crossed": timezones,
         "Travel_Direction": travel_direction,
+        "Travel_Mode": travel_modes.NO_TRAVEL_MODE,
     })
     
     previous_location = location if home_away != "Home" else previous_location
     game_number += 1
 
+# Distance, duration and mode for all legs in one vectorized pass
+distances, travel_times, modes = calculate_travel_metrics(legs)
+for row, distance, travel_time, mode in zip(csv_data, distances, travel_times, modes):
+    row["Travel_Distance_Miles"] = round(distance, 1) if distance else 0
+    row["Travel_Duration_Hours"] = round(float(travel_time), 2) if travel_time else 0
+    row["Travel_Mode"] = str(mode)
+
 # Calculate travel frequency/density
 total_games = len(csv_data)
 away_games = sum(1 for g in csv_data if g["Home_Away"] == "Away")
@@ -201,6 +210,7 @@ with open(output_file, 'w', newline='') as f:
         "Travel_Duration_Hours",
         "Timezones_Crossed",
         "Travel_Direction",
+        "Travel_Mode",
     ]
     writer = csv.DictWriter(f, fieldnames=fieldnames)
     writer.writeheader()
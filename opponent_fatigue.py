@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Opponent-side fatigue and the fatigue differential of every game.
+
+Every team schedule available is loaded into one league travel table:
+
+  - season travel files and dataset partitions (season_timeline.travel_sources)
+  - ingested schedules (schedule_ingest.py output in OUTPUT_DIR, named as
+    schedule_ingest.ingested_team reads them), priced with
+    travel_engine.build_travel_rows from the team's home venue
+
+The whole table is scored by one schedule_diff.fatigue_table call, which
+scores each team-season once, and a single self-merge attaches to every row
+the opponent's row for the same game (same date, teams swapped):
+Opponent_Fatigue_Score, Opponent_Fatigue_Level, the opponent's leg miles and
+rest, and Fatigue_Differential = own score - opponent score (positive: we are
+the more tired team). Names are matched by season_dataset.slugify, so 'NC
+State' and 'NC state' meet. Games whose opponent has no schedule loaded keep
+blank opponent columns.
+
+The report also scores the generated conference slate
+(schedule_generator.py), where every opponent's schedule is known.
+
+Usage:
+    python3 opponent_fatigue.py
+"""
+
+import glob
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import jet_lag
+import schedule_diff
+import schedule_ingest
+import season_dataset
+import season_timeline
+import travel_engine
+from venues import HOME_LOCATION, team_venues
+
+OPPONENT_COLUMNS = {
+    'Overall_Fatigue_Score': 'Opponent_Fatigue_Score',
+    'Fatigue_Level': 'Opponent_Fatigue_Level',
+    'Travel_Distance_Miles': 'Opponent_Travel_Miles',
+    'Days_Rest_Since_Last': 'Opponent_Days_Rest',
+}
+SLATE_SEASON = '2025-2026'
+OUTPUT_FILE = 'acc_opponent_fatigue_2025_2026.csv'
+
+
+def travel_table(games, team, season, sport=travel_engine.SPORT):
+    """Travel rows for one team's games (dicts with date / opponent / location / home_away)"""
+    games = sorted(games, key=lambda game: game['date'])
+    rows = travel_engine.build_travel_rows(games, home_location=team_venues.get(team, HOME_LOCATION), sport=sport)
+    return pd.DataFrame(rows, columns=travel_engine.TRAVEL_FIELDS).assign(Team=team, Season=season)
+
+
+def league_travel(directory='.', root=season_dataset.DATASET_ROOT, ingested_dir=schedule_ingest.OUTPUT_DIR):
+    """One travel table (with Team and Season columns) for every schedule available; season files take precedence"""
+    frames = {}
+    for (sport, team, season), path in season_timeline.travel_sources(directory, root).items():
+        frames[(sport, team, season)] = season_timeline.read_travel(path).assign(Team=team, Season=season)
+    for path in sorted(glob.glob(os.path.join(ingested_dir, '*.csv'))):
+        team_season = schedule_ingest.ingested_team(path)
+        if team_season is None or (travel_engine.SPORT, *team_season) in frames:
+            continue
+        games = pd.read_csv(path, keep_default_na=False).to_dict('records')
+        frames[(travel_engine.SPORT, *team_season)] = travel_table(games, *team_season)
+    return pd.concat(frames.values(), ignore_index=True) if frames else pd.DataFrame(columns=travel_engine.TRAVEL_FIELDS)
+
+
+def opponent_fatigue(travel):
+    """Every travel row with its own fatigue, the opponent's fatigue going into the same game and the differential"""
+    travel = travel.reset_index(drop=True)
+    scored = pd.concat([travel, schedule_diff.fatigue_table(travel)[
+        ['Days_Rest_Since_Last', 'Overall_Fatigue_Score', 'Fatigue_Level']]], axis=1)
+    scored['Game_Date'] = scored['Game_Date'].astype(str).str[:10]
+    scored['_Team'] = scored['Team'].map(season_dataset.slugify)
+    scored['_Opponent'] = scored['Opponent'].map(season_dataset.slugify)
+
+    # Each team's row for a game is scored once and read by its opponent through one merge
+    keys = ['Sport', 'Season', 'Game_Date']
+    mirror = scored[keys + ['_Team', '_Opponent', *OPPONENT_COLUMNS]].rename(
+        columns={'_Team': '_Opponent', '_Opponent': '_Team', **OPPONENT_COLUMNS})
+    mirror = mirror.drop_duplicates(keys + ['_Team', '_Opponent'])
+    joined = scored.merge(mirror, on=keys + ['_Team', '_Opponent'], how='left', sort=False)
+    joined['Fatigue_Differential'] = joined['Overall_Fatigue_Score'] - joined['Opponent_Fatigue_Score']
+    return joined.drop(columns=['_Team', '_Opponent'])
+
+
+def slate_travel(slate_file=jet_lag.SLATE_FILE, season=SLATE_SEASON):
+    """League travel table for the generated conference slate"""
+    return pd.concat([travel_table(games, team, season) for team, games in jet_lag.slate_schedules(slate_file).items()],
+                     ignore_index=True)
+
+
+def per_matchup(travel):
+    """Opponent scores recomputed for every matchup (the approach the batch join replaces), for timing"""
+    scores = []
+    for _, row in travel.iterrows():
+        opponent = travel[(travel['Team'] == row['Opponent']) & (travel['Season'] == row['Season'])]
+        if opponent.empty:
+            scores.append(np.nan)
+            continue
+        fatigue = schedule_diff.fatigue_table(opponent.drop(columns=['Team', 'Season']))
+        same_day = (opponent['Game_Date'] == row['Game_Date']).to_numpy()
+        scores.append(fatigue['Overall_Fatigue_Score'].to_numpy()[same_day][0] if same_day.any() else np.nan)
+    return np.array(scores, dtype=float)
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    actual = opponent_fatigue(league_travel())
+    actual_time = time.perf_counter() - start
+
+    travel = slate_travel()
+    start = time.perf_counter()
+    slate = opponent_fatigue(travel)
+    slate_time = time.perf_counter() - start
+    columns = ['Team', 'Season', 'Game_Date', 'Opponent', 'Location', 'Home_Away', 'Travel_Distance_Miles',
+               'Days_Rest_Since_Last', 'Overall_Fatigue_Score', 'Fatigue_Level', *OPPONENT_COLUMNS.values(),
+               'Fatigue_Differential']
+    slate[columns].to_csv(OUTPUT_FILE, index=False)
+
+    print("=" * 100)
+    print("OPPONENT FATIGUE DIFFERENTIAL")
+    print("=" * 100)
+
+    print(f"\n🏀 LOADED SCHEDULES: {actual.groupby(['Team', 'Season']).ngroups} team-season(s), {len(actual)} games "
+          f"in {actual_time * 1000:.1f} ms")
+    print("-" * 100)
+    for (team, season), games in actual.groupby(['Team', 'Season'], sort=True):
+        matched = games['Opponent_Fatigue_Score'].notna()
+        print(f"  {team} {season}: opponent schedule loaded for {matched.sum()} of {len(games)} games")
+        for _, row in games[matched].iterrows():
+            print(f"    {row['Game_Date']} vs {row['Opponent']:20s} own {row['Overall_Fatigue_Score']:3.0f} | "
+                  f"opponent {row['Opponent_Fatigue_Score']:3.0f} | differential {row['Fatigue_Differential']:+4.0f}")
+        if not matched.all():
+            print(f"    Ingest opponent schedules (schedule_ingest.py) to score the other "
+                  f"{(~matched).sum()} game(s)")
+
+    print(f"\n🌐 GENERATED CONFERENCE SLATE ({jet_lag.SLATE_FILE}): {slate['Team'].nunique()} teams, "
+          f"{len(slate)} team-games in {slate_time * 1000:.1f} ms")
+    print("-" * 100)
+    table = slate.groupby('Team').agg(Own=('Overall_Fatigue_Score', 'mean'),
+                                      Opponent=('Opponent_Fatigue_Score', 'mean'),
+                                      Differential=('Fatigue_Differential', 'mean'),
+                                      Fresher=('Fatigue_Differential', lambda d: int((d < 0).sum())),
+                                      Games=('Fatigue_Differential', 'size'))
+    for team, row in table.sort_values('Differential').iterrows():
+        print(f"  {team:16s} own {row['Own']:5.1f} | opponents {row['Opponent']:5.1f} | "
+              f"differential {row['Differential']:+5.1f} | fresher in {row['Fresher']:2.0f} of {row['Games']:.0f} games")
+
+    print("\n⚖️  MOST LOPSIDED SLATE GAMES (home team's view)")
+    print("-" * 100)
+    home = slate[slate['Home_Away'] == 'Home']
+    for _, row in home.reindex(home['Fatigue_Differential'].abs().sort_values(ascending=False).index).head(8).iterrows():
+        print(f"  {row['Game_Date']} {row['Team']:16s} vs {row['Opponent']:16s} own {row['Overall_Fatigue_Score']:3.0f} "
+              f"({row['Fatigue_Level']}) | visitor {row['Opponent_Fatigue_Score']:3.0f} ({row['Opponent_Fatigue_Level']}, "
+              f"{row['Opponent_Travel_Miles']:,.0f} mi, {row['Opponent_Days_Rest']:.0f} days rest) | "
+              f"{row['Fatigue_Differential']:+.0f}")
+
+    start = time.perf_counter()
+    naive = per_matchup(travel)
+    naive_time = time.perf_counter() - start
+    assert np.allclose(naive, slate['Opponent_Fatigue_Score'].to_numpy(dtype=float), equal_nan=True)
+    print(f"\n⏱️  One league batch: {slate_time * 1000:.1f} ms | rescoring the opponent per matchup: "
+          f"{naive_time * 1000:.1f} ms (same scores)")
+    print(f"\n✅ Slate differentials saved to: {OUTPUT_FILE}")
+    print("=" * 100)
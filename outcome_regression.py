@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Game outcomes regressed on fatigue components, per team and pooled, with bootstrap confidence intervals.
+
+Box-score / outcome files are read from the CSVs in OUTCOME_DIR (any names,
+extra box-score columns are ignored), one row per team per game:
+
+    Team,Season,Game_Date,Opponent,Points_For,Points_Against
+    Notre Dame,2025-2026,2025-11-05,Lehigh,88,51
+
+Team defaults to DEFAULT_TEAM and Season to the season the date falls in.
+Rows are joined to the fatigue components of the team's schedule (every
+schedule opponent_fatigue.league_travel loads, scored by one
+schedule_diff.fatigue_table call) on team, season and date.
+
+Point margin is fitted against an intercept and the four COMPONENTS by
+ordinary least squares for every team (all its seasons) and for all teams
+pooled. The fits run as batched linear algebra: each team's games are one
+row of a padded (teams x games x terms) design, every bootstrap resample is
+a row of multinomial game weights, and the weighted normal equations of all
+teams x resamples come from two batched matrix products and one batched
+solve. Resamples are processed in chunks of at most
+MAX_BATCH_ELEMENTS weights. A component that never varies for a team has no
+estimate (blank).
+
+Without an OUTCOME_DIR the report fits clearly labelled synthetic outcomes
+(known TRUE_EFFECTS plus noise) on the real schedules and the generated
+conference slate, so the recovered coefficients can be checked.
+
+Usage:
+    python3 outcome_regression.py                  # game_outcomes/*.csv, or synthetic outcomes
+    python3 outcome_regression.py --scale 360      # league timing: 360 teams x 10 seasons
+    python3 outcome_regression.py --bootstrap 2000
+"""
+
+import argparse
+import glob
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import opponent_fatigue
+import schedule_diff
+import season_dataset
+
+OUTCOME_DIR = 'game_outcomes'
+DEFAULT_TEAM = 'Notre Dame'
+OUTCOME_COLUMNS = ['Team', 'Season', 'Game_Date', 'Opponent', 'Points_For', 'Points_Against']
+COMPONENTS = ['Travel_Fatigue_Component', 'Timezone_Fatigue_Component', 'Rest_Fatigue_Component',
+              'Consecutive_Game_Fatigue']
+TERMS = ['Intercept', *COMPONENTS]
+
+N_BOOTSTRAP = 1000
+CONFIDENCE = 0.95
+MAX_BATCH_ELEMENTS = 4_000_000  # Bootstrap weights held at once (groups x resamples x games)
+RIDGE = 1e-10                   # Relative to the trace of each weighted Gram matrix
+POOLED = 'All teams'
+SEED = 2025
+
+# Synthetic outcomes: points of margin per fatigue point, plus per-team strength and game noise
+TRUE_EFFECTS = {
+    'Travel_Fatigue_Component': -0.15,
+    'Timezone_Fatigue_Component': -0.30,
+    'Rest_Fatigue_Component': -0.25,
+    'Consecutive_Game_Fatigue': -0.10,
+}
+TEAM_STRENGTH_SD = 8.0
+MARGIN_NOISE_SD = 12.0
+SCALE_SEASONS = 10
+OUTPUT_FILE = 'fatigue_outcome_coefficients.csv'
+
+
+def read_outcomes(directory=OUTCOME_DIR):
+    """All outcome CSVs in the directory as one table in OUTCOME_COLUMNS order, with Point_Margin"""
+    paths = sorted(glob.glob(os.path.join(directory, '*.csv')))
+    if not paths:
+        return pd.DataFrame(columns=OUTCOME_COLUMNS + ['Point_Margin'])
+    df = pd.concat([pd.read_csv(path, dtype={'Team': str, 'Season': str, 'Opponent': str}) for path in paths],
+                   ignore_index=True)
+    days = pd.to_datetime(df['Game_Date'], format='ISO8601').to_numpy('datetime64[D]')
+    df['Game_Date'] = days.astype(str)
+    df['Team'] = df['Team'].fillna(DEFAULT_TEAM) if 'Team' in df else DEFAULT_TEAM
+    seasons = season_dataset.season_of(days.astype('int64'))
+    df['Season'] = df['Season'].fillna(pd.Series(seasons)) if 'Season' in df else seasons
+    df['Point_Margin'] = pd.to_numeric(df['Points_For']) - pd.to_numeric(df['Points_Against'])
+    return df[OUTCOME_COLUMNS + ['Point_Margin']]
+
+
+def fatigue_components(travel):
+    """Team, season, date, opponent and the fatigue components of every game of a league travel table"""
+    travel = travel.reset_index(drop=True)
+    scored = schedule_diff.fatigue_table(travel)
+    return pd.concat([travel[['Team', 'Season', 'Opponent']],
+                      travel['Game_Date'].astype(str).str[:10], scored[COMPONENTS]], axis=1)
+
+
+def join_outcomes(outcomes, components):
+    """Outcome rows with their game's fatigue components (unmatched outcome rows are dropped)"""
+    keys = ['_Team', 'Season', 'Game_Date']
+    outcomes = outcomes.assign(_Team=outcomes['Team'].map(season_dataset.slugify))
+    components = components.assign(_Team=components['Team'].map(season_dataset.slugify))
+    return outcomes.merge(components[keys + COMPONENTS], on=keys, how='inner').drop(columns='_Team')
+
+
+def design_batch(df, group_column):
+    """(groups x games x terms) design, (groups x games) margins and games per group, padded with zero rows"""
+    codes, groups = pd.factorize(df[group_column], sort=True)
+    order = np.argsort(codes, kind='stable')
+    counts = np.bincount(codes, minlength=len(groups))
+    position = np.arange(len(df)) - np.repeat(np.cumsum(counts) - counts, counts)
+    design = np.zeros((len(groups), counts.max(), len(TERMS)))
+    margins = np.zeros((len(groups), counts.max()))
+    design[codes[order], position, 0] = 1.0
+    design[codes[order], position, 1:] = df[COMPONENTS].to_numpy(dtype=float)[order]
+    margins[codes[order], position] = df['Point_Margin'].to_numpy(dtype=float)[order]
+    return list(groups), design, margins, counts
+
+
+def weighted_fits(design, margins, weights):
+    """Coefficients (groups x samples x terms) for (groups x samples x games) game weights"""
+    n_groups, n_games, n_terms = design.shape
+    outer = (design[:, :, :, None] * design[:, :, None, :]).reshape(n_groups, n_games, n_terms * n_terms)
+    gram = (weights @ outer).reshape(*weights.shape[:2], n_terms, n_terms)
+    moment = weights @ (design * margins[..., None])
+    # A vanishing ridge keeps degenerate resamples solvable (its limit is the pseudo-inverse solution)
+    ridge = RIDGE * np.maximum(np.trace(gram, axis1=-2, axis2=-1), 1.0)[..., None, None] * np.eye(n_terms)
+    return np.linalg.solve(gram + ridge, moment[..., None])[..., 0]
+
+
+def bootstrap_weights(rng, counts, n_samples, n_games):
+    """(groups x samples x games) multinomial resample counts: each group's games drawn with replacement"""
+    draws = (rng.random((len(counts), n_samples, n_games)) * counts[:, None, None]).astype(np.int64)
+    draws = np.where(np.arange(n_games) < counts[:, None, None], draws, n_games)  # Padding draws land in a dropped slot
+    rows = np.arange(len(counts) * n_samples).reshape(len(counts), n_samples, 1)
+    weights = np.bincount((rows * (n_games + 1) + draws).ravel(), minlength=len(counts) * n_samples * (n_games + 1))
+    return weights.reshape(len(counts), n_samples, n_games + 1)[..., :n_games].astype(float)
+
+
+def fit_groups(df, group_column, n_boot=N_BOOTSTRAP, confidence=CONFIDENCE, seed=SEED):
+    """Point estimates, bootstrap intervals and R^2 of the margin model for every group, one row per term"""
+    groups, design, margins, counts = design_batch(df, group_column)
+    n_games = design.shape[1]
+    real = (np.arange(n_games) < counts[:, None]).astype(float)
+    estimates = weighted_fits(design, margins, real[:, None, :])[:, 0]
+
+    rng = np.random.default_rng(seed)
+    chunk = max(1, MAX_BATCH_ELEMENTS // (len(groups) * n_games))
+    samples = []
+    for start in range(0, n_boot, chunk):
+        size = min(chunk, n_boot - start)
+        samples.append(weighted_fits(design, margins, bootstrap_weights(rng, counts, size, n_games)))
+    samples = np.concatenate(samples, axis=1) if samples else np.empty((len(groups), 0, len(TERMS)))
+    tail = 100 * (1 - confidence) / 2
+    low, high = np.percentile(samples, [tail, 100 - tail], axis=1) if n_boot else (np.nan, np.nan)
+
+    # Components that never vary within a group (and the intercept when one does) have no estimate
+    spread = np.where(real[..., None] > 0, design, np.nan)
+    varies = np.nanmax(spread, axis=1) > np.nanmin(spread, axis=1)
+    varies[:, 0] = True
+    fitted = np.einsum('ngt,nt->ng', design, estimates)
+    residual = ((margins - fitted) ** 2 * real).sum(axis=1)
+    mean = (margins * real).sum(axis=1) / counts
+    total = (((margins - mean[:, None]) ** 2) * real).sum(axis=1)
+
+    return pd.DataFrame({
+        group_column: np.repeat(groups, len(TERMS)),
+        'Term': np.tile(TERMS, len(groups)),
+        'Games': np.repeat(counts, len(TERMS)),
+        'Coefficient': np.where(varies, estimates, np.nan).ravel().round(4),
+        'CI_Low': np.where(varies, low, np.nan).ravel().round(4),
+        'CI_High': np.where(varies, high, np.nan).ravel().round(4),
+        'R2': np.repeat(np.where(total > 0, 1 - residual / np.where(total > 0, total, 1), np.nan), len(TERMS)).round(4),
+    })
+
+
+def fit_models(df, n_boot=N_BOOTSTRAP, confidence=CONFIDENCE, seed=SEED):
+    """Per-team and pooled coefficient tables (Team = POOLED for the pooled model)"""
+    per_team = fit_groups(df, 'Team', n_boot, confidence, seed)
+    pooled = fit_groups(df.assign(Team=POOLED), 'Team', n_boot, confidence, seed + 1)
+    return pd.concat([pooled, per_team], ignore_index=True)
+
+
+def synthetic_outcomes(components, seed=SEED):
+    """Outcome rows with margins drawn from TRUE_EFFECTS, a strength per team and game noise"""
+    rng = np.random.default_rng(seed)
+    teams, codes = np.unique(components['Team'], return_inverse=True)
+    strength = rng.normal(0.0, TEAM_STRENGTH_SD, len(teams))
+    effect = components[list(TRUE_EFFECTS)].to_numpy(dtype=float) @ np.array(list(TRUE_EFFECTS.values()))
+    margin = np.round(strength[codes] + effect + rng.normal(0.0, MARGIN_NOISE_SD, len(components)))
+    points_against = rng.integers(50, 80, len(components))
+    return components.assign(Points_For=points_against + margin, Points_Against=points_against,
+                             Point_Margin=margin)
+
+
+def league_components(components, teams, seasons=SCALE_SEASONS, seed=SEED):
+    """`teams` synthetic teams x `seasons` seasons, each season resampled from the real team-seasons (timing)"""
+    rng = np.random.default_rng(seed)
+    keys = components.groupby(['Team', 'Season']).indices
+    blocks = list(keys.values())
+    frames = []
+    for t in range(teams):
+        for s in rng.integers(len(blocks), size=seasons):
+            frames.append(components.iloc[blocks[s]].assign(Team=f"Team {t + 1:03d}"))
+    league = pd.concat(frames, ignore_index=True)
+    return league.assign(Season=np.repeat(np.arange(len(frames)) % seasons, [len(f) for f in frames]).astype(str))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Point margin vs fatigue components with bootstrap intervals")
+    parser.add_argument('--outcomes', default=OUTCOME_DIR, help="directory of outcome / box-score CSVs")
+    parser.add_argument('--bootstrap', type=int, default=N_BOOTSTRAP, help="bootstrap resamples")
+    parser.add_argument('--scale', type=int, default=0, help=f"also time N synthetic teams x {SCALE_SEASONS} seasons")
+    args = parser.parse_args()
+
+    outcomes = read_outcomes(args.outcomes)
+    synthetic = outcomes.empty
+    if synthetic:
+        slate = fatigue_components(opponent_fatigue.slate_travel())
+        components = pd.concat([fatigue_components(opponent_fatigue.league_travel()),
+                                slate.assign(Season='slate ' + slate['Season'])], ignore_index=True)
+        joined = synthetic_outcomes(components)
+    else:
+        joined = join_outcomes(outcomes, fatigue_components(opponent_fatigue.league_travel()))
+
+    start = time.perf_counter()
+    coefficients = fit_models(joined, args.bootstrap)
+    elapsed = time.perf_counter() - start
+    coefficients.to_csv(OUTPUT_FILE, index=False)
+
+    print("=" * 100)
+    print("GAME OUTCOMES VS FATIGUE COMPONENTS")
+    print("=" * 100)
+    source = ("SYNTHETIC outcomes (known effects) on the real schedules and generated slate" if synthetic
+              else f"{args.outcomes} ({len(outcomes)} rows, {len(joined)} matched to schedules)")
+    print(f"Outcomes: {source} | {joined['Team'].nunique()} team(s) | {len(joined)} games")
+    print(f"Point margin ~ intercept + {' + '.join(COMPONENTS)} | {args.bootstrap:,} bootstrap resamples | "
+          f"{100 * CONFIDENCE:.0f}% intervals | fitted in {elapsed * 1000:.1f} ms")
+
+    print(f"\n📈 POOLED MODEL (R2 {coefficients.loc[coefficients['Team'] == POOLED, 'R2'].iloc[0]:.3f})")
+    print("-" * 100)
+    for _, row in coefficients[coefficients['Team'] == POOLED].iterrows():
+        truth = f" | true {TRUE_EFFECTS[row['Term']]:+.3f}" if synthetic and row['Term'] in TRUE_EFFECTS else ""
+        unit = "points" if row['Term'] == 'Intercept' else "points per fatigue point"
+        print(f"  {row['Term']:28s} {row['Coefficient']:+8.3f} [{row['CI_Low']:+8.3f}, {row['CI_High']:+8.3f}] "
+              f"{unit}{truth}")
+
+    print("\n🏀 PER-TEAM FATIGUE EFFECTS (points of margin per fatigue point)")
+    print("-" * 100)
+    wide = coefficients[coefficients['Team'] != POOLED].pivot(index='Team', columns='Term', values='Coefficient')
+    games = coefficients[coefficients['Team'] != POOLED].groupby('Team')['Games'].first()
+    for team, row in wide.iterrows():
+        print(f"  {team:16s} {games[team]:3d} games | "
+              + " | ".join(f"{term.split('_')[0].lower()} {row[term]:+6.2f}" if pd.notna(row[term])
+                           else f"{term.split('_')[0].lower()}    n/a" for term in COMPONENTS))
+
+    if args.scale:
+        league = synthetic_outcomes(league_components(joined[['Team', 'Season', 'Opponent', 'Game_Date', *COMPONENTS]],
+                                                      args.scale))
+        start = time.perf_counter()
+        fits = fit_models(league, args.bootstrap)
+        elapsed = time.perf_counter() - start
+        pooled = fits[fits['Team'] == POOLED].set_index('Term')
+        covered = np.mean([pooled.loc[term, 'CI_Low'] <= effect <= pooled.loc[term, 'CI_High']
+                           for term, effect in TRUE_EFFECTS.items()])
+        print(f"\n⏱️  {args.scale} teams x {SCALE_SEASONS} seasons ({len(league):,} games): per-team + pooled fits with "
+              f"{args.bootstrap:,} resamples each in {elapsed:.2f}s | pooled intervals cover "
+              f"{100 * covered:.0f}% of the true effects")
+
+    print(f"\n✅ Coefficients saved to: {OUTPUT_FILE}")
+    print("=" * 100)
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Player-level workload tracking with rolling acute:chronic workload ratios.
+
+Per-player loads are read from the CSVs in LOAD_DIR (one or more files, any
+names), one row per player per day:
+
+    Team,Season,Player,Date,Minutes,Practice_Load
+    Notre Dame,2025-2026,Player A,2025-11-03,34,
+    Notre Dame,2025-2026,Player A,2025-11-05,,420
+
+Minutes are game minutes (converted to load units at GAME_LOAD_PER_MINUTE,
+session-RPE style); Practice_Load is already in load units. Team defaults to
+DEFAULT_TEAM and Season to the season the date falls in. Blank cells are zero.
+
+Each player-day is joined to the team's travel table and daily timeline
+(season_timeline): game days get the opponent and home/away, and travel hours
+that day add TRAVEL_LOAD_PER_HOUR load units for every rostered player. The
+season is laid out as one (players x days) matrix and the exponentially
+weighted acute (ACUTE_DAYS) and chronic (CHRONIC_DAYS) loads are advanced one
+day at a time for every player at once.
+
+Without a LOAD_DIR the report runs on a synthetic roster built from the
+team's real schedule, clearly labelled as such.
+
+Usage:
+    python3 player_workload.py                 # player_loads/*.csv, or a synthetic roster
+    python3 player_workload.py --scale 360     # league timing: 360 synthetic rosters x 3 seasons
+"""
+
+import argparse
+import glob
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import season_dataset
+import season_timeline
+from game_records import iso_date
+from venues import HOME_LOCATION, team_venues
+
+LOAD_DIR = 'player_loads'
+DEFAULT_TEAM = 'Notre Dame'
+SPORT = 'womens_basketball'
+LOAD_COLUMNS = ['Team', 'Season', 'Player', 'Date', 'Minutes', 'Practice_Load']
+
+GAME_LOAD_PER_MINUTE = 7.0   # Load units per game minute (minutes x a typical game RPE)
+TRAVEL_LOAD_PER_HOUR = 25.0  # Load units per hour spent traveling
+ACUTE_DAYS = 7
+CHRONIC_DAYS = 28
+ACWR_HIGH = 1.5              # "Danger zone" above this ratio
+ACWR_LOW = 0.8               # Undertrained below this ratio
+
+ROSTER_SIZE = 13
+PRESEASON_DAYS = 42          # Synthetic rosters start practicing six weeks before the first game
+SEED = 2025
+
+
+def read_loads(directory=LOAD_DIR):
+    """All player load CSVs in the directory as one table in LOAD_COLUMNS order, with a Day number"""
+    paths = sorted(glob.glob(os.path.join(directory, '*.csv')))
+    if not paths:
+        return pd.DataFrame(columns=LOAD_COLUMNS + ['Day'])
+    df = pd.concat([pd.read_csv(path, dtype={'Team': str, 'Season': str, 'Player': str}) for path in paths],
+                   ignore_index=True)
+    df['Day'] = pd.to_datetime(df['Date'], format='ISO8601').to_numpy('datetime64[D]').astype('int64')
+    df['Team'] = df['Team'].fillna(DEFAULT_TEAM) if 'Team' in df else DEFAULT_TEAM
+    seasons = season_dataset.season_of(df['Day'])
+    df['Season'] = df['Season'].fillna(pd.Series(seasons)) if 'Season' in df else seasons
+    for column in ['Minutes', 'Practice_Load']:
+        df[column] = pd.to_numeric(df[column], errors='coerce').fillna(0.0) if column in df else 0.0
+    df['Date'] = [iso_date(d) for d in df['Day']]
+    return df[LOAD_COLUMNS + ['Day']]
+
+
+def ewma(matrix, span):
+    """Exponentially weighted moving average along the day axis (alpha = 2 / (span + 1)), seeded with day 0"""
+    alpha = 2.0 / (span + 1)
+    out = np.empty_like(matrix)
+    out[:, 0] = matrix[:, 0]
+    for day in range(1, matrix.shape[1]):
+        out[:, day] = alpha * matrix[:, day] + (1 - alpha) * out[:, day - 1]
+    return out
+
+
+def team_travel_sources(sport=SPORT):
+    """{(team, season): (travel table, TeamTimeline)} for every team-season with a travel file"""
+    sources = {}
+    for (file_sport, team, season), path in season_timeline.travel_sources().items():
+        if season_dataset.sport_key(file_sport) != season_dataset.sport_key(sport):
+            continue
+        travel = season_timeline.read_travel(path)
+        timeline = season_timeline.TeamTimeline.from_travel(travel, team_venues.get(team, HOME_LOCATION))
+        sources[(team, season)] = (travel, timeline)
+    return sources
+
+
+def workload_matrices(loads, travel=None):
+    """Per season: players, first day and (players x days) load, travel, acute, chronic and ACWR matrices"""
+    travel = travel or {}
+    seasons = {}
+    for season, group in loads.groupby('Season', sort=True):
+        players = group[['Team', 'Player']].drop_duplicates().sort_values(['Team', 'Player'])
+        player_codes = pd.MultiIndex.from_frame(players).get_indexer(pd.MultiIndex.from_frame(group[['Team', 'Player']]))
+        timelines = {team: travel[(team, season)][1] for team in players['Team'].unique() if (team, season) in travel}
+
+        first_day = min([group['Day'].min()] + [t.first_day for t in timelines.values()])
+        last_day = max([group['Day'].max()] + [t.first_day + len(t) - 1 for t in timelines.values()])
+        n_days = last_day - first_day + 1
+
+        load = np.zeros((len(players), n_days))
+        daily = group['Minutes'].to_numpy(float) * GAME_LOAD_PER_MINUTE + group['Practice_Load'].to_numpy(float)
+        np.add.at(load, (player_codes, group['Day'].to_numpy() - first_day), daily)
+
+        # Team travel hours per day, broadcast to every rostered player of that team
+        teams = list(players['Team'].unique())
+        team_hours = np.zeros((len(teams), n_days))
+        for i, team in enumerate(teams):
+            if team in timelines:
+                start = timelines[team].first_day - first_day
+                team_hours[i, start:start + len(timelines[team])] = timelines[team].data['travel_hours']
+        player_team = pd.Index(teams).get_indexer(players['Team'])
+        travel_load = team_hours[player_team] * TRAVEL_LOAD_PER_HOUR
+
+        adjusted = load + travel_load
+        acute, chronic = ewma(adjusted, ACUTE_DAYS), ewma(adjusted, CHRONIC_DAYS)
+        acwr = np.divide(acute, chronic, out=np.zeros_like(acute), where=chronic > 0)
+        seasons[season] = {
+            'players': players.reset_index(drop=True),
+            'first_day': first_day,
+            'load': load,
+            'travel_load': travel_load,
+            'acute': acute,
+            'chronic': chronic,
+            'acwr': acwr,
+        }
+    return seasons
+
+
+def workload_table(matrices, travel=None):
+    """Long table: one row per player per day, joined to the team's game on game days"""
+    travel = travel or {}
+    frames = []
+    for season, m in matrices.items():
+        n_players, n_days = m['load'].shape
+        players = m['players']
+        days = m['first_day'] + np.arange(n_days)
+        frame = pd.DataFrame({
+            'Team': np.repeat(players['Team'].to_numpy(), n_days),
+            'Season': season,
+            'Player': np.repeat(players['Player'].to_numpy(), n_days),
+            'Day': np.tile(days, n_players),
+            'Load': m['load'].ravel().round(1),
+            'Travel_Load': m['travel_load'].ravel().round(1),
+            'Adjusted_Load': (m['load'] + m['travel_load']).ravel().round(1),
+            'Acute_Load': m['acute'].ravel().round(1),
+            'Chronic_Load': m['chronic'].ravel().round(1),
+            'ACWR': m['acwr'].ravel().round(2),
+        })
+        games = [pd.DataFrame({'Team': team, 'Day': timeline.game_days, 'Opponent': table['Opponent'].to_numpy(),
+                               'Home_Away': table['Home_Away'].to_numpy()})
+                 for (team, team_season), (table, timeline) in travel.items() if team_season == season]
+        if games:
+            frame = frame.merge(pd.concat(games, ignore_index=True), on=['Team', 'Day'], how='left')
+        else:
+            frame['Opponent'], frame['Home_Away'] = np.nan, np.nan
+        frames.append(frame)
+    df = pd.concat(frames, ignore_index=True)
+    df.insert(3, 'Date', [iso_date(d) for d in df['Day']])
+    return df.drop(columns='Day')
+
+
+def synthetic_loads(team, season, timeline, roster_size=ROSTER_SIZE, seed=SEED):
+    """Load CSV rows for a made-up roster following the team's real game and travel days"""
+    rng = np.random.default_rng(seed)
+    first_day = timeline.first_day - PRESEASON_DAYS
+    days = np.arange(first_day, timeline.first_day + len(timeline))
+    position = days - timeline.first_day
+    in_season = position >= 0
+    game = np.full(len(days), season_timeline.NO_GAME)
+    game[in_season] = timeline.data['game'][position[in_season]]
+    traveling = np.zeros(len(days), dtype=bool)
+    traveling[in_season] = timeline.data['traveling'][position[in_season]]
+    game_day = game != season_timeline.NO_GAME
+    day_after = np.concatenate([[False], game_day[:-1]])
+    weekday = (days + 3) % 7  # 1970-01-01 was a Thursday; 0 = Monday
+    practice_day = ~game_day & ~traveling & ~day_after & (weekday != 0)
+
+    # Minutes: 200 per game split by rotation weight, starters ~30+, deep bench a few
+    rotation = np.linspace(1.0, 0.05, roster_size) ** 1.5
+    weights = rng.gamma(20 * rotation[:, None], 1.0, size=(roster_size, game_day.sum()))
+    minutes = np.round(200 * weights / weights.sum(axis=0), 0)
+    intensity = rng.normal(1.0, 0.15, size=(roster_size, practice_day.sum())).clip(0.4)
+    practice = np.round(np.where(rotation[:, None] > 0.3, 380, 320) * intensity, 0)
+
+    rows = []
+    for player in range(roster_size):
+        name = f"Player {player + 1:02d}"
+        rows.append(pd.DataFrame({'Player': name, 'Day': days[game_day], 'Minutes': minutes[player],
+                                  'Practice_Load': 0.0}))
+        rows.append(pd.DataFrame({'Player': name, 'Day': days[practice_day], 'Minutes': 0.0,
+                                  'Practice_Load': practice[player]}))
+    df = pd.concat(rows, ignore_index=True).sort_values(['Player', 'Day'], ignore_index=True)
+    df.insert(0, 'Team', team)
+    df.insert(1, 'Season', season)
+    df.insert(3, 'Date', [iso_date(d) for d in df['Day']])
+    return df[LOAD_COLUMNS + ['Day']]
+
+
+def league_loads(base, teams, seasons=3):
+    """Replicate one roster's loads to `teams` teams over `seasons` consecutive seasons (timing benchmark)"""
+    frames = []
+    start_year = season_dataset.season_start(base['Season'].iloc[0])
+    for s in range(seasons):
+        shifted = base.assign(Day=base['Day'] + 364 * s, Season=season_dataset.season_name(start_year + s))
+        for t in range(teams):
+            frames.append(shifted.assign(Team=f"Team {t + 1:03d}"))
+    return pd.concat(frames, ignore_index=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Player acute:chronic workload ratios")
+    parser.add_argument('--loads', default=LOAD_DIR, help="directory of player load CSVs")
+    parser.add_argument('--scale', type=int, default=0, help="also time N synthetic rosters over three seasons")
+    args = parser.parse_args()
+
+    travel = team_travel_sources()
+    loads = read_loads(args.loads)
+    synthetic = loads.empty
+    if synthetic:
+        team, season = DEFAULT_TEAM, '2025-2026'
+        loads = synthetic_loads(team, season, travel[(team, season)][1])
+
+    start = time.perf_counter()
+    matrices = workload_matrices(loads, travel)
+    elapsed = time.perf_counter() - start
+    table = workload_table(matrices, travel)
+
+    print("=" * 100)
+    print("PLAYER WORKLOAD - ACUTE:CHRONIC RATIOS")
+    print("=" * 100)
+    source = f"SYNTHETIC roster ({ROSTER_SIZE} players on the real schedule)" if synthetic else args.loads
+    print(f"Loads: {source} | {len(loads):,} player-days | {table['Player'].nunique()} players | "
+          f"computed in {elapsed * 1000:.1f} ms")
+    print(f"EWMA acute {ACUTE_DAYS} d / chronic {CHRONIC_DAYS} d | {GAME_LOAD_PER_MINUTE:g} units per game minute | "
+          f"{TRAVEL_LOAD_PER_HOUR:g} units per travel hour | flags: ACWR > {ACWR_HIGH} or < {ACWR_LOW} in season")
+
+    for (team, season), group in table.groupby(['Team', 'Season'], sort=True):
+        games = group[group['Opponent'].notna()]
+        in_season = group[group['Date'] >= games['Date'].min()] if not games.empty else group
+        print(f"\n🏀 {team} {season}")
+        print("-" * 100)
+        for player, rows in in_season.groupby('Player', sort=True):
+            peak = rows.loc[rows['ACWR'].idxmax()]
+            print(f"  {player:16s} season load {rows['Adjusted_Load'].sum():8,.0f} "
+                  f"(travel {rows['Travel_Load'].sum():6,.0f}) | ACWR peak {peak['ACWR']:.2f} on {peak['Date']} | "
+                  f"days > {ACWR_HIGH}: {(rows['ACWR'] > ACWR_HIGH).sum():2d} | "
+                  f"days < {ACWR_LOW}: {(rows['ACWR'] < ACWR_LOW).sum():2d}")
+        flagged = games[games['ACWR'] > ACWR_HIGH]
+        print(f"\n  ⚠️  Game-day ACWR above {ACWR_HIGH}: {len(flagged)} player-games")
+        for _, row in flagged.sort_values('ACWR', ascending=False).head(10).iterrows():
+            print(f"    {row['Date']} {row['Home_Away']:7s} vs {row['Opponent']:20s} {row['Player']:16s} "
+                  f"ACWR {row['ACWR']:.2f} (acute {row['Acute_Load']:.0f}, chronic {row['Chronic_Load']:.0f})")
+
+    if args.scale:
+        base = loads[(loads['Team'] == loads['Team'].iloc[0]) & (loads['Season'] == loads['Season'].iloc[0])]
+        league = league_loads(base, args.scale)
+        start = time.perf_counter()
+        league_matrices = workload_matrices(league, travel)
+        elapsed = time.perf_counter() - start
+        cells = sum(m['load'].size for m in league_matrices.values())
+        print(f"\n⏱️  {args.scale} rosters x {len(league_matrices)} seasons: {league['Player'].size:,} player-days, "
+              f"{cells:,} player x day cells in {elapsed:.2f} s")
+    print("=" * 100)
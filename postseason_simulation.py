@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Postseason travel projection: Monte Carlo over conference tournament and NCAA bracket outcomes.
+
+The regular season ends with the March 7 finale; where the team plays next
+depends on results. Every run samples a win or loss for each round from
+WIN_PROBABILITY and a site for each event from POSTSEASON_EVENTS (an NCAA
+first weekend at home as a top-16 seed or on another host campus, one of the
+regionals), then traces the path the team actually plays:
+
+  - A loss ends the conference tournament; the NCAA bracket is entered
+    regardless (an at-large bid is assumed) and a loss there ends the season.
+  - Rounds of one event are played without going home. Events are days
+    apart, so unlike a regular-season road trip (travel_engine) the team
+    flies home after its last game at each event.
+  - Each postseason game is scored with fatigue_model after the last two
+    regular-season games, with rest from the dates and leg miles, hours and
+    timezones from the venue tables.
+
+Runs are simulated in fixed-size chunks: a (runs x rounds) array of outcomes
+per chunk, its played games compacted to the left for fatigue scoring.
+Chunks get their own RNG streams spawned from one seed and are spread over
+worker processes, so results are reproducible for any worker count.
+
+Usage:
+    python3 postseason_simulation.py                       # 1,000,000 bracket runs
+    python3 postseason_simulation.py 100000 --workers 1
+    python3 postseason_simulation.py --win "Sweet 16=0.6" --win "Elite 8=0.5"
+"""
+
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import fatigue_model
+import schedule_loader
+import travel_engine
+from game_records import day_number
+from venues import HOME_LOCATION, count_timezones_crossed
+
+# Events in bracket order: rounds with dates and the site probabilities of the event
+POSTSEASON_EVENTS = [
+    {
+        'event': 'Conference Tournament',
+        'stage': 'Conference',
+        'sites': {'Greensboro, NC': 1.0},
+        'rounds': [('Conference Quarterfinal', '2026-03-12'), ('Conference Semifinal', '2026-03-13'),
+                   ('Conference Final', '2026-03-14')],
+    },
+    {
+        'event': 'NCAA First Weekend',
+        'stage': 'NCAA',
+        # Top-16 seeds host; otherwise the team travels to a host campus
+        'sites': {'South Bend, IN': 0.55, 'Columbia, SC': 0.08, 'Storrs, CT': 0.08, 'Durham, NC': 0.06,
+                  'Louisville, KY': 0.06, 'Iowa City, IA': 0.06, 'Austin, TX': 0.06, 'Los Angeles, CA': 0.05},
+        'rounds': [('NCAA First Round', '2026-03-20'), ('NCAA Second Round', '2026-03-22')],
+    },
+    {
+        'event': 'NCAA Regional',
+        'stage': 'NCAA',
+        'sites': {'Fort Worth, TX': 0.5, 'Sacramento, CA': 0.5},
+        'rounds': [('Sweet 16', '2026-03-27'), ('Elite 8', '2026-03-29')],
+    },
+    {
+        'event': 'Final Four',
+        'stage': 'NCAA',
+        'sites': {'Phoenix, AZ': 1.0},
+        'rounds': [('National Semifinal', '2026-04-03'), ('National Championship', '2026-04-05')],
+    },
+]
+
+WIN_PROBABILITY = {
+    'Conference Quarterfinal': 0.80,
+    'Conference Semifinal': 0.62,
+    'Conference Final': 0.48,
+    'NCAA First Round': 0.92,
+    'NCAA Second Round': 0.72,
+    'Sweet 16': 0.55,
+    'Elite 8': 0.45,
+    'National Semifinal': 0.42,
+    'National Championship': 0.45,
+}
+
+CONTEXT_GAMES = 2  # Regular-season games before the postseason that feed rest and consecutive-away scoring
+VERY_HIGH_SCORE = 70
+
+N_RUNS = 1_000_000
+RUNS_PER_STREAM = 25_000
+SEED = 2026
+PERCENTILES = [5, 25, 50, 75, 95]
+
+TRAVEL_FILE = 'nd_womens_basketball_2025_2026.csv'
+OUTPUT_FILE = 'nd_womens_basketball_2025_2026_postseason_projection.csv'
+
+
+def build_bracket(travel_file=TRAVEL_FILE, win_probability=WIN_PROBABILITY, events=POSTSEASON_EVENTS,
+                  home_location=HOME_LOCATION):
+    """Round, site and leg arrays the simulation needs, plus the regular-season context games"""
+    df = schedule_loader.load_csv(travel_file)
+    context = df.tail(CONTEXT_GAMES)
+    rounds = [(event_index, name, date) for event_index, event in enumerate(events) for name, date in event['rounds']]
+    missing = [name for _, name, _ in rounds if name not in win_probability]
+    if missing:
+        raise ValueError(f"No win probability for {', '.join(missing)}")
+
+    cities = [home_location] + sorted({site for event in events for site in event['sites']} - {home_location})
+    index = {city: i for i, city in enumerate(cities)}
+    legs = [(a, b) for a in cities for b in cities]
+    miles, hours, _ = travel_engine.calculate_travel_metrics(legs)
+    shape = (len(cities), len(cities))
+
+    event_of_round = np.array([event_index for event_index, _, _ in rounds])
+    stage_names = [event['stage'] for event in events]
+    first_of_stage = np.array([r == 0 or stage_names[event_of_round[r]] != stage_names[event_of_round[r - 1]]
+                               for r in range(len(rounds))])
+    return {
+        'rounds': [name for _, name, _ in rounds],
+        'dates': [date for _, _, date in rounds],
+        'events': [event['event'] for event in events],
+        'event_of_round': event_of_round,
+        'first_of_stage': first_of_stage,
+        'win_prob': np.array([win_probability[name] for _, name, _ in rounds]),
+        'site_cities': [np.array([index[site] for site in event['sites']]) for event in events],
+        'site_probs': [np.array(list(event['sites'].values())) / sum(event['sites'].values()) for event in events],
+        'cities': cities,
+        'home': index[home_location],
+        'miles': np.asarray(miles, dtype=float).reshape(shape),
+        'hours': np.asarray(hours, dtype=float).reshape(shape),
+        'timezones': np.array([[count_timezones_crossed(a, b) for b in cities] for a in cities]),
+        'round_days': np.array([day_number(date) for _, _, date in rounds]),
+        'context_days': np.array([day_number(f"{d:%Y-%m-%d}") for d in context['Game_Date']]),
+        'context_miles': context['Travel_Distance_Miles'].to_numpy(dtype=float),
+        'context_timezones': context['Timezones_Crossed'].to_numpy(dtype=int),
+        'context_away': (context['Home_Away'] == 'Away').to_numpy(),
+    }
+
+
+def simulate_chunk(seed_sequence, n_runs, bracket):
+    """Per-run postseason miles, hours and (runs x rounds) fatigue scores (-1 where not played)"""
+    rng = np.random.default_rng(seed_sequence)
+    n_rounds = len(bracket['rounds'])
+    home = bracket['home']
+    event_of_round = bracket['event_of_round']
+
+    # Which rounds each run plays: a stage's first round always, later rounds after a win
+    wins = rng.random((n_runs, n_rounds)) < bracket['win_prob']
+    played = np.ones((n_runs, n_rounds), dtype=bool)
+    for r in range(1, n_rounds):
+        if not bracket['first_of_stage'][r]:
+            played[:, r] = played[:, r - 1] & wins[:, r - 1]
+
+    # Event sites, then where each round's leg starts: the previous round's site within an event, else home
+    event_sites = np.column_stack([rng.choice(cities, size=n_runs, p=probs)
+                                   for cities, probs in zip(bracket['site_cities'], bracket['site_probs'])])
+    site = event_sites[:, event_of_round]
+    same_event = np.concatenate([[False], event_of_round[1:] == event_of_round[:-1]])
+    origin = np.where(same_event, np.roll(site, 1, axis=1), home)
+    leg_miles = np.where(played, bracket['miles'][origin, site], 0.0)
+    leg_hours = np.where(played, bracket['hours'][origin, site], 0.0)
+    leg_timezones = bracket['timezones'][origin, site]
+
+    # Fly home after the last game played at each event
+    continues = np.concatenate([played[:, 1:] & same_event[1:], np.zeros((n_runs, 1), dtype=bool)], axis=1)
+    returning = played & ~continues
+    miles = leg_miles.sum(axis=1) + (returning * bracket['miles'][site, home]).sum(axis=1)
+    hours = leg_hours.sum(axis=1) + (returning * bracket['hours'][site, home]).sum(axis=1)
+
+    # Score the played games in order after the regular-season context games
+    n_context = len(bracket['context_days'])
+    mask = np.concatenate([np.ones((n_runs, n_context), dtype=bool), played], axis=1)
+    order = np.argsort(~mask, axis=1, kind='stable')
+    columns = lambda context, rounds: np.take_along_axis(
+        np.concatenate([np.broadcast_to(context, (n_runs, n_context)), rounds], axis=1), order, axis=1)
+    days = columns(bracket['context_days'], np.broadcast_to(bracket['round_days'], (n_runs, n_rounds)))
+    scores = fatigue_model.score_schedule(
+        columns(bracket['context_miles'], leg_miles),
+        columns(bracket['context_timezones'], leg_timezones),
+        fatigue_model.days_rest_from_dates(days),
+        columns(bracket['context_away'], site != home),
+    )['Overall_Fatigue_Score']
+    fatigue = np.empty_like(scores)
+    np.put_along_axis(fatigue, order, scores, axis=1)
+    fatigue = np.where(played, fatigue[:, n_context:], -1).astype(np.int16)
+    return miles.astype(np.float32), hours.astype(np.float32), fatigue
+
+
+def simulate(bracket, n_runs=N_RUNS, seed=SEED, workers=None):
+    """Postseason miles, hours and fatigue scores for every run"""
+    n_streams = max(1, math.ceil(n_runs / RUNS_PER_STREAM))
+    streams = np.random.SeedSequence(seed).spawn(n_streams)
+    sizes = [min(RUNS_PER_STREAM, n_runs - i * RUNS_PER_STREAM) for i in range(n_streams)]
+    workers = min(workers or os.cpu_count() or 1, n_streams)
+
+    if workers == 1:
+        chunks = [simulate_chunk(s, n, bracket) for s, n in zip(streams, sizes)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(simulate_chunk, streams, sizes, [bracket] * n_streams))
+    miles, hours, fatigue = (np.concatenate(parts) for parts in zip(*chunks))
+    return miles, hours, fatigue
+
+
+def round_summary(bracket, fatigue):
+    """Per-round probability of playing and fatigue distribution when played"""
+    rows = []
+    for r, name in enumerate(bracket['rounds']):
+        scores = fatigue[:, r][fatigue[:, r] >= 0]
+        bands = np.percentile(scores, PERCENTILES) if len(scores) else [np.nan] * len(PERCENTILES)
+        rows.append({
+            'Round': name,
+            'Event': bracket['events'][bracket['event_of_round'][r]],
+            'Game_Date': bracket['dates'][r],
+            'Win_Prob': bracket['win_prob'][r],
+            'Prob_Playing': round(len(scores) / len(fatigue), 4),
+            **{f'Fatigue_P{p}': value for p, value in zip(PERCENTILES, bands)},
+            'Fatigue_Mean': round(float(scores.mean()), 2) if len(scores) else np.nan,
+            'Prob_Very_High': round(float((scores >= VERY_HIGH_SCORE).mean()), 4) if len(scores) else np.nan,
+        })
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo postseason travel and fatigue projection")
+    parser.add_argument('runs', nargs='?', type=int, default=N_RUNS, help="bracket runs to simulate")
+    parser.add_argument('--workers', type=int, help="worker processes (default: all CPUs)")
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--win', action='append', default=[], metavar='ROUND=P',
+                        help="override one round's win probability, e.g. 'Sweet 16=0.6'")
+    args = parser.parse_args()
+
+    win_probability = dict(WIN_PROBABILITY)
+    for override in args.win:
+        name, _, value = override.rpartition('=')
+        if name not in win_probability:
+            parser.error(f"unknown round {name!r}; rounds: {', '.join(win_probability)}")
+        win_probability[name] = float(value)
+
+    bracket = build_bracket(win_probability=win_probability)
+    start = time.perf_counter()
+    miles, hours, fatigue = simulate(bracket, args.runs, args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+    summary = round_summary(bracket, fatigue)
+    summary.to_csv(OUTPUT_FILE, index=False)
+
+    games = (fatigue >= 0).sum(axis=1)
+    worst = fatigue.max(axis=1)
+    workers = min(args.workers or os.cpu_count() or 1, math.ceil(args.runs / RUNS_PER_STREAM))
+
+    print("=" * 100)
+    print("POSTSEASON TRAVEL PROJECTION - NOTRE DAME WOMEN'S BASKETBALL 2025-2026")
+    print("=" * 100)
+    print(f"Bracket runs: {args.runs:,} | Rounds: {len(bracket['rounds'])} | Seed: {args.seed} | "
+          f"Workers: {workers} | Time: {elapsed:.2f}s ({args.runs / elapsed:,.0f} runs/s)")
+
+    print("\n✈️  POSTSEASON TRAVEL PER RUN")
+    print("-" * 100)
+    for label, values, unit in [('Miles', miles, 'mi'), ('Hours', hours, 'h'), ('Games', games, ''),
+                                ('Worst fatigue', worst, '')]:
+        bands = np.percentile(values, PERCENTILES)
+        print(f"  {label:14s} mean {values.mean():8,.1f}{unit:>3s} | "
+              + " | ".join(f"P{p} {value:,.1f}" for p, value in zip(PERCENTILES, bands)))
+    print(f"  P(any VERY HIGH postseason game): {100 * (worst >= VERY_HIGH_SCORE).mean():.1f}%")
+
+    print("\n🏆 ROUND BY ROUND")
+    print("-" * 100)
+    for _, row in summary.iterrows():
+        print(f"  {row['Round']:24s} {row['Game_Date']} | P(play) {100 * row['Prob_Playing']:5.1f}% | "
+              f"win {row['Win_Prob']:.2f} | fatigue mean {row['Fatigue_Mean']:5.1f} "
+              f"(P5-P95 {row['Fatigue_P5']:3.0f}-{row['Fatigue_P95']:3.0f}) | "
+              f"P(VERY HIGH) {100 * row['Prob_Very_High']:5.1f}%")
+
+    print("\n📍 WHERE THE MILES COME FROM")
+    print("-" * 100)
+    exits = pd.Series(games).value_counts().sort_index()
+    for n_games, count in exits.items():
+        print(f"  {n_games} postseason game(s): {100 * count / args.runs:5.1f}% of runs, "
+              f"mean {miles[games == n_games].mean():7,.0f} mi / {hours[games == n_games].mean():5.1f} h")
+
+    print(f"\n✅ Round summary saved to: {OUTPUT_FILE}")
+    print("=" * 100)
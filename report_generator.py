@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Incremental team briefing and validation report generator.
+
+Renders TEAM_BRIEFING.md, TRIP_VALIDATION_REPORT.md and
+VISUALIZATION_VALIDATION_REPORT.md for every team-season from the computed
+summary, validation and rollup objects through the templates in templates/.
+
+Each report's inputs (source CSVs, its template and the modules the numbers
+come from) are fingerprinted into report_manifest.json; a report is only
+re-rendered when that fingerprint changes, so a nightly refresh over
+hundreds of teams mostly reduces to stat() calls.
+
+Reports for the conventionally named season files in the working directory
+are written next to them; reports for dataset/ partitions
+(season_dataset.py) are written into the partition directory.
+
+Usage:
+    python3 report_generator.py            # rebuild changed reports
+    python3 report_generator.py --force    # rebuild everything
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from datetime import date
+from string import Template
+
+import numpy as np
+import pandas as pd
+
+import fatigue_model
+import rollup_cube
+import season_dataset
+import travel_engine
+from venues import HOME_LOCATION, city_coords
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+MANIFEST_FILE = 'report_manifest.json'
+REPORTS = ['TEAM_BRIEFING.md', 'TRIP_VALIDATION_REPORT.md', 'VISUALIZATION_VALIDATION_REPORT.md']
+
+# Modules whose logic shapes the report numbers; editing one invalidates every report
+CODE_INPUTS = ['report_generator.py', 'travel_engine.py', 'travel_modes.py', 'venues.py',
+               'fatigue_model.py', 'rollup_cube.py']
+
+DISTANCE_TOLERANCE = 50  # miles
+DURATION_TOLERANCE = 1.0  # hours
+TOP_TRIPS = 5
+VALID_DIRECTIONS = {'Home', 'North', 'South', 'Eastbound', 'Westbound'}
+
+
+def report_targets(directory='.', root=season_dataset.DATASET_ROOT):
+    """{(sport, team, season): {'travel', 'fatigue', 'output_dir'}} for every team-season with both files"""
+    targets = {}
+    for kind, sport, season, team, path in season_dataset.season_files(directory):
+        targets.setdefault((sport, team, season), {'output_dir': directory})[kind] = path
+    for partition in season_dataset.list_partitions(root):
+        key = (partition['sport'], partition['team'], partition['season'])
+        if key in targets:
+            continue
+        paths = {kind: os.path.join(partition['path'], f'{kind}.csv') for kind in season_dataset.KINDS}
+        if all(os.path.exists(path) for path in paths.values()):
+            targets[key] = {**paths, 'output_dir': partition['path']}
+    return {key: target for key, target in targets.items() if 'travel' in target and 'fatigue' in target}
+
+
+def _fmt(value, digits=1):
+    """Thousands-separated number"""
+    return f"{value:,.{digits}f}"
+
+
+def _bullets(lines, empty="- None"):
+    return "\n".join(f"- {line}" for line in lines) if lines else empty
+
+
+def _numbered(lines, empty="- None"):
+    return "\n".join(f"{i}. {line}" for i, line in enumerate(lines, 1)) if lines else empty
+
+
+def home_location_of(travel):
+    """Home venue of a team (location of its home games)"""
+    home = travel.loc[travel['Home_Away'] == 'Home', 'Location']
+    return home.mode().iloc[0] if len(home) else HOME_LOCATION
+
+
+def season_summary(travel, fatigue):
+    """Headline numbers shared by all three reports"""
+    away = travel[travel['Home_Away'] == 'Away']
+    games = len(travel)
+    dates = pd.to_datetime(travel['Game_Date'])
+    gaps = dates.diff().dt.days.iloc[1:]
+    cumulative = fatigue['Cumulative_Distance_Miles']
+    halfway = fatigue[cumulative >= cumulative.iloc[-1] / 2].iloc[0] if games else None
+
+    def trip(row):
+        return (f"**{row['Opponent']} ({row['Location']})**: {_fmt(row['Travel_Distance_Miles'])} miles / "
+                f"{row['Travel_Duration_Hours']:.2f} hours")
+
+    return {
+        'games': games,
+        'home_games': int((travel['Home_Away'] == 'Home').sum()),
+        'away_games': len(away),
+        'neutral_games': int((travel['Home_Away'] == 'Neutral').sum()),
+        'total_miles': _fmt(away['Travel_Distance_Miles'].sum()),
+        'total_hours': _fmt(away['Travel_Duration_Hours'].sum()),
+        'average_trip': (f"{_fmt(away['Travel_Distance_Miles'].mean())} miles / "
+                         f"{away['Travel_Duration_Hours'].mean():.2f} hours") if len(away) else "n/a",
+        'average_rest': gaps.mean() - 1 if len(gaps) else float('nan'),
+        'back_to_back': int((gaps == 1).sum()),
+        'longest': [trip(r) for _, r in away.nlargest(TOP_TRIPS, 'Travel_Distance_Miles').iterrows()],
+        'shortest': [trip(r) for _, r in away.nsmallest(TOP_TRIPS, 'Travel_Distance_Miles').iterrows()],
+        'multi_timezone': int((away['Timezones_Crossed'] >= 2).sum()),
+        'halfway_game': (f"Game {halfway['Game_Number']} ({halfway['Opponent']}, {halfway['Game_Date']})"
+                         if halfway is not None else "n/a"),
+    }
+
+
+def trip_validation(travel, sport):
+    """Recompute every trip from the game list and compare with the CSV"""
+    games = [{'date': r['Game_Date'], 'opponent': r['Opponent'], 'location': r['Location'],
+              'home_away': r['Home_Away']} for _, r in travel.iterrows()]
+    expected = travel_engine.build_travel_rows(games, home_location_of(travel), sport)
+    results = []
+    for (_, row), exp in zip(travel.iterrows(), expected):
+        problems = []
+        if row['Location'] not in city_coords:
+            problems.append(f"unknown location '{row['Location']}'")
+        if abs(row['Travel_Distance_Miles'] - exp['Travel_Distance_Miles']) >= DISTANCE_TOLERANCE:
+            problems.append(f"distance {row['Travel_Distance_Miles']:.1f} mi, expected {exp['Travel_Distance_Miles']:.1f}")
+        if abs(row['Travel_Duration_Hours'] - exp['Travel_Duration_Hours']) >= DURATION_TOLERANCE:
+            problems.append(f"duration {row['Travel_Duration_Hours']:.2f} h, expected {exp['Travel_Duration_Hours']:.2f}")
+        if 'Travel_Mode' in travel.columns and row['Travel_Mode'] != exp['Travel_Mode']:
+            problems.append(f"mode {row['Travel_Mode']}, expected {exp['Travel_Mode']}")
+        results.append((row, exp, problems))
+    return results
+
+
+def visualization_checks(travel, fatigue):
+    """(check, passed, details) for the base vs fatigue-metrics consistency checks"""
+    same_length = len(travel) == len(fatigue)
+    away = fatigue[fatigue['Home_Away'] == 'Away']
+    home = fatigue[fatigue['Home_Away'] == 'Home']
+    expected_levels = fatigue_model.fatigue_level(fatigue['Overall_Fatigue_Score'].values)
+
+    def column_match(column, tolerance=None):
+        if not same_length:
+            return False
+        if tolerance is None:
+            return bool((travel[column].astype(str).values == fatigue[column].astype(str).values).all())
+        return bool((np.abs(travel[column].values - fatigue[column].values) <= tolerance).all())
+
+    return [
+        ("Game Count Consistency", same_length, f"Base: {len(travel)} games, Fatigue Metrics: {len(fatigue)} games"),
+        ("Game Dates", column_match('Game_Date'), "All dates match between files"),
+        ("Opponent Names", column_match('Opponent'), "All opponents consistent"),
+        ("Travel Distances", column_match('Travel_Distance_Miles', 0.1), "Within 0.1 mile tolerance"),
+        ("Travel Durations", column_match('Travel_Duration_Hours', 0.01), "Within 0.01 hour tolerance"),
+        ("Home/Away Designation", column_match('Home_Away'), "All match correctly"),
+        ("Cumulative Distance", bool(fatigue['Cumulative_Distance_Miles'].is_monotonic_increasing),
+         "Monotonically increasing"),
+        ("Cumulative Hours", bool(fatigue['Cumulative_Hours'].is_monotonic_increasing), "Monotonically increasing"),
+        ("Fatigue Scores", bool(fatigue['Overall_Fatigue_Score'].between(0, fatigue_model.FATIGUE_SPEC['max_score']).all()),
+         f"All 0-{fatigue_model.FATIGUE_SPEC['max_score']}"),
+        ("Fatigue Level Categories", bool((fatigue['Fatigue_Level'].values == expected_levels).all()),
+         "/".join(fatigue_model.FATIGUE_LEVELS) + " assigned from scores"),
+        ("Away Games Travel", bool((away['Travel_Distance_Miles'] > 0).all()),
+         f"All {len(away)} away games have >0 miles travel"),
+        ("Home Games Travel", bool((home['Travel_Distance_Miles'] == 0).all()),
+         f"All {len(home)} home games show 0 miles"),
+        ("Timezone Values", bool(fatigue['Timezones_Crossed'].between(0, 4).all()), "All realistic (0-4 timezones)"),
+        ("Home Timezone", bool((home['Timezones_Crossed'] == 0).all()), "All home games show 0 timezones"),
+        ("Travel Directions", bool(fatigue['Travel_Direction'].isin(VALID_DIRECTIONS).all()),
+         "Valid values only (Home/N/S/E/W)"),
+        ("Home Game Direction", bool((home['Travel_Direction'] == 'Home').all()), "All marked as \"Home\""),
+    ]
+
+
+def fatigue_distribution(fatigue):
+    """(level, count, share) from most to least severe"""
+    total = max(len(fatigue), 1)
+    return [(level, int((fatigue['Fatigue_Level'] == level).sum()),
+             100 * (fatigue['Fatigue_Level'] == level).sum() / total)
+            for level in reversed(fatigue_model.FATIGUE_LEVELS)]
+
+
+def briefing_context(travel, fatigue, summary, monthly, weekly):
+    """Template values for TEAM_BRIEFING.md"""
+    merged = fatigue.assign(Location=travel['Location'].values)
+    high_risk = merged[merged['Fatigue_Level'].isin(['HIGH', 'VERY HIGH'])].sort_values(
+        'Overall_Fatigue_Score', ascending=False, kind='stable')
+    away = travel[travel['Home_Away'] == 'Away']
+    longest = away.nlargest(1, 'Travel_Distance_Miles')
+
+    positives = []
+    attention = []
+    if summary['back_to_back'] == 0:
+        positives.append("**Zero back-to-back games** - Recovery day between all games")
+    else:
+        attention.append(f"**{summary['back_to_back']} back-to-back game(s)** - Plan same-day recovery")
+    if summary['average_rest'] >= 2:
+        positives.append(f"**{summary['average_rest']:.1f} day average rest** between games")
+    if summary['multi_timezone'] <= 2:
+        positives.append(f"**Limited timezone stress** - {summary['multi_timezone']} away game(s) crossing 2+ timezones")
+    else:
+        attention.append(f"**Timezone stress**: {summary['multi_timezone']} away games crossing 2+ timezones")
+    if len(longest):
+        row = longest.iloc[0]
+        attention.append(f"**Longest trip**: {_fmt(row['Travel_Distance_Miles'])}-mile journey to {row['Location']} "
+                         f"({row['Travel_Duration_Hours']:.2f} hours travel)")
+    attention.append(f"**Total season mileage**: {summary['total_miles']} miles cumulative travel")
+    if len(high_risk):
+        attention.append(f"**{len(high_risk)} HIGH / VERY HIGH fatigue game(s)** - see table below")
+
+    busy = weekly[(weekly['Games'] >= 3) | (weekly['Hours_Sum'] >= 10)].sort_values(
+        'Hours_Sum', ascending=False, kind='stable')
+    away_rows = fatigue[fatigue['Home_Away'] == 'Away']
+    directions = away_rows['Travel_Direction'].value_counts()
+    modes = away['Travel_Mode'].value_counts() if 'Travel_Mode' in away.columns else pd.Series(dtype=int)
+    rest = fatigue['Days_Rest_Since_Last'].iloc[1:]
+
+    return {
+        'quick_stats': "\n".join([
+            f"| **Total Games** | {summary['games']} |",
+            f"| **Home Games** | {summary['home_games']} ({100 * summary['home_games'] / max(summary['games'], 1):.1f}%) |",
+            f"| **Away Games** | {summary['away_games']} ({100 * summary['away_games'] / max(summary['games'], 1):.1f}%) |",
+            f"| **Total Travel Miles** | {summary['total_miles']} miles |",
+            f"| **Total Travel Hours** | {summary['total_hours']} hours |",
+            f"| **Average Away Trip** | {summary['average_trip']} |",
+            f"| **Average Rest Days** | {summary['average_rest']:.1f} days |",
+            f"| **Back-to-Back Games** | {summary['back_to_back']}{' ✓' if summary['back_to_back'] == 0 else ''} |",
+        ]),
+        'positives': _numbered(positives),
+        'attention': _numbered(attention),
+        'high_risk_games': "\n".join(
+            f"| {r['Game_Number']} | {r['Game_Date']} | {r['Opponent']} | {_fmt(r['Travel_Distance_Miles'])} mi | "
+            f"{r['Travel_Duration_Hours']:.2f} hrs | {r['Timezones_Crossed']} | {r['Days_Rest_Since_Last']} days | "
+            f"{r['Overall_Fatigue_Score']} ({r['Fatigue_Level']}) |"
+            for _, r in high_risk.iterrows()) or "| - | - | No HIGH or VERY HIGH fatigue games | | | | | |",
+        'monthly': "\n".join(
+            f"| {month} | {row['Games']:.0f} | {row['Away_Sum']:.0f} | {_fmt(row['Miles_Sum'], 0)} | "
+            f"{row['Hours_Sum']:.1f} | {row['Fatigue_Mean']:.1f} | {row['Fatigue_Max']:.0f} |"
+            for month, row in monthly.iterrows()),
+        'busy_weeks': _bullets([f"**{week}**: {row['Games']:.0f} games, {row['Hours_Sum']:.1f} travel hours, "
+                                f"peak fatigue {row['Fatigue_Max']:.0f}" for week, row in busy.iterrows()],
+                               "- No weeks with 3+ games or 10+ travel hours"),
+        'rest_notes': _bullets([
+            f"Minimum rest between games: {int(rest.min()) - 1 if len(rest) else 0} day(s)",
+            f"{int((rest >= 6).sum())} gap(s) with 5+ days off for deep recovery",
+            f"{int((rest <= 2).sum())} short turnaround(s) of 1 day or less",
+        ]),
+        'directions': _bullets([f"**{d}** games: {n}" for d, n in directions.items()]),
+        'modes': _bullets([f"**{m}**: {n} trip(s)" for m, n in modes.items()]),
+        'halfway_game': summary['halfway_game'],
+        'fatigue_distribution': "\n".join(f"| {level} | {count} | {share:.1f}% |"
+                                          for level, count, share in fatigue_distribution(fatigue)),
+    }
+
+
+def trip_context(travel, sport, summary):
+    """Template values for TRIP_VALIDATION_REPORT.md"""
+    results = trip_validation(travel, sport)
+    failures = [(row, problems) for row, _, problems in results if problems]
+    passed = not failures
+    return {
+        'status_line': "✅ **VALIDATION STATUS: PASSED**" if passed else
+                       f"⚠️ **VALIDATION STATUS: {len(failures)} DISCREPANCIES**",
+        'status_detail': (f"All {len(results)} games have been validated for geographical accuracy and proper "
+                          f"location tracking. **100% success rate with zero discrepancies found.**") if passed else
+                         (f"{len(results) - len(failures)} of {len(results)} games validated "
+                          f"({100 * (len(results) - len(failures)) / len(results):.1f}% success rate)."),
+        'home_location': home_location_of(travel),
+        'distance_tolerance': DISTANCE_TOLERANCE,
+        'duration_tolerance': f"{DURATION_TOLERANCE:g}",
+        'game_rows': "\n".join(
+            f"| {row['Game_Number']} | {row['Opponent']} | {row['Home_Away']} | {row['Location']} | "
+            f"{row.get('Travel_Mode', exp['Travel_Mode'])} | {row['Travel_Distance_Miles']:.1f} | "
+            f"{row['Travel_Duration_Hours']:.2f} | {'✅' if not problems else '⚠️'} |"
+            for row, exp, problems in results),
+        'issues': "" if passed else "### Discrepancies\n\n" + _numbered(
+            [f"Game {row['Game_Number']} ({row['Opponent']}): " + "; ".join(problems) for row, problems in failures]),
+        'longest_trips': _numbered(summary['longest']),
+        'shortest_trips': _numbered(summary['shortest']),
+    }
+
+
+def visualization_context(travel, fatigue, summary):
+    """Template values for VISUALIZATION_VALIDATION_REPORT.md"""
+    checks = visualization_checks(travel, fatigue)
+    failed = [name for name, ok, _ in checks if not ok]
+    away = fatigue[fatigue['Home_Away'] == 'Away']
+    distances = away['Travel_Distance_Miles']
+    outliers = away[(distances - distances.mean()).abs() > 3 * distances.std()] if len(away) > 1 else away.iloc[:0]
+    spot = away.nlargest(2, 'Travel_Distance_Miles')
+    spot = pd.concat([spot, away.nsmallest(1, 'Travel_Distance_Miles')]).drop_duplicates('Game_Number')
+    longest = away.nlargest(1, 'Travel_Distance_Miles')
+
+    return {
+        'status_badge': "✅ PASSED" if not failed else "❌ FAILED",
+        'status_detail': ("**All visualization data has been validated and confirmed accurate.** "
+                          "The data is ready for analysis and team briefings.") if not failed else
+                         f"**{len(failed)} check(s) failed:** {', '.join(failed)}.",
+        'check_rows': "\n".join(f"| {name} | {'✅' if ok else '❌'} | {details} |" for name, ok, details in checks),
+        'spot_checks': "\n".join(
+            f"| {r['Game_Number']} | {r['Opponent']} | {_fmt(r['Travel_Distance_Miles'])} mi | "
+            f"{r['Travel_Duration_Hours']:.2f} hrs | {r['Overall_Fatigue_Score']} ({r['Fatigue_Level']}) | "
+            f"{'Longest trip' if r['Travel_Distance_Miles'] == distances.max() else 'Shortest trip' if r['Travel_Distance_Miles'] == distances.min() else 'Long trip'} |"
+            for _, r in spot.iterrows()),
+        'longest_trip': (f"{_fmt(longest.iloc[0]['Travel_Distance_Miles'], 0)} miles ({longest.iloc[0]['Opponent']})"
+                         if len(longest) else "n/a"),
+        'fatigue_distribution': "\n".join(f"{level + ':':11s} {count:2d} game(s) ({share:4.1f}%)"
+                                          for level, count, share in fatigue_distribution(fatigue)),
+        'outliers': _bullets([f"**{r['Opponent']} (Game {r['Game_Number']})**: {_fmt(r['Travel_Distance_Miles'])} miles "
+                              f"(mean {distances.mean():.0f} mi, std dev {distances.std():.0f} mi)"
+                              for _, r in outliers.iterrows()],
+                             "No away distances more than 3 standard deviations from the mean."),
+    }
+
+
+def render_team(key, target, cube, prepared, reports=REPORTS):
+    """Render the requested reports for one team-season; returns {filename: text}"""
+    sport, team, season = key
+    # Keep the literal "None" travel mode of home games as a string
+    travel = pd.read_csv(target['travel'], keep_default_na=False, na_values=[''])
+    fatigue = pd.read_csv(target['fatigue'])
+    summary = season_summary(travel, fatigue)
+    base = {'team': team, 'sport': sport, 'season': season, 'prepared': prepared,
+            'travel_file': os.path.basename(target['travel']), 'fatigue_file': os.path.basename(target['fatigue']),
+            **{k: v for k, v in summary.items() if isinstance(v, (str, int))}}
+
+    builders = {
+        'TEAM_BRIEFING.md': lambda: briefing_context(
+            travel, fatigue, summary,
+            rollup_cube.rollup(cube, 'Month', sport, team, season),
+            rollup_cube.rollup(cube, 'ISO_Week', sport, team, season)),
+        'TRIP_VALIDATION_REPORT.md': lambda: trip_context(travel, sport, summary),
+        'VISUALIZATION_VALIDATION_REPORT.md': lambda: visualization_context(travel, fatigue, summary),
+    }
+    rendered = {}
+    for name in reports:
+        with open(os.path.join(TEMPLATE_DIR, f'{name}.tmpl')) as f:
+            template = Template(f.read())
+        rendered[name] = template.substitute({**base, **builders[name]()})
+    return rendered
+
+
+def input_digest(paths, manifest_files):
+    """Combined SHA-256 of a set of input files (size/mtime fast path via the manifest)"""
+    digest = hashlib.sha256()
+    for path in paths:
+        manifest_files[path] = rollup_cube.fingerprint(path, manifest_files.get(path))
+        digest.update(f"{path}:{manifest_files[path]['sha256']}\n".encode())
+    return digest.hexdigest()
+
+
+def generate_reports(directory='.', root=season_dataset.DATASET_ROOT, manifest_file=MANIFEST_FILE, force=False):
+    """Render every changed report for every team-season; returns (rendered paths, skipped count)"""
+    try:
+        with open(manifest_file) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    files = manifest.get('files', {})
+    digests = manifest.get('reports', {})
+
+    code_dir = os.path.dirname(os.path.abspath(__file__))
+    code_paths = [os.path.join(code_dir, name) for name in CODE_INPUTS]
+    cube = None
+    today = date.today()
+    prepared = f"{today:%B} {today.day}, {today.year}"
+    written = []
+    skipped = 0
+
+    for key, target in sorted(report_targets(directory, root).items()):
+        stale = {}
+        for name in REPORTS:
+            output = os.path.join(target['output_dir'], name)
+            digest = input_digest(code_paths + [target['travel'], target['fatigue'],
+                                                os.path.join(TEMPLATE_DIR, f'{name}.tmpl')], files)
+            if force or digests.get(output) != digest or not os.path.exists(output):
+                stale[name] = (output, digest)
+            else:
+                skipped += 1
+        if not stale:
+            continue
+
+        if cube is None:
+            cube = rollup_cube.load_cube()
+        for name, text in render_team(key, target, cube, prepared, list(stale)).items():
+            output, digest = stale[name]
+            with open(output, 'w') as f:
+                f.write(text)
+            digests[output] = digest
+            written.append(output)
+
+    with open(manifest_file, 'w') as f:
+        json.dump({'files': files, 'reports': digests}, f, indent=2)
+    return written, skipped
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render team briefings and validation reports")
+    parser.add_argument('--force', action='store_true', help="Rebuild every report")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    written, skipped = generate_reports(force=args.force)
+    elapsed = time.perf_counter() - start
+
+    print("=" * 100)
+    print("REPORT GENERATION")
+    print("=" * 100)
+    for path in written:
+        print(f"  ✓ {path}")
+    print(f"\nRendered: {len(written)} | Unchanged (skipped): {skipped} | Time: {elapsed * 1000:.0f} ms")
+    print("=" * 100)
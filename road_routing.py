@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Offline road-network routing for bus legs.
+
+Loads a local road graph, contracts it once into a contraction hierarchy and
+caches the hierarchy next to the graph file, so later runs skip preprocessing.
+Short-haul drive times then come from many-to-many hierarchy queries instead
+of straight-line distance / 55 mph.
+
+Road graph file format (one record per line, whitespace separated):
+    c <comment>
+    v <node_id> <lat> <lon>
+    a <from_id> <to_id> <miles> <speed_mph>    one-way road segment
+    e <from_id> <to_id> <miles> <speed_mph>    two-way road segment
+All 'v' records must come before the segments that reference them.
+"""
+
+import heapq
+import math
+import os
+import pickle
+import sys
+import time
+
+ROAD_GRAPH_FILE = 'road_graph.gr'
+CACHE_SUFFIX = '.ch.pkl'
+CACHE_VERSION = 1
+
+SHORT_HAUL_MILES = 500      # Legs shorter than this are bus legs
+ACCESS_SPEED_MPH = 30       # Campus <-> nearest graph node
+WITNESS_SETTLE_LIMIT = 500  # Bound on each witness search during contraction
+
+
+def great_circle_miles(coord1, coord2):
+    """Calculate distance between two coordinates using Haversine formula (returns miles)"""
+    lat1, lon1, lat2, lon2 = map(math.radians, [coord1[0], coord1[1], coord2[0], coord2[1]])
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
+    return 2 * math.asin(math.sqrt(a)) * 3959
+
+
+def _add_arc(out_adj, in_adj, u, v, hours, miles):
+    """Add a directed arc, keeping only the fastest one between two nodes"""
+    if u == v:
+        return
+    current = out_adj[u].get(v)
+    if current is None or hours < current[0]:
+        out_adj[u][v] = (hours, miles)
+        in_adj[v][u] = (hours, miles)
+
+
+def load_road_graph(path):
+    """Read a road graph file into node coordinates and forward/backward adjacency"""
+    ids = {}
+    coords = []
+    out_adj, in_adj = [], []
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            parts = line.split()
+            if not parts or parts[0] == 'c':
+                continue
+            if parts[0] == 'v':
+                ids[parts[1]] = len(coords)
+                coords.append((float(parts[2]), float(parts[3])))
+                out_adj.append({})
+                in_adj.append({})
+            elif parts[0] in ('a', 'e'):
+                u, v = ids[parts[1]], ids[parts[2]]
+                miles = float(parts[3])
+                hours = miles / float(parts[4])
+                _add_arc(out_adj, in_adj, u, v, hours, miles)
+                if parts[0] == 'e':
+                    _add_arc(out_adj, in_adj, v, u, hours, miles)
+            else:
+                raise ValueError(f"{path}:{line_number}: unrecognized record '{parts[0]}'")
+    return coords, out_adj, in_adj
+
+
+def _witness_distances(out_adj, source, skip, max_hours):
+    """Bounded Dijkstra from source that never passes through the skipped node"""
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    settled = 0
+    while heap:
+        d, x = heapq.heappop(heap)
+        if d > dist[x]:
+            continue
+        if d > max_hours or settled >= WITNESS_SETTLE_LIMIT:
+            break
+        settled += 1
+        for y, (h, _) in out_adj[x].items():
+            if y == skip:
+                continue
+            nd = d + h
+            if nd < dist.get(y, math.inf):
+                dist[y] = nd
+                heapq.heappush(heap, (nd, y))
+    return dist
+
+
+def _shortcuts_for(v, out_adj, in_adj):
+    """Shortcuts needed to preserve shortest paths if node v were removed"""
+    shortcuts = []
+    for u, (h_uv, m_uv) in in_adj[v].items():
+        targets = [(w, h_uv + h_vw, m_uv + m_vw) for w, (h_vw, m_vw) in out_adj[v].items() if w != u]
+        if not targets:
+            continue
+        dist = _witness_distances(out_adj, u, v, max(t[1] for t in targets))
+        for w, hours, miles in targets:
+            if dist.get(w, math.inf) > hours:
+                shortcuts.append((u, w, hours, miles))
+    return shortcuts
+
+
+def build_contraction_hierarchy(out_adj, in_adj):
+    """Contract every node in edge-difference order; returns upward forward/backward arc lists"""
+    n = len(out_adj)
+    out_adj = [dict(a) for a in out_adj]
+    in_adj = [dict(a) for a in in_adj]
+    contracted_neighbors = [0] * n
+    up = [[] for _ in range(n)]    # v -> w arcs with rank[w] > rank[v]
+    down = [[] for _ in range(n)]  # u -> v arcs with rank[u] > rank[v], stored at v
+
+    def priority(v, shortcuts):
+        return len(shortcuts) - len(in_adj[v]) - len(out_adj[v]) + contracted_neighbors[v]
+
+    heap = [(priority(v, _shortcuts_for(v, out_adj, in_adj)), v) for v in range(n)]
+    heapq.heapify(heap)
+    while heap:
+        _, v = heapq.heappop(heap)
+        shortcuts = _shortcuts_for(v, out_adj, in_adj)
+        current = priority(v, shortcuts)
+        # Lazy update: re-queue if the node got more expensive than the next candidate
+        if heap and current > heap[0][0]:
+            heapq.heappush(heap, (current, v))
+            continue
+
+        for w, (h, m) in out_adj[v].items():
+            up[v].append((w, h, m))
+            del in_adj[w][v]
+            contracted_neighbors[w] += 1
+        for u, (h, m) in in_adj[v].items():
+            down[v].append((u, h, m))
+            del out_adj[u][v]
+            contracted_neighbors[u] += 1
+        out_adj[v] = {}
+        in_adj[v] = {}
+        for u, w, h, m in shortcuts:
+            _add_arc(out_adj, in_adj, u, w, h, m)
+    return up, down
+
+
+def _upward_search(arcs, source):
+    """Full Dijkstra over the upward graph; returns settled node -> (hours, miles)"""
+    best = {source: (0.0, 0.0)}
+    settled = {}
+    heap = [(0.0, 0.0, source)]
+    while heap:
+        h, m, x = heapq.heappop(heap)
+        if x in settled:
+            continue
+        settled[x] = (h, m)
+        for y, dh, dm in arcs[x]:
+            nh = h + dh
+            if y not in settled and nh < best.get(y, (math.inf,))[0]:
+                best[y] = (nh, m + dm)
+                heapq.heappush(heap, (nh, m + dm, y))
+    return settled
+
+
+class RoadRouter:
+    """Contraction-hierarchy router over a preprocessed road graph"""
+
+    def __init__(self, coords, up, down):
+        self.coords = coords
+        self.up = up
+        self.down = down
+
+    @classmethod
+    def from_graph_file(cls, path=ROAD_GRAPH_FILE):
+        """Load the hierarchy from its disk cache, contracting and caching it if stale"""
+        stat = os.stat(path)
+        cache_path = path + CACHE_SUFFIX
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if (cached.get('version') == CACHE_VERSION and cached['size'] == stat.st_size
+                    and cached['mtime_ns'] == stat.st_mtime_ns):
+                return cls(cached['coords'], cached['up'], cached['down'])
+
+        coords, out_adj, in_adj = load_road_graph(path)
+        up, down = build_contraction_hierarchy(out_adj, in_adj)
+        with open(cache_path, 'wb') as f:
+            pickle.dump({
+                'version': CACHE_VERSION,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'coords': coords,
+                'up': up,
+                'down': down,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return cls(coords, up, down)
+
+    def nearest_node(self, coord):
+        """Graph node closest to a coordinate, and the straight-line miles to it"""
+        scale = math.cos(math.radians(coord[0])) ** 2
+        node = min(range(len(self.coords)),
+                   key=lambda i: (self.coords[i][0] - coord[0]) ** 2
+                   + scale * (self.coords[i][1] - coord[1]) ** 2)
+        return node, great_circle_miles(coord, self.coords[node])
+
+    def drive_matrix(self, sources, targets):
+        """Many-to-many (hours, miles) between node lists using bucket-based CH queries"""
+        buckets = {}
+        for j, t in enumerate(targets):
+            for x, (h, m) in _upward_search(self.down, t).items():
+                buckets.setdefault(x, []).append((j, h, m))
+
+        result = []
+        for s in sources:
+            row = [None] * len(targets)
+            for x, (h, m) in _upward_search(self.up, s).items():
+                for j, th, tm in buckets.get(x, ()):
+                    if row[j] is None or h + th < row[j][0]:
+                        row[j] = (h + th, m + tm)
+            result.append(row)
+        return result
+
+
+_router = None
+
+
+def get_router(graph_path=ROAD_GRAPH_FILE):
+    """Shared router for the road graph, or None when no graph file is present"""
+    global _router
+    if _router is None and os.path.exists(graph_path):
+        _router = RoadRouter.from_graph_file(graph_path)
+    return _router
+
+
+def short_haul_drive_times(venue_coords, max_miles=SHORT_HAUL_MILES, graph_path=ROAD_GRAPH_FILE):
+    """Road (hours, miles) for every venue pair closer than max_miles; empty without a road graph"""
+    router = get_router(graph_path)
+    if router is None:
+        return {}
+
+    names = list(venue_coords)
+    snapped = [router.nearest_node(venue_coords[name]) for name in names]
+    nodes = [node for node, _ in snapped]
+    matrix = router.drive_matrix(nodes, nodes)
+
+    drive_times = {}
+    for i, origin in enumerate(names):
+        for j, destination in enumerate(names):
+            if i == j or matrix[i][j] is None:
+                continue
+            if great_circle_miles(venue_coords[origin], venue_coords[destination]) >= max_miles:
+                continue
+            access_miles = snapped[i][1] + snapped[j][1]
+            hours, miles = matrix[i][j]
+            drive_times[(origin, destination)] = (hours + access_miles / ACCESS_SPEED_MPH,
+                                                  miles + access_miles)
+    return drive_times
+
+
+if __name__ == "__main__":
+    graph_path = sys.argv[1] if len(sys.argv) > 1 else ROAD_GRAPH_FILE
+    if not os.path.exists(graph_path):
+        print(f"❌ Road graph not found: {graph_path}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    router = get_router(graph_path)
+    print(f"✓ Contraction hierarchy ready for {len(router.coords):,} nodes "
+          f"in {time.perf_counter() - start:.2f}s (cache: {graph_path + CACHE_SUFFIX})")
+
+    nodes = list(range(min(len(router.coords), 50)))
+    start = time.perf_counter()
+    router.drive_matrix(nodes, nodes)
+    elapsed = time.perf_counter() - start
+    print(f"✓ {len(nodes)}x{len(nodes)} drive-time matrix in {elapsed * 1000:.1f} ms "
+          f"({elapsed * 1000 / max(1, len(nodes) ** 2):.3f} ms per pair)")
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Regional road-swing proposals from geographic clustering of away venues.
+
+Each team's distinct away venues are grouped by complete-linkage hierarchical
+clustering on the cached venue distance table (travel_engine.distance_table):
+two clusters merge while every venue pair in the result stays within
+SWING_DIAMETER_MILES. All teams are clustered in one batch: their venue
+distances are stacked into a padded (teams x venues x venues) array and every
+agglomeration step merges the closest pair of clusters of every team at once.
+
+A cluster whose games are currently spread over two or more road trips is a
+consolidation opportunity. Its current cost is what those trips spend on the
+cluster's venues (each trip's miles minus the same trip with the cluster's
+venues skipped); the swing cost is the best single tour home -> cluster
+venues -> home. Trips follow travel_engine's movement model: consecutive
+away games are one trip and a home game brings the team home. Hours come
+from the travel-mode choice for every leg. Because the mode changes with leg
+length, hours are not additive like miles: a swing that saves miles can
+cost hours (a long bus ride replacing two flights), so time savings are
+summarized only over swings that have them.
+
+Teams are read from the season travel files (actual schedules) and from the
+generated conference slate (schedule_generator.py), and the opportunities
+are ranked by miles saved.
+
+Usage:
+    python3 road_swings.py                     # 200-mile swings
+    python3 road_swings.py --diameter 300
+"""
+
+import argparse
+import itertools
+import time
+
+import numpy as np
+import pandas as pd
+
+import season_timeline
+import travel_engine
+from venues import HOME_LOCATION, team_venues
+
+SWING_DIAMETER_MILES = 200  # Largest distance between two venues of one swing
+MAX_EXACT_TOUR = 7          # Swings up to this many venues are routed by trying every order
+
+SLATE_FILE = 'acc_single_round_robin_2025_2026.csv'
+OUTPUT_FILE = 'road_swing_opportunities_2025_2026.csv'
+
+
+def team_schedules(slate_file=SLATE_FILE):
+    """{(source, team): (home city, [(date, location, home_away)] in date order)}"""
+    schedules = {}
+    for (sport, team, season), path in season_timeline.travel_sources().items():
+        df = season_timeline.read_travel(path).sort_values('Game_Date', kind='stable')
+        schedules[('actual ' + season, team)] = (
+            team_venues.get(team, HOME_LOCATION),
+            list(zip(df['Game_Date'], df['Location'], df['Home_Away'])))
+    slate = pd.read_csv(slate_file).sort_values('Game_Date', kind='stable')
+    for team in sorted(set(slate['Home_Team']) | set(slate['Away_Team'])):
+        games = slate[(slate['Home_Team'] == team) | (slate['Away_Team'] == team)]
+        schedules[('slate', team)] = (
+            team_venues[team],
+            [(row['Game_Date'], row['Location'], 'Home' if row['Home_Team'] == team else 'Away')
+             for _, row in games.iterrows()])
+    return schedules
+
+
+def road_trips(games):
+    """Consecutive non-home games grouped into trips: [[location, ...], ...]"""
+    trips, current = [], []
+    for _, location, home_away in games:
+        if home_away == 'Home':
+            if current:
+                trips.append(current)
+            current = []
+        else:
+            current.append(location)
+    if current:
+        trips.append(current)
+    return trips
+
+
+def leg_tables(cities):
+    """(miles, hours) city x city arrays for every ordered pair of the cities"""
+    legs = [(a, b) for a in cities for b in cities]
+    miles, hours, _ = travel_engine.calculate_travel_metrics(legs)
+    shape = (len(cities), len(cities))
+    return np.asarray(miles, dtype=float).reshape(shape), np.asarray(hours, dtype=float).reshape(shape)
+
+
+def cluster_venues(distances, diameter=SWING_DIAMETER_MILES):
+    """(teams x venues) cluster labels for padded (teams x venues x venues) distances (inf = padding)
+
+    Complete linkage: the linkage between two clusters is their farthest venue
+    pair, and merging stops when the closest clusters of a team are further
+    apart than the diameter.
+    """
+    linkage = np.array(distances, dtype=float)
+    n_teams, n = linkage.shape[:2]
+    venues = np.arange(n)
+    linkage[:, venues, venues] = np.inf
+    labels = np.tile(venues, (n_teams, 1))
+    teams = np.arange(n_teams)
+    for _ in range(n - 1):
+        i, j = np.divmod(linkage.reshape(n_teams, -1).argmin(axis=1), n)
+        merge = linkage[teams, i, j] <= diameter
+        if not merge.any():
+            break
+        t, i, j = teams[merge], i[merge], j[merge]
+        merged = np.maximum(linkage[t, i], linkage[t, j])
+        linkage[t, i] = merged
+        linkage[t, :, i] = merged
+        linkage[t, j] = np.inf
+        linkage[t, :, j] = np.inf
+        linkage[t, i, i] = np.inf
+        labels[t] = np.where(labels[t] == j[:, None], i[:, None], labels[t])
+    return labels
+
+
+def best_tour(home, stops, miles):
+    """Shortest home -> every stop -> home order (exhaustive up to MAX_EXACT_TOUR stops, else nearest neighbour)"""
+    if len(stops) <= MAX_EXACT_TOUR:
+        orders = np.array(list(itertools.permutations(stops)))
+        route = np.column_stack([np.full(len(orders), home), orders, np.full(len(orders), home)])
+        return list(orders[miles[route[:, :-1], route[:, 1:]].sum(axis=1).argmin()])
+    order, current, remaining = [], home, list(stops)
+    while remaining:
+        current = min(remaining, key=lambda stop: miles[current, stop])
+        order.append(current)
+        remaining.remove(current)
+    return order
+
+
+def route_cost(home, stops, table):
+    """Total of a table (miles or hours) over home -> stops -> home"""
+    if not stops:
+        return 0.0
+    route = [home, *stops, home]
+    return float(table[route[:-1], route[1:]].sum())
+
+
+def swing_opportunities(schedules, diameter=SWING_DIAMETER_MILES):
+    """Ranked consolidation opportunities for every team, plus the clustering time in seconds"""
+    cities = sorted({home for home, _ in schedules.values()}
+                    | {location for _, games in schedules.values() for _, location, _ in games})
+    city_index = {city: i for i, city in enumerate(cities)}
+    miles, hours = leg_tables(cities)
+
+    keys = list(schedules)
+    trips = {key: [[city_index[c] for c in trip] for trip in road_trips(schedules[key][1])] for key in keys}
+    away = {key: sorted({v for trip in trips[key] for v in trip}) for key in keys}
+
+    # Stack every team's away-venue distances into one padded batch
+    width = max((len(v) for v in away.values()), default=0)
+    stacked = np.full((len(keys), width, width), np.inf)
+    for t, key in enumerate(keys):
+        venues = away[key]
+        stacked[t, :len(venues), :len(venues)] = miles[np.ix_(venues, venues)]
+    start = time.perf_counter()
+    labels = cluster_venues(stacked, diameter)
+    elapsed = time.perf_counter() - start
+
+    records = []
+    for t, key in enumerate(keys):
+        home = city_index[schedules[key][0]]
+        venues = np.array(away[key])
+        for label in np.unique(labels[t, :len(venues)]):
+            members = set(venues[labels[t, :len(venues)] == label].tolist())
+            touching = [trip for trip in trips[key] if members & set(trip)]
+            games = sum(v in members for trip in trips[key] for v in trip)
+            if len(touching) < 2:
+                continue
+            current_miles = sum(route_cost(home, trip, miles) - route_cost(home, [v for v in trip if v not in members], miles)
+                                for trip in touching)
+            current_hours = sum(route_cost(home, trip, hours) - route_cost(home, [v for v in trip if v not in members], hours)
+                                for trip in touching)
+            tour = best_tour(home, sorted(members), miles)
+            swing_miles, swing_hours = route_cost(home, tour, miles), route_cost(home, tour, hours)
+            records.append({
+                'Source': key[0],
+                'Team': key[1],
+                'Swing': ' -> '.join(cities[v] for v in tour),
+                'Venues': len(members),
+                'Games': games,
+                'Trips_Now': len(touching),
+                'Current_Miles': round(current_miles, 1),
+                'Swing_Miles': round(swing_miles, 1),
+                'Miles_Saved': round(current_miles - swing_miles, 1),
+                'Current_Hours': round(current_hours, 2),
+                'Swing_Hours': round(swing_hours, 2),
+                'Hours_Saved': round(current_hours - swing_hours, 2),
+            })
+    columns = ['Source', 'Team', 'Swing', 'Venues', 'Games', 'Trips_Now', 'Current_Miles', 'Swing_Miles',
+               'Miles_Saved', 'Current_Hours', 'Swing_Hours', 'Hours_Saved']
+    table = pd.DataFrame(records, columns=columns)
+    return table.sort_values('Miles_Saved', ascending=False, kind='stable', ignore_index=True), elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Propose consolidated road swings from clustered away venues")
+    parser.add_argument('--diameter', type=float, default=SWING_DIAMETER_MILES,
+                        help="largest venue-to-venue distance within one swing (miles)")
+    args = parser.parse_args()
+
+    schedules = team_schedules()
+    start = time.perf_counter()
+    table, cluster_seconds = swing_opportunities(schedules, args.diameter)
+    elapsed = time.perf_counter() - start
+    table.to_csv(OUTPUT_FILE, index=False)
+
+    print("=" * 100)
+    print(f"ROAD SWING CONSOLIDATION - {len(schedules)} TEAM SCHEDULES, SWING DIAMETER {args.diameter:g} MI")
+    print("=" * 100)
+    print(f"Clustered in one batch in {cluster_seconds * 1000:.1f} ms | total {elapsed * 1000:.1f} ms")
+
+    for source, group in table.groupby('Source', sort=True):
+        saving = group[group['Miles_Saved'] > 0]
+        # Hours follow each leg's mode choice, so fewer miles can mean more hours: time savers are summed separately
+        faster = saving[saving['Hours_Saved'] > 0]
+        print(f"\n🧭 {source.upper()}: {len(saving)} swings save miles ({saving['Miles_Saved'].sum():,.0f} mi in total) | "
+              f"{len(faster)} of them also save time ({faster['Hours_Saved'].sum():.1f} hrs in total)")
+        print("-" * 100)
+        for _, row in saving.head(12).iterrows():
+            hours = (f"save {row['Hours_Saved']:4.1f} hrs" if row['Hours_Saved'] > 0
+                     else f"{-row['Hours_Saved']:4.1f} more hrs")
+            print(f"  {row['Team']:16s} {row['Swing']:60s} {row['Games']} games on {row['Trips_Now']} trips | "
+                  f"{row['Current_Miles']:6,.0f} -> {row['Swing_Miles']:6,.0f} mi "
+                  f"(save {row['Miles_Saved']:5,.0f} mi, {hours})")
+
+    print(f"\n✅ Opportunities saved to: {OUTPUT_FILE}")
+    print("=" * 100)
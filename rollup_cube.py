@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Materialized rollup cube of travel and fatigue aggregates.
+
+Leaf cells are keyed by sport x team x season x ISO week x calendar month and
+hold the game count plus sum / min / max of every measure, so any coarser
+rollup (by month, by week, by season, per team) is a cheap re-aggregation of
+the cells instead of a groupby over every game. Means are derived as
+sum / count when rolling up.
+
+The cube is persisted to rollup_cube.csv with a manifest of source-file
+fingerprints (size, mtime, SHA-256). load_cube() recomputes only the
+team-season partitions whose source file changed, so reports and dashboards
+can read it on every run.
+
+Sources are the conventionally named season fatigue files in the working
+directory plus any fatigue.csv partitions under dataset/ (season_dataset.py).
+"""
+
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+
+import season_dataset
+
+CUBE_FILE = 'rollup_cube.csv'
+MANIFEST_FILE = 'rollup_cube.manifest.json'
+
+DIMENSIONS = ['Sport', 'Team', 'Season', 'ISO_Week', 'Month']
+PARTITION_KEYS = ['Sport', 'Team', 'Season']
+
+# Cube measure -> source column (Away counts away games, so Away_Sum is the away-game count)
+MEASURES = {
+    'Miles': 'Travel_Distance_Miles',
+    'Hours': 'Travel_Duration_Hours',
+    'Timezones': 'Timezones_Crossed',
+    'Fatigue': 'Overall_Fatigue_Score',
+    'Away': 'Home_Away',
+}
+STATS = ['Sum', 'Min', 'Max']
+CELL_COLUMNS = DIMENSIONS + ['Games'] + [f'{m}_{s}' for m in MEASURES for s in STATS]
+
+
+def cube_sources(directory='.', root=season_dataset.DATASET_ROOT):
+    """{(sport, team, season): fatigue file path}; working-directory season files take precedence"""
+    sources = {}
+    for kind, sport, season, team, path in season_dataset.season_files(directory):
+        if kind == 'fatigue':
+            sources[(sport, team, season)] = path
+    for partition in season_dataset.list_partitions(root):
+        path = os.path.join(partition['path'], 'fatigue.csv')
+        key = (partition['sport'], partition['team'], partition['season'])
+        if os.path.exists(path) and key not in sources:
+            sources[key] = path
+    return sources
+
+
+def fingerprint(path, previous=None):
+    """Size / mtime / SHA-256 of a file; the hash is reused when size and mtime are unchanged"""
+    stat = os.stat(path)
+    if previous and previous['size'] == stat.st_size and previous['mtime_ns'] == stat.st_mtime_ns:
+        return previous
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return {'path': path, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest}
+
+
+def leaf_cells(df, sport, team, season):
+    """Cube cells for one team-season of fatigue rows"""
+    if df.empty:
+        return pd.DataFrame(columns=CELL_COLUMNS)
+    dates = pd.to_datetime(df['Game_Date'])
+    iso = dates.dt.isocalendar()
+    values = pd.DataFrame({
+        'Sport': sport,
+        'Team': team,
+        'Season': season,
+        'ISO_Week': iso['year'].astype(str) + '-W' + iso['week'].astype(str).str.zfill(2),
+        'Month': dates.dt.strftime('%Y-%m'),
+        'Miles': df[MEASURES['Miles']].astype(float),
+        'Hours': df[MEASURES['Hours']].astype(float),
+        'Timezones': df[MEASURES['Timezones']].astype(int),
+        'Fatigue': df[MEASURES['Fatigue']].astype(int),
+        'Away': (df[MEASURES['Away']] == 'Away').astype(int),
+    })
+    grouped = values.groupby(DIMENSIONS, sort=True)
+    cells = grouped[list(MEASURES)].agg(['sum', 'min', 'max'])
+    cells.columns = [f'{measure}_{stat.title()}' for measure, stat in cells.columns]
+    cells.insert(0, 'Games', grouped.size())
+    return cells.reset_index()[CELL_COLUMNS]
+
+
+def update_partition(cube, sport, team, season, df):
+    """Replace one team-season's cells in the cube with cells computed from its rows"""
+    keep = ~((cube['Sport'] == sport) & (cube['Team'] == team) & (cube['Season'] == season))
+    cells = leaf_cells(df, sport, team, season)
+    frames = [frame for frame in (cube[keep], cells) if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=CELL_COLUMNS)
+    return pd.concat(frames, ignore_index=True).sort_values(DIMENSIONS, ignore_index=True)
+
+
+def load_cube(cube_file=CUBE_FILE, manifest_file=MANIFEST_FILE, sources=None, verbose=False):
+    """Read the cube, recomputing only partitions whose source changed; returns the cell table"""
+    sources = cube_sources() if sources is None else sources
+    try:
+        with open(manifest_file) as f:
+            manifest = json.load(f)
+        cube = pd.read_csv(cube_file)
+    except (OSError, ValueError):
+        manifest, cube = {}, pd.DataFrame(columns=CELL_COLUMNS)
+
+    new_manifest = {}
+    changed = []
+    for (sport, team, season), path in sorted(sources.items()):
+        name = '|'.join((sport, team, season))
+        previous = manifest.get(name)
+        current = fingerprint(path, previous)
+        new_manifest[name] = current
+        if previous is None or previous['sha256'] != current['sha256']:
+            cube = update_partition(cube, sport, team, season, pd.read_csv(path))
+            changed.append(name)
+
+    removed = set(manifest) - set(new_manifest)
+    for name in removed:
+        sport, team, season = name.split('|')
+        cube = update_partition(cube, sport, team, season, pd.DataFrame())
+
+    if changed or removed or new_manifest != manifest:
+        # Write-then-rename so concurrent readers (parallel build stages) never see a partial file
+        cube.to_csv(f'{cube_file}.{os.getpid()}.tmp', index=False)
+        os.replace(f'{cube_file}.{os.getpid()}.tmp', cube_file)
+        with open(f'{manifest_file}.{os.getpid()}.tmp', 'w') as f:
+            json.dump(new_manifest, f, indent=2)
+        os.replace(f'{manifest_file}.{os.getpid()}.tmp', manifest_file)
+    if verbose:
+        print(f"Rollup cube: {len(new_manifest)} partition(s), {len(changed)} recomputed, {len(removed)} removed")
+    return cube
+
+
+def rollup(cube, by, sport=None, team=None, season=None):
+    """Aggregate cube cells to the given dimension(s): Games plus Sum / Min / Max / Mean per measure"""
+    by = [by] if isinstance(by, str) else list(by)
+    cells = cube
+    for column, value in (('Sport', sport), ('Team', team), ('Season', season)):
+        if value is not None:
+            cells = cells[cells[column] == value]
+
+    aggregations = {'Games': 'sum'}
+    for measure in MEASURES:
+        aggregations.update({f'{measure}_Sum': 'sum', f'{measure}_Min': 'min', f'{measure}_Max': 'max'})
+    result = cells.groupby(by, sort=True).agg(aggregations)
+    for measure in MEASURES:
+        result[f'{measure}_Mean'] = result[f'{measure}_Sum'] / result['Games']
+    return result
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    cube = load_cube(verbose=True)
+    elapsed = time.perf_counter() - start
+
+    print("=" * 100)
+    print("ROLLUP CUBE - TEAM x ISO WEEK x MONTH x SEASON")
+    print("=" * 100)
+    print(f"Cells: {len(cube)} | Teams: {cube['Team'].nunique()} | Seasons: {cube['Season'].nunique()} | "
+          f"Load/refresh: {elapsed * 1000:.1f} ms")
+
+    for (sport, team, season), _ in cube.groupby(PARTITION_KEYS, sort=True):
+        print(f"\n📅 {team} {sport} {season} - BY MONTH")
+        print("-" * 100)
+        for month, row in rollup(cube, 'Month', sport, team, season).iterrows():
+            print(f"  {month}: {row['Games']:2.0f} games ({row['Away_Sum']:.0f} away) | "
+                  f"{row['Miles_Sum']:7.1f} miles | {row['Hours_Sum']:5.1f} hours | "
+                  f"TZ max {row['Timezones_Max']:.0f} | Fatigue avg {row['Fatigue_Mean']:4.1f} max {row['Fatigue_Max']:.0f}")
+
+        season_total = rollup(cube, 'Season', sport, team, season).iloc[0]
+        print(f"  Season: {season_total['Games']:.0f} games | {season_total['Miles_Sum']:.1f} miles | "
+              f"{season_total['Hours_Sum']:.1f} hours | Fatigue avg {season_total['Fatigue_Mean']:.1f}")
+    print("=" * 100)
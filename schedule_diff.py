@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Keyed diff of two schedule or metric tables (travel CSVs, fatigue CSVs, dataset partitions).
+
+Games are matched on a stable key instead of row position: the sport / team /
+season columns both tables have, the opponent, home/away, and an occurrence
+counter for the nth meeting with that opponent at that site (in date order).
+Inserting a game or moving one to another date therefore shows up as one
+added or moved game rather than shifting every row after it.
+
+The two tables are hash-joined on the key (pandas merge), so a whole-league
+comparison is linear in the number of rows. The diff reports:
+  - added / removed games (key in only one version)
+  - moved games (same key, different Game_Date)
+  - per-column value changes beyond the column's tolerance
+  - fatigue propagation: both versions are rescored with fatigue_model and
+    every game whose fatigue changed is attributed either to its own
+    change ("direct") or to a change elsewhere in its team's season
+    ("propagated" through days of rest and consecutive away games)
+
+Usage:
+    python3 schedule_diff.py                        # CORRECTED vs current travel file
+    python3 schedule_diff.py old.csv new.csv
+    python3 schedule_diff.py --scale 2000000        # synthetic league-sized comparison
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import fatigue_model
+
+OLD_FILE = 'nd_womens_basketball_2025_2026_CORRECTED.csv'
+NEW_FILE = 'nd_womens_basketball_2025_2026.csv'
+
+GROUP_COLUMNS = ['Sport', 'Team', 'Season']
+KEY_COLUMNS = ['Opponent', 'Home_Away']
+DATE_COLUMN = 'Game_Date'
+IGNORE_COLUMNS = ['Game_Number']
+
+# Column -> largest difference still treated as unchanged (other numeric columns must match exactly)
+TOLERANCES = {
+    'Travel_Distance_Miles': 0.1,
+    'Travel_Duration_Hours': 0.01,
+    'Cumulative_Distance_Miles': 0.1,
+    'Cumulative_Hours': 0.1,
+}
+
+FATIGUE_COLUMNS = ['Days_Rest_Since_Last', 'Travel_Fatigue_Component', 'Timezone_Fatigue_Component',
+                   'Rest_Fatigue_Component', 'Consecutive_Game_Fatigue', 'Overall_Fatigue_Score']
+
+
+def read_table(path):
+    """Read a schedule / metric CSV (the 'None' travel mode stays a string)"""
+    return pd.read_csv(path, keep_default_na=False, na_values=[''])
+
+
+def day_numbers(dates):
+    """Dates (ISO strings or datetimes) -> int64 days since 1970-01-01"""
+    return pd.to_datetime(pd.Series(dates), format='ISO8601').to_numpy().astype('datetime64[D]').astype(np.int64)
+
+
+def occurrence(codes, days):
+    """1 for the first row of each code in date order, 2 for the next, ..."""
+    order = np.lexsort((days, codes))
+    run_start = np.ones(len(codes), dtype=bool)
+    run_start[1:] = codes[order][1:] != codes[order][:-1]
+    starts = np.flatnonzero(run_start)
+    result = np.empty(len(codes), dtype=np.int64)
+    result[order] = np.arange(len(codes)) - np.repeat(starts, np.diff(np.append(starts, len(codes)))) + 1
+    return result
+
+
+def keyed(old, new):
+    """(key columns, old, new) with Occurrence, day-number and integer Game_Key columns added
+
+    The key columns of both tables are factorized together in one hash pass,
+    so equal keys get the same Game_Key and the join compares single integers.
+    """
+    groups = [c for c in GROUP_COLUMNS if c in old.columns and c in new.columns]
+    keys = groups + KEY_COLUMNS + ['Occurrence']
+    old, new = old.reset_index(drop=True), new.reset_index(drop=True)
+    pairs = pd.concat([old[keys[:-1]], new[keys[:-1]]], ignore_index=True)
+    codes = pairs.groupby(keys[:-1], sort=False, dropna=False).ngroup().to_numpy().astype(np.int64)
+    tables = []
+    for df, table_codes in ((old, codes[:len(old)]), (new, codes[len(old):])):
+        days = day_numbers(df[DATE_COLUMN])
+        counts = occurrence(table_codes, days)
+        tables.append(df.assign(Occurrence=counts, _Day=days, Game_Key=table_codes * (len(pairs) + 1) + counts))
+    return keys, tables[0], tables[1]
+
+
+def _changed(old, new, tolerance):
+    """Boolean mask of values that differ beyond the tolerance (NaN on both sides is unchanged)"""
+    if pd.api.types.is_numeric_dtype(old) and pd.api.types.is_numeric_dtype(new):
+        both_missing = old.isna() & new.isna()
+        return ~((new - old).abs() <= tolerance + 1e-9) & ~both_missing
+    return old.astype(str) != new.astype(str)
+
+
+def diff_tables(old, new, columns=None, tolerances=TOLERANCES):
+    """Keyed diff of two tables; returns {'keys', 'matched', 'added', 'removed', 'moved', 'changes'}"""
+    keys, old, new = keyed(old, new)
+    internal = keys + ['_Day', 'Game_Key']
+    shared = [c for c in old.columns if c in new.columns and c not in internal]
+    compare = [c for c in (columns or shared) if c in shared and c not in IGNORE_COLUMNS and c != DATE_COLUMN]
+
+    left = old[['Game_Key', '_Day'] + compare].assign(_Row=np.arange(len(old)))
+    right = new[['Game_Key', '_Day'] + compare].assign(_Row=np.arange(len(new)))
+    merged = left.merge(right, on='Game_Key', how='outer', suffixes=('_Old', '_New'), indicator=True, sort=False)
+
+    added = new.iloc[merged.loc[merged['_merge'] == 'right_only', '_Row_New'].astype(int)]
+    removed = old.iloc[merged.loc[merged['_merge'] == 'left_only', '_Row_Old'].astype(int)]
+    both = merged[merged['_merge'] == 'both']
+    old_rows = both['_Row_Old'].astype(int).to_numpy()
+    new_rows = both['_Row_New'].astype(int).to_numpy()
+    both_keys = old[keys].iloc[old_rows].reset_index(drop=True)
+    both = both.reset_index(drop=True)
+
+    dates_differ = (both['_Day_Old'] != both['_Day_New']).to_numpy()
+    moved = both_keys[dates_differ].assign(
+        Old_Date=old[DATE_COLUMN].to_numpy()[old_rows[dates_differ]],
+        New_Date=new[DATE_COLUMN].to_numpy()[new_rows[dates_differ]],
+        Days_Moved=(both['_Day_New'] - both['_Day_Old']).to_numpy()[dates_differ].astype(np.int64),
+    )
+
+    changes = []
+    for column in compare:
+        before, after = both[f'{column}_Old'], both[f'{column}_New']
+        mask = _changed(before, after, tolerances.get(column, 0)).to_numpy()
+        if mask.any():
+            changes.append(both_keys[mask].assign(Column=column, Old=before[mask].to_numpy(),
+                                                  New=after[mask].to_numpy()))
+    changes = (pd.concat(changes, ignore_index=True) if changes
+               else pd.DataFrame(columns=keys + ['Column', 'Old', 'New']))
+
+    drop = ['_Day', 'Game_Key']
+    return {
+        'keys': keys,
+        'matched': len(both),
+        'added': added.drop(columns=drop).reset_index(drop=True),
+        'removed': removed.drop(columns=drop).reset_index(drop=True),
+        'moved': moved.reset_index(drop=True),
+        'changes': changes,
+    }
+
+
+def fatigue_table(df):
+    """Fatigue rest, components, score and level for every row of a travel table, scored per team-season"""
+    df = df.reset_index(drop=True)
+    groups = [c for c in GROUP_COLUMNS if c in df.columns]
+    codes = df.groupby(groups, sort=False).ngroup().to_numpy() if groups else np.zeros(len(df), dtype=int)
+    days = df['_Day'].to_numpy() if '_Day' in df.columns else day_numbers(df[DATE_COLUMN])
+    order = np.lexsort((days, codes))
+
+    # Lay the team-seasons out as rows of a padded (teams x games) grid; padding only follows real games
+    group = codes[order]
+    counts = np.bincount(group)
+    position = np.arange(len(df)) - np.repeat(np.cumsum(counts) - counts, counts)
+    shape = (len(counts), counts.max() if len(counts) else 0)
+
+    def grid(values):
+        values = np.asarray(values)[order]
+        cells = np.zeros(shape, dtype=values.dtype)
+        cells[group, position] = values
+        return cells
+
+    days_rest = fatigue_model.days_rest_from_dates(grid(days))
+    components = fatigue_model.score_schedule(
+        grid(df['Travel_Distance_Miles'].to_numpy(dtype=float)),
+        grid(df['Timezones_Crossed'].to_numpy(dtype=int)),
+        days_rest,
+        grid((df['Home_Away'] == 'Away').to_numpy()),
+    )
+    result = {}
+    for column, values in {'Days_Rest_Since_Last': days_rest, **components}.items():
+        result[column] = np.empty(len(df), dtype=values.dtype)
+        result[column][order] = values[group, position]
+    result = pd.DataFrame(result, index=df.index)
+    result['Fatigue_Level'] = fatigue_model.fatigue_level(result['Overall_Fatigue_Score'].to_numpy())
+    return result
+
+
+def fatigue_impact(old, new, travel_diff=None):
+    """Games whose fatigue changed between two travel tables, with the cause ('direct' or 'propagated')"""
+    travel_diff = diff_tables(old, new) if travel_diff is None else travel_diff
+    keys, old, new = keyed(old, new)
+    old = pd.concat([old[['Game_Key', DATE_COLUMN]], fatigue_table(old)], axis=1)
+    new = pd.concat([new[keys + ['Game_Key', DATE_COLUMN]], fatigue_table(new)], axis=1)
+    merged = old.merge(new, on='Game_Key', how='inner', suffixes=('_Old', '_New'), sort=False)
+
+    changed = np.zeros(len(merged), dtype=bool)
+    for column in FATIGUE_COLUMNS:
+        changed |= (merged[f'{column}_Old'] != merged[f'{column}_New']).to_numpy()
+    merged = merged[changed]
+
+    direct = pd.concat([travel_diff['moved'][keys], travel_diff['changes'][keys]])
+    is_direct = pd.MultiIndex.from_frame(merged[keys]).isin(pd.MultiIndex.from_frame(direct))
+    impact = merged[keys].assign(
+        Game_Date=merged[f'{DATE_COLUMN}_New'],
+        Old_Score=merged['Overall_Fatigue_Score_Old'],
+        New_Score=merged['Overall_Fatigue_Score_New'],
+        Score_Change=merged['Overall_Fatigue_Score_New'] - merged['Overall_Fatigue_Score_Old'],
+        Old_Level=merged['Fatigue_Level_Old'],
+        New_Level=merged['Fatigue_Level_New'],
+        Old_Rest=merged['Days_Rest_Since_Last_Old'],
+        New_Rest=merged['Days_Rest_Since_Last_New'],
+        Cause=np.where(is_direct, 'direct', 'propagated'),
+    )
+    return impact.sort_values(keys[:-3] + [DATE_COLUMN], kind='stable', ignore_index=True)
+
+
+def synthetic_versions(df, rows, seed=0):
+    """League-sized (old, new) pair built from one season: ~1% moved, ~1% re-routed, ~0.1% dropped and added"""
+    rng = np.random.default_rng(seed)
+    copies = max(1, rows // len(df))
+    old = pd.concat([df] * copies, ignore_index=True)
+    old.insert(1, 'Team', np.repeat([f'Team {i:05d}' for i in range(copies)], len(df)))
+
+    new = old.copy()
+    moved = rng.random(len(new)) < 0.01
+    new.loc[moved, DATE_COLUMN] = (pd.to_datetime(new.loc[moved, DATE_COLUMN]) + pd.Timedelta(days=1)).dt.strftime('%Y-%m-%d')
+    rerouted = (rng.random(len(new)) < 0.01) & (new['Home_Away'] == 'Away').to_numpy()
+    new.loc[rerouted, 'Travel_Distance_Miles'] = (new.loc[rerouted, 'Travel_Distance_Miles'] * 1.1).round(1)
+    dropped = rng.random(len(new)) < 0.001
+    extra = new[dropped].assign(Opponent='Exhibition')
+    new = pd.concat([new[~dropped], extra], ignore_index=True)
+    return old, new
+
+
+def print_rows(title, df, columns, limit=20):
+    print(f"\n{title} ({len(df)})")
+    print("-" * 100)
+    if df.empty:
+        print("  none")
+        return
+    print(df[columns].head(limit).to_string(index=False))
+    if len(df) > limit:
+        print(f"  ... {len(df) - limit} more")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keyed diff of two schedule or metric tables")
+    parser.add_argument('old', nargs='?', default=OLD_FILE)
+    parser.add_argument('new', nargs='?', default=NEW_FILE)
+    parser.add_argument('--scale', type=int, help="Compare synthetic league versions with about this many rows")
+    args = parser.parse_args()
+
+    old, new = read_table(args.old), read_table(args.new)
+    title = f"{args.old} -> {args.new}"
+    if args.scale:
+        old, new = synthetic_versions(old, args.scale)
+        title = f"synthetic league, {len(old):,} -> {len(new):,} rows"
+
+    start = time.perf_counter()
+    diff = diff_tables(old, new)
+    diff_seconds = time.perf_counter() - start
+    scored = all(c in old.columns and c in new.columns
+                 for c in ('Travel_Distance_Miles', 'Timezones_Crossed', 'Home_Away'))
+    start = time.perf_counter()
+    impact = fatigue_impact(old, new, diff) if scored else None
+    impact_seconds = time.perf_counter() - start
+
+    keys = diff['keys']
+    print("=" * 100)
+    print(f"SCHEDULE DIFF - {title}")
+    print("=" * 100)
+    print(f"Key: {' + '.join(keys)}")
+    print(f"Matched: {diff['matched']:,} | Added: {len(diff['added']):,} | Removed: {len(diff['removed']):,} | "
+          f"Moved: {len(diff['moved']):,} | Value changes: {len(diff['changes']):,} | Diff: {diff_seconds:.2f}s")
+
+    game_columns = [c for c in keys[:-1] + [DATE_COLUMN] if c in old.columns]
+    print_rows("➕ ADDED GAMES", diff['added'], game_columns)
+    print_rows("➖ REMOVED GAMES", diff['removed'], game_columns)
+    print_rows("📅 MOVED GAMES", diff['moved'], keys[:-1] + ['Old_Date', 'New_Date', 'Days_Moved'])
+
+    changes = diff['changes']
+    print(f"\n✏️  VALUE CHANGES ({len(changes)})")
+    print("-" * 100)
+    for column, count in changes['Column'].value_counts(sort=False).items():
+        tolerance = TOLERANCES.get(column)
+        print(f"  {column}: {count:,}" + (f" (tolerance {tolerance})" if tolerance else ""))
+    if not changes.empty:
+        print(changes[keys[:-1] + ['Column', 'Old', 'New']].head(20).to_string(index=False))
+
+    if impact is not None:
+        direct = (impact['Cause'] == 'direct').sum()
+        level_changes = (impact['Old_Level'] != impact['New_Level']).sum()
+        print(f"\n🔁 FATIGUE PROPAGATION ({len(impact)} games rescored: {direct} direct, "
+              f"{len(impact) - direct} propagated, {level_changes} change level) | {impact_seconds:.2f}s")
+        print("-" * 100)
+        if impact.empty:
+            print("  no fatigue changes")
+        else:
+            print(impact[keys[:-1] + [DATE_COLUMN, 'Old_Rest', 'New_Rest', 'Old_Score', 'New_Score',
+                                      'Old_Level', 'New_Level', 'Cause']].head(20).to_string(index=False))
+    print("=" * 100)
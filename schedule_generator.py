@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Travel-minimizing conference schedule generator (traveling tournament problem heuristics).
+
+Builds a single or double round-robin conference slate and improves it with
+simulated annealing:
+  - Constructive seeding: circle-method round robins (double = mirrored) for
+    many random team orders; the cheapest seeds start the search.
+  - Local search: the TTP neighborhoods SwapHomes (flip home/away of a
+    pairing), SwapRounds (exchange two rounds) and SwapTeams (exchange two
+    teams' schedules); all keep the slate a valid round robin.
+
+Each team travels venue to venue through road trips and returns home before
+a home game. The objective is total league miles (venues.distance_matrix)
+plus FATIGUE_WEIGHT_MILES per fatigue point, with every team's games scored by
+fatigue_model in one (teams x rounds) batch. Constraint violations are
+penalized: runs of more than MAX_RUN home or away games, rematches in
+consecutive rounds (double), home/away imbalance (single) and home games on a
+team's blackout dates. Rounds are placed on the allowed weekdays of the date
+window with at least MIN_REST_DAYS between them.
+
+Annealing chains are independent and seeded from one SeedSequence, so they
+run in parallel processes and the result is the same for any worker count.
+
+Usage:
+    python3 schedule_generator.py                        # ACC single round robin
+    python3 schedule_generator.py --double --start 2025-11-06 --end 2026-03-08 --weekdays 0,3,6
+    python3 schedule_generator.py --iterations 40000 --chains 16
+"""
+
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+import fatigue_model
+import season_dataset
+import travel_equity
+import travel_modes
+import venues
+
+CONFERENCE = 'ACC'
+SEASON = '2025-2026'
+WINDOW_START = '2025-12-28'
+WINDOW_END = '2026-03-01'
+WEEKDAYS = (3, 6)           # Thursday / Sunday (Monday = 0)
+MIN_REST_DAYS = 2
+MAX_RUN = 3                 # Longest allowed home stand / road trip (games)
+
+FATIGUE_WEIGHT_MILES = 25   # Miles one fatigue point is worth in the objective
+PENALTY_MILES = 5000        # Per constraint violation
+
+# Home games a venue cannot host (team -> ISO dates)
+home_blackouts = {}
+
+CHAINS = 8
+ITERATIONS = 20_000
+SEEDS_PER_CHAIN = 50
+SEED = 2025
+MOVES = ['swap_homes', 'swap_rounds', 'swap_teams']
+
+
+def round_dates(n_rounds, start=WINDOW_START, end=WINDOW_END, weekdays=WEEKDAYS, min_rest=MIN_REST_DAYS):
+    """Earliest allowed dates for the rounds; raises ValueError when the window is too short"""
+    dates = []
+    day = date.fromisoformat(start)
+    while len(dates) < n_rounds and day <= date.fromisoformat(end):
+        if day.weekday() in weekdays and (not dates or (day - dates[-1]).days >= min_rest):
+            dates.append(day)
+        day += timedelta(days=1)
+    if len(dates) < n_rounds:
+        raise ValueError(f"Only {len(dates)} game dates between {start} and {end} for {n_rounds} rounds")
+    return dates
+
+
+def build_context(teams, double=False, start=WINDOW_START, end=WINDOW_END, weekdays=WEEKDAYS,
+                  min_rest=MIN_REST_DAYS, blackouts=None):
+    """Distance / timezone tables, round dates and constraint masks shared by every evaluation"""
+    n = len(teams)
+    size = n + n % 2  # A dummy team gives byes when the conference is odd
+    n_rounds = (size - 1) * (2 if double else 1)
+    dates = round_dates(n_rounds, start, end, weekdays, min_rest)
+    cities = [venues.team_venues[team] for team in teams]
+    blackouts = home_blackouts if blackouts is None else blackouts
+    iso_dates = [d.isoformat() for d in dates]
+    return {
+        'teams': list(teams),
+        'size': size,
+        'double': double,
+        'dates': dates,
+        'day_numbers': np.array([d.toordinal() for d in dates]),
+        'miles': venues.distance_matrix([venues.city_coords[city] for city in cities]),
+        'offsets': np.array([venues.timezone_offsets.get(city, venues.DEFAULT_TIMEZONE) for city in cities]),
+        'blackout': np.array([[d in blackouts.get(team, ()) for d in iso_dates] for team in teams]),
+    }
+
+
+def circle_method(order, double=False):
+    """Round robin (opponent, home) arrays of shape (teams x rounds) for a team order"""
+    size = len(order)
+    n_rounds = size - 1
+    opponent = np.empty((size, n_rounds), dtype=int)
+    home = np.empty((size, n_rounds), dtype=bool)
+    rotating = list(order[1:])
+    for r in range(n_rounds):
+        ring = [order[0]] + rotating[-r:] + rotating[:-r] if r else [order[0]] + rotating
+        for k in range(size // 2):
+            a, b = ring[k], ring[size - 1 - k]
+            a_home = r % 2 == 0  # Alternating sides keeps most teams alternating home / away
+            opponent[a, r], opponent[b, r] = b, a
+            home[a, r], home[b, r] = a_home, not a_home
+    if double:
+        opponent = np.concatenate([opponent, opponent], axis=1)
+        home = np.concatenate([home, ~home], axis=1)
+    return opponent, home
+
+
+def evaluate(opponent, home, context, details=False):
+    """Objective (miles + weighted fatigue + penalties) of a slate; with details, the per-team breakdown"""
+    n = len(context['teams'])
+    teams = np.arange(n)[:, None]
+    opponent, home = opponent[:n], home[:n]
+    plays = opponent < n
+    away = plays & ~home
+
+    # Venue (as a team index) each team is at in each round; byes are spent at home
+    location = np.where(away, opponent, teams)
+    path = np.concatenate([teams, location, teams], axis=1)
+    legs = context['miles'][path[:, :-1], path[:, 1:]]
+    offsets = context['offsets'][path]
+    leg_in = legs[:, :-1]
+    timezones = np.abs(offsets[:, 1:-1] - offsets[:, :-2])
+
+    dates = np.broadcast_to(context['day_numbers'], plays.shape)
+    last_played = np.maximum.accumulate(np.where(plays, dates, -1), axis=1)
+    previous = np.concatenate([np.full((n, 1), -1), last_played[:, :-1]], axis=1)
+    days_rest = np.where(previous < 0, 0, dates - previous)
+    scores = fatigue_model.score_schedule(np.where(away, leg_in, 0.0), np.where(away, timezones, 0),
+                                          days_rest, away)['Overall_Fatigue_Score']
+    scores = np.where(plays, scores, 0)
+
+    # Constraint violations
+    window = MAX_RUN + 1
+    violations = 0
+    for streak in (plays & home, away):
+        counts = np.cumsum(np.pad(streak, ((0, 0), (1, 0))), axis=1)
+        violations += int(((counts[:, window:] - counts[:, :-window]) == window).sum())
+    if context['double']:
+        violations += int((plays[:, 1:] & (opponent[:, 1:] == opponent[:, :-1])).sum()) // 2
+    else:
+        imbalance = np.abs((plays & home).sum(axis=1) - away.sum(axis=1))
+        violations += int(np.maximum(0, imbalance - 1).sum())
+    violations += int((plays & home & context['blackout']).sum())
+
+    total_miles = float(legs.sum())
+    total_fatigue = int(scores.sum())
+    cost = total_miles + FATIGUE_WEIGHT_MILES * total_fatigue + PENALTY_MILES * violations
+    if not details:
+        return cost
+    _, hours, _ = travel_modes.choose_modes(legs.ravel())
+    return {
+        'cost': cost,
+        'miles': total_miles,
+        'fatigue': total_fatigue,
+        'violations': violations,
+        'team_miles': legs.sum(axis=1),
+        'team_hours': hours.reshape(legs.shape).sum(axis=1),
+        'team_fatigue': scores.sum(axis=1) / np.maximum(1, plays.sum(axis=1)),
+        'leg_in': leg_in,
+    }
+
+
+def swap_homes(opponent, home, rng, context):
+    """Flip home / away of every game between two teams"""
+    i, j = rng.choice(context['size'], 2, replace=False)
+    rounds = np.flatnonzero(opponent[i] == j)
+    home[i, rounds] = ~home[i, rounds]
+    home[j, rounds] = ~home[j, rounds]
+
+
+def swap_rounds(opponent, home, rng, context):
+    """Exchange two rounds"""
+    a, b = rng.choice(opponent.shape[1], 2, replace=False)
+    opponent[:, [a, b]] = opponent[:, [b, a]]
+    home[:, [a, b]] = home[:, [b, a]]
+
+
+def swap_teams(opponent, home, rng, context):
+    """Exchange the schedules of two teams (except their games against each other)"""
+    i, j = rng.choice(context['size'], 2, replace=False)
+    rounds = np.flatnonzero(opponent[i] != j)
+    opponents_i, opponents_j = opponent[i, rounds].copy(), opponent[j, rounds].copy()
+    home_i, home_j = home[i, rounds].copy(), home[j, rounds].copy()
+    opponent[i, rounds], opponent[j, rounds] = opponents_j, opponents_i
+    home[i, rounds], home[j, rounds] = home_j, home_i
+    opponent[opponents_j, rounds] = i
+    opponent[opponents_i, rounds] = j
+
+
+def seed_slate(rng, context, n_seeds=SEEDS_PER_CHAIN):
+    """Cheapest of n_seeds circle-method slates over random team orders"""
+    best = None
+    for _ in range(n_seeds):
+        opponent, home = circle_method(rng.permutation(context['size']), context['double'])
+        cost = evaluate(opponent, home, context)
+        if best is None or cost < best[0]:
+            best = (cost, opponent, home)
+    return best
+
+
+def anneal(seed_sequence, context, iterations=ITERATIONS):
+    """One simulated-annealing chain; returns (best cost, opponent, home, seed cost)"""
+    rng = np.random.default_rng(seed_sequence)
+    cost, opponent, home = seed_slate(rng, context)
+    seed_cost = cost
+    best = (cost, opponent.copy(), home.copy())
+    moves = [globals()[name] for name in MOVES]
+    start_temperature = 0.02 * cost
+    end_temperature = 0.0005 * cost
+
+    for step in range(iterations):
+        temperature = start_temperature * (end_temperature / start_temperature) ** (step / iterations)
+        candidate_opponent, candidate_home = opponent.copy(), home.copy()
+        moves[rng.integers(len(moves))](candidate_opponent, candidate_home, rng, context)
+        candidate = evaluate(candidate_opponent, candidate_home, context)
+        if candidate <= cost or rng.random() < math.exp((cost - candidate) / temperature):
+            cost, opponent, home = candidate, candidate_opponent, candidate_home
+            if cost < best[0]:
+                best = (cost, opponent.copy(), home.copy())
+    return best[0], best[1], best[2], seed_cost
+
+
+def generate(context, chains=CHAINS, iterations=ITERATIONS, seed=SEED, workers=None):
+    """Best slate over independent annealing chains; returns (cost, opponent, home, seed costs)"""
+    streams = np.random.SeedSequence(seed).spawn(chains)
+    workers = min(workers or os.cpu_count() or 1, chains)
+    if workers == 1:
+        results = [anneal(s, context, iterations) for s in streams]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(anneal, streams, [context] * chains, [iterations] * chains))
+    cost, opponent, home, _ = min(results, key=lambda result: result[0])
+    return cost, opponent, home, [result[3] for result in results]
+
+
+def slate_table(opponent, home, context):
+    """One row per game: round, date, home team, away team, venue and the away team's leg miles"""
+    teams = context['teams']
+    n = len(teams)
+    leg_in = evaluate(opponent, home, context, details=True)['leg_in']
+    rows = []
+    for r, day in enumerate(context['dates']):
+        for t in range(n):
+            o = opponent[t, r]
+            if o < n and home[t, r]:
+                rows.append({
+                    'Round': r + 1,
+                    'Game_Date': day.isoformat(),
+                    'Home_Team': teams[t],
+                    'Away_Team': teams[o],
+                    'Location': venues.team_venues[teams[t]],
+                    'Away_Travel_Miles': round(float(leg_in[o, r]), 1),
+                })
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a travel-minimizing conference round robin")
+    parser.add_argument('--conference', default=CONFERENCE)
+    parser.add_argument('--season', default=SEASON)
+    parser.add_argument('--double', action='store_true', help="Double (home-and-away) round robin")
+    parser.add_argument('--start', default=WINDOW_START)
+    parser.add_argument('--end', default=WINDOW_END)
+    parser.add_argument('--weekdays', default=','.join(map(str, WEEKDAYS)), help="Allowed weekdays (Monday = 0)")
+    parser.add_argument('--chains', type=int, default=CHAINS)
+    parser.add_argument('--iterations', type=int, default=ITERATIONS)
+    parser.add_argument('--workers', type=int, help="Processes (default: CPU count)")
+    args = parser.parse_args()
+
+    season = season_dataset.season_name(season_dataset.season_start(args.season))
+    teams = travel_equity.conference_members(args.conference, season)
+    weekdays = tuple(int(day) for day in args.weekdays.split(','))
+    context = build_context(teams, args.double, args.start, args.end, weekdays)
+
+    start = time.perf_counter()
+    cost, opponent, home, seed_costs = generate(context, args.chains, args.iterations, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    result = evaluate(opponent, home, context, details=True)
+    slate = slate_table(opponent, home, context)
+    kind = 'double' if args.double else 'single'
+    output_file = f"{season_dataset.slugify(args.conference)}_{kind}_round_robin_{season.replace('-', '_')}.csv"
+    slate.to_csv(output_file, index=False)
+
+    print("=" * 100)
+    print(f"CONFERENCE SCHEDULE GENERATOR - {args.conference} {season} {kind.upper()} ROUND ROBIN")
+    print("=" * 100)
+    print(f"Teams: {len(teams)} | Rounds: {len(context['dates'])} ({context['dates'][0]} to {context['dates'][-1]}) | "
+          f"Games: {len(slate)}")
+    print(f"Chains: {args.chains} x {args.iterations:,} iterations | Time: {elapsed:.1f}s")
+    print(f"Best seed objective: {min(seed_costs):,.0f} | Final objective: {cost:,.0f} "
+          f"({100 * (1 - cost / min(seed_costs)):.1f}% better)")
+    print(f"League miles: {result['miles']:,.0f} | Fatigue points: {result['fatigue']:,} | "
+          f"Constraint violations: {result['violations']}")
+
+    print("\n✈️  TRAVEL BY TEAM")
+    print("-" * 100)
+    for t in np.argsort(-result['team_miles']):
+        print(f"  {teams[t]:16s} {result['team_miles'][t]:8,.0f} mi | {result['team_hours'][t]:6.1f} hrs | "
+              f"fatigue avg {result['team_fatigue'][t]:4.1f}")
+
+    print("\n📅 FIRST ROUNDS")
+    print("-" * 100)
+    for _, row in slate[slate['Round'] <= 2].iterrows():
+        print(f"  R{row['Round']:<2d} {row['Game_Date']} | {row['Away_Team']:16s} at {row['Home_Team']:16s} "
+              f"({row['Away_Travel_Miles']:6,.0f} mi)")
+
+    print(f"\n✅ Schedule saved to: {output_file}")
+    print("=" * 100)
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Concurrent schedule ingestion from fightingirish.com-style (Sidearm) pages.
+
+Fetches the schedule page of many programs concurrently through a pooled
+keep-alive HTTP client built on asyncio streams (standard library only),
+parses the games, and writes one travel-ready CSV per program.
+
+Responses are cached on disk with their ETag / Last-Modified validators and
+the parsed games. Refreshes send conditional requests; a 304 (or a 200 whose
+body hash is unchanged) reuses the cached games without re-parsing. Any URL
+works, including http://127.0.0.1 fixture servers.
+
+Usage:
+    python3 schedule_ingest.py                          # every program in SCHEDULE_PROGRAMS
+    python3 schedule_ingest.py "Notre Dame=http://127.0.0.1:8000/wbball.html"
+"""
+
+import asyncio
+import csv
+import gzip
+import hashlib
+import json
+import os
+import re
+import ssl
+import sys
+import time
+import zlib
+from datetime import date
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit
+
+import season_dataset
+from venues import team_venues
+
+SEASON = '2025-26'
+SCHEDULE_PROGRAMS = {
+    'Notre Dame': 'https://fightingirish.com/sports/wbball/schedule/2025-26',
+}
+CACHE_DIR = '.schedule_cache'
+OUTPUT_DIR = 'ingested_schedules'
+OUTPUT_PATTERN = re.compile(r'^(?P<slug>.+)_(?P<start>\d{4})_(?P<end>\d{2}|\d{4})\.csv$')  # write_games names
+
+MAX_CONCURRENCY = 16        # Requests in flight across all hosts
+MAX_CONNECTIONS_PER_HOST = 4
+TIMEOUT_SECONDS = 20
+MAX_REDIRECTS = 5
+USER_AGENT = 'nd-travel-analysis/1.0 (schedule ingestion)'
+
+# AP-style state abbreviations used on Sidearm schedule pages -> postal codes
+AP_STATES = {
+    'Ala.': 'AL', 'Ariz.': 'AZ', 'Ark.': 'AR', 'Calif.': 'CA', 'Colo.': 'CO', 'Conn.': 'CT',
+    'Del.': 'DE', 'Fla.': 'FL', 'Ga.': 'GA', 'Ill.': 'IL', 'Ind.': 'IN', 'Kan.': 'KS',
+    'Ky.': 'KY', 'La.': 'LA', 'Md.': 'MD', 'Mass.': 'MA', 'Mich.': 'MI', 'Minn.': 'MN',
+    'Miss.': 'MS', 'Mo.': 'MO', 'Mont.': 'MT', 'Neb.': 'NE', 'Nev.': 'NV', 'N.H.': 'NH',
+    'N.J.': 'NJ', 'N.M.': 'NM', 'N.Y.': 'NY', 'N.C.': 'NC', 'N.D.': 'ND', 'Okla.': 'OK',
+    'Ore.': 'OR', 'Pa.': 'PA', 'R.I.': 'RI', 'S.C.': 'SC', 'S.D.': 'SD', 'Tenn.': 'TN',
+    'Texas': 'TX', 'Vt.': 'VT', 'Va.': 'VA', 'Wash.': 'WA', 'W.Va.': 'WV', 'Wis.': 'WI',
+    'Wyo.': 'WY', 'Alaska': 'AK', 'Hawaii': 'HI', 'Idaho': 'ID', 'Iowa': 'IA', 'Maine': 'ME',
+    'Ohio': 'OH', 'Utah': 'UT', 'D.C.': 'DC',
+}
+MONTHS = {m: i for i, m in enumerate(
+    ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'], 1)}
+
+GAME_FIELDS = ['date', 'opponent', 'location', 'home_away']
+
+
+class HttpPool:
+    """Minimal pooled HTTP/1.1 client: keep-alive connections per host, global concurrency cap"""
+
+    def __init__(self, max_concurrency=MAX_CONCURRENCY, per_host=MAX_CONNECTIONS_PER_HOST):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.per_host = per_host
+        self.idle = {}
+        self.host_slots = {}
+        self.ssl_context = ssl.create_default_context()
+
+    async def _connect(self, scheme, host, port):
+        return await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=self.ssl_context if scheme == 'https' else None),
+            TIMEOUT_SECONDS)
+
+    async def _request_once(self, url, headers):
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'http'
+        port = parts.port or (443 if scheme == 'https' else 80)
+        key = (scheme, parts.hostname, port)
+        path = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+        slots = self.host_slots.setdefault(key, asyncio.Semaphore(self.per_host))
+
+        request = [f"GET {path} HTTP/1.1", f"Host: {parts.netloc}", f"User-Agent: {USER_AGENT}",
+                   "Accept-Encoding: gzip, deflate", "Connection: keep-alive"]
+        request = ("\r\n".join(request + [f"{name}: {value}" for name, value in headers.items()])
+                   + "\r\n\r\n").encode('latin-1')
+
+        async with self.semaphore, slots:
+            idle = self.idle.setdefault(key, [])
+            while True:
+                reused = bool(idle)
+                reader, writer = idle.pop() if idle else await self._connect(*key)
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    status, response_headers, body = await asyncio.wait_for(_read_response(reader),
+                                                                            TIMEOUT_SECONDS)
+                except BaseException as e:
+                    writer.close()
+                    # A stale keep-alive connection is retried on the next idle one or a fresh one
+                    if reused and isinstance(e, (ConnectionError, asyncio.IncompleteReadError)):
+                        continue
+                    raise
+                break
+
+            if response_headers.get('connection', '').lower() == 'close':
+                writer.close()
+            else:
+                idle.append((reader, writer))
+        return status, response_headers, body
+
+    async def get(self, url, headers=None):
+        """GET a URL, following redirects; returns (final url, status, headers, body)"""
+        for _ in range(MAX_REDIRECTS + 1):
+            status, response_headers, body = await self._request_once(url, headers or {})
+            if status in (301, 302, 303, 307, 308) and 'location' in response_headers:
+                url = urljoin(url, response_headers['location'])
+                continue
+            return url, status, response_headers, body
+        raise RuntimeError(f"Too many redirects for {url}")
+
+    async def close(self):
+        """Close every idle connection"""
+        for connections in self.idle.values():
+            for _, writer in connections:
+                writer.close()
+        self.idle.clear()
+
+
+async def _read_response(reader):
+    """Read one HTTP/1.1 response (content-length or chunked) and decode its body"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("Connection closed before response")
+    status = int(status_line.split()[1])
+    headers = {}
+    while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    if status in (204, 304) or 100 <= status < 200:
+        body = b''
+    elif headers.get('transfer-encoding', '').lower() == 'chunked':
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        body = b''.join(chunks)
+    elif 'content-length' in headers:
+        body = await reader.readexactly(int(headers['content-length']))
+    else:
+        body = await reader.read()
+        headers['connection'] = 'close'
+
+    encoding = headers.get('content-encoding', '').lower()
+    if encoding == 'gzip':
+        body = gzip.decompress(body)
+    elif encoding == 'deflate':
+        body = zlib.decompress(body)
+    return status, headers, body
+
+
+class SidearmScheduleParser(HTMLParser):
+    """Collect games from a Sidearm schedule page (li.sidearm-schedule-game entries)"""
+
+    FIELD_CLASSES = {
+        'sidearm-schedule-game-opponent-name': 'opponent',
+        'sidearm-schedule-game-opponent-date': 'date',
+        'sidearm-schedule-game-location': 'location',
+    }
+    HOME_AWAY_CLASSES = {
+        'sidearm-schedule-home-game': 'Home',
+        'sidearm-schedule-away-game': 'Away',
+        'sidearm-schedule-neutral-game': 'Neutral',
+    }
+    VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'wbr'}
+
+    def __init__(self):
+        super().__init__()
+        self.games = []
+        self.current = None
+        self.stack = []  # (tag, field or None, starts a game)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_TAGS:
+            return
+        classes = (dict(attrs).get('class') or '').split()
+        starts_game = tag == 'li' and 'sidearm-schedule-game' in classes
+        if starts_game:
+            home_away = next((v for c, v in self.HOME_AWAY_CLASSES.items() if c in classes), 'Neutral')
+            self.current = {'opponent': '', 'date': '', 'location': '', 'home_away': home_away}
+        field = next((v for c, v in self.FIELD_CLASSES.items() if c in classes), None)
+        self.stack.append((tag, field, starts_game))
+
+    def handle_endtag(self, tag):
+        while self.stack:
+            open_tag, _, starts_game = self.stack.pop()
+            if starts_game and self.current is not None:
+                self.games.append({k: ' '.join(v.split()) if isinstance(v, str) else v
+                                   for k, v in self.current.items()})
+                self.current = None
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self.current is None:
+            return
+        field = next((f for _, f, _ in reversed(self.stack) if f), None)
+        # Locations list the city first, then the arena; keep only the city
+        if field and not (field == 'location' and self.current[field].strip()):
+            self.current[field] += ' ' + data
+
+
+def normalize_location(text):
+    """'South Bend, Ind.' -> 'South Bend, IN' (venue names after a slash/dash are dropped)"""
+    text = re.split(r'\s+[/|]\s+|\s+-\s+', text)[0].strip()
+    city, _, state = text.rpartition(',')
+    if not city:
+        return text
+    state = state.strip()
+    return f"{city.strip()}, {AP_STATES.get(state, state.upper() if len(state) == 2 else state)}"
+
+
+def parse_game_date(text, season=SEASON):
+    """'Nov 5 (Wed)' -> ISO date, inferring the year from the season (Aug-Dec = first year)"""
+    match = re.search(r'([A-Z][a-z]{2})[a-z]*\.?\s+(\d{1,2})', text)
+    if not match or match.group(1) not in MONTHS:
+        raise ValueError(f"Unrecognized game date '{text}'")
+    month, day = MONTHS[match.group(1)], int(match.group(2))
+    start_year = int(season[:4])
+    return date(start_year if month >= 8 else start_year + 1, month, day).isoformat()
+
+
+def parse_schedule(html, season=SEASON, home_location=None):
+    """Games ({date, opponent, location, home_away}) from a schedule page"""
+    parser = SidearmScheduleParser()
+    parser.feed(html)
+    parser.close()
+    games = []
+    for game in parser.games:
+        if not game['date']:
+            continue
+        opponent = re.sub(r'^(vs\.?|at|@)\s+', '', game['opponent'], flags=re.IGNORECASE)
+        location = normalize_location(game['location'])
+        if game['home_away'] == 'Home' and home_location:
+            location = home_location
+        games.append({'date': parse_game_date(game['date'], season), 'opponent': opponent,
+                      'location': location, 'home_away': game['home_away']})
+    return sorted(games, key=lambda g: g['date'])
+
+
+class ResponseCache:
+    """On-disk cache of validators, body hash and parsed games per URL"""
+
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha256(url.encode()).hexdigest() + '.json')
+
+    def get(self, url):
+        try:
+            with open(self._path(url)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url, entry):
+        tmp = self._path(url) + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(entry, f)
+        os.replace(tmp, self._path(url))
+
+
+async def ingest_program(pool, cache, program, url, season=SEASON, home_location=None):
+    """Fetch (conditionally) and parse one program's schedule; returns (games, status)"""
+    cached = cache.get(url)
+    headers = {}
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    _, status, response_headers, body = await pool.get(url, headers)
+    if status == 304 and cached:
+        return cached['games'], 'not modified'
+    if status != 200:
+        raise RuntimeError(f"{program}: HTTP {status} from {url}")
+
+    body_hash = hashlib.sha256(body).hexdigest()
+    if cached and cached.get('body_hash') == body_hash:
+        games, outcome = cached['games'], 'unchanged'
+    else:
+        charset = re.search(r'charset=([\w-]+)', response_headers.get('content-type', ''))
+        games = parse_schedule(body.decode(charset.group(1) if charset else 'utf-8', 'replace'),
+                               season, home_location)
+        outcome = 'parsed'
+    cache.put(url, {
+        'program': program,
+        'etag': response_headers.get('etag'),
+        'last_modified': response_headers.get('last-modified'),
+        'body_hash': body_hash,
+        'games': games,
+    })
+    return games, outcome
+
+
+def write_games(program, games, output_dir=OUTPUT_DIR, season=SEASON):
+    """Write one program's games as a CSV the travel pipeline can read"""
+    os.makedirs(output_dir, exist_ok=True)
+    slug = re.sub(r'[^a-z0-9]+', '_', program.lower()).strip('_')
+    path = os.path.join(output_dir, f"{slug}_{season.replace('-', '_')}.csv")
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=GAME_FIELDS)
+        writer.writeheader()
+        writer.writerows(games)
+    return path
+
+
+def ingested_team(path):
+    """(team, season) for a write_games file, None if the name does not follow the convention"""
+    match = OUTPUT_PATTERN.match(os.path.basename(path))
+    if not match:
+        return None
+    teams = {season_dataset.slugify(team): team for team in team_venues}
+    team = teams.get(match['slug'], match['slug'].replace('_', ' ').title())
+    return team, season_dataset.season_name(int(match['start']))
+
+
+async def ingest_all(programs, season=SEASON, cache_dir=CACHE_DIR, home_locations=None):
+    """Refresh every program concurrently; returns {program: (games, outcome or exception)}"""
+    pool = HttpPool()
+    cache = ResponseCache(cache_dir)
+    home_locations = home_locations or {}
+    try:
+        results = await asyncio.gather(
+            *(ingest_program(pool, cache, program, url, season, home_locations.get(program))
+              for program, url in programs.items()),
+            return_exceptions=True)
+    finally:
+        await pool.close()
+    return {program: ((None, result) if isinstance(result, BaseException) else result)
+            for program, result in zip(programs, results)}
+
+
+if __name__ == "__main__":
+    programs = dict(arg.split('=', 1) for arg in sys.argv[1:]) or SCHEDULE_PROGRAMS
+
+    start = time.perf_counter()
+    results = asyncio.run(ingest_all(programs, home_locations={'Notre Dame': 'South Bend, IN'}))
+    elapsed = time.perf_counter() - start
+
+    print("=" * 100)
+    print(f"SCHEDULE INGESTION - {len(programs)} PROGRAM(S), SEASON {SEASON}")
+    print("=" * 100)
+    for program, (games, outcome) in results.items():
+        if games is None:
+            print(f"❌ {program}: {outcome}")
+            continue
+        path = write_games(program, games)
+        print(f"✓ {program}: {len(games)} games ({outcome}) → {path}")
+    print(f"\nCompleted in {elapsed:.2f}s")
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Typed schedule / fatigue CSV loader with a parsed-frame sidecar cache.
+
+load_csv() reads a travel or fatigue table with an explicit schema instead of
+dtype inference: int32 counts and scores, float32 distances and durations,
+categorical labels (Home_Away, Travel_Direction, Fatigue_Level, Location,
+Opponent, ...) and Game_Date parsed once to datetime64. The 'None' travel
+mode stays a string. Columns not in SCHEMA keep pandas' inferred dtype.
+
+The parsed frame is pickled next to the CSV (<file>.parsed.pkl) with the
+file's size, mtime and SHA-256, one frame per schema the file is loaded
+with. A later load with the same size and mtime returns the cached frame
+without reading the CSV; if only the mtime changed (a checkout or an
+identical rewrite), the content hash decides. Cache writes
+go through a temporary file and os.replace, so concurrent build stages never
+see a partial sidecar.
+
+Usage:
+    python3 schedule_loader.py                 # time cold vs cached loads of the season files
+    python3 schedule_loader.py some_file.csv
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import time
+
+import pandas as pd
+
+CACHE_SUFFIX = '.parsed.pkl'
+CACHE_VERSION = 1
+DATE_COLUMNS = ['Game_Date']
+
+SCHEMA = {
+    # Counts and integer scores
+    'Game_Number': 'int32',
+    'Days_Rest_Since_Last': 'int32',
+    'Timezones_Crossed': 'int32',
+    'Travel_Fatigue_Component': 'int32',
+    'Timezone_Fatigue_Component': 'int32',
+    'Rest_Fatigue_Component': 'int32',
+    'Consecutive_Game_Fatigue': 'int32',
+    'Overall_Fatigue_Score': 'int32',
+    # Metrics
+    'Travel_Distance_Miles': 'float32',
+    'Travel_Duration_Hours': 'float32',
+    'Cumulative_Distance_Miles': 'float32',
+    'Cumulative_Hours': 'float32',
+    # Labels
+    'Sport': 'category',
+    'Opponent': 'category',
+    'Location': 'category',
+    'Home_Away': 'category',
+    'Travel_Direction': 'category',
+    'Travel_Mode': 'category',
+    'Fatigue_Level': 'category',
+}
+
+DEFAULT_FILES = [
+    'nd_womens_basketball_2025_2026.csv',
+    'nd_womens_basketball_2025_2026_with_fatigue_metrics.csv',
+]
+
+
+def file_sha256(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def parse_csv(path, schema=SCHEMA, date_columns=DATE_COLUMNS):
+    """Read a CSV with the typed schema (no caching)"""
+    df = pd.read_csv(path, dtype=schema, keep_default_na=False, na_values=[''])
+    for column in date_columns:
+        if column in df:
+            df[column] = pd.to_datetime(df[column], format='ISO8601')
+    return df
+
+
+def _read_cache(cache_path):
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+
+def _write_cache(cache_path, entry):
+    temporary = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temporary, 'wb') as f:
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary, cache_path)
+
+
+def load_csv(path, schema=SCHEMA, date_columns=DATE_COLUMNS, cache=True):
+    """Typed DataFrame for a CSV, served from its sidecar cache while the file is unchanged"""
+    if not cache:
+        return parse_csv(path, schema, date_columns)
+    stat = os.stat(path)
+    cache_path = path + CACHE_SUFFIX
+    key = repr((CACHE_VERSION, sorted(schema.items()), list(date_columns)))
+    cached = _read_cache(cache_path)
+    if (cached is not None and cached['size'] == stat.st_size and cached['mtime_ns'] != stat.st_mtime_ns
+            and cached['sha256'] == file_sha256(path)):
+        # Same content under a new mtime (a checkout or an identical rewrite)
+        cached['mtime_ns'] = stat.st_mtime_ns
+        _write_cache(cache_path, cached)
+    if cached is None or (cached['size'], cached['mtime_ns']) != (stat.st_size, stat.st_mtime_ns):
+        cached = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': file_sha256(path), 'frames': {}}
+    elif key in cached['frames']:
+        return cached['frames'][key].copy()
+
+    # One sidecar per file; each schema it is loaded with keeps its own parsed frame
+    df = parse_csv(path, schema, date_columns)
+    cached['frames'][key] = df
+    _write_cache(cache_path, cached)
+    return df.copy()
+
+
+if __name__ == "__main__":
+    files = sys.argv[1:] or DEFAULT_FILES
+    print("=" * 100)
+    print("TYPED CSV LOADER")
+    print("=" * 100)
+    for path in files:
+        start = time.perf_counter()
+        inferred = pd.read_csv(path)
+        for column in DATE_COLUMNS:
+            if column in inferred:
+                inferred[column] = pd.to_datetime(inferred[column])
+        default_time = time.perf_counter() - start
+
+        if os.path.exists(path + CACHE_SUFFIX):
+            os.remove(path + CACHE_SUFFIX)
+        start = time.perf_counter()
+        load_csv(path)
+        cold_time = time.perf_counter() - start
+        start = time.perf_counter()
+        df = load_csv(path)
+        cached_time = time.perf_counter() - start
+
+        print(f"\n📄 {path}: {len(df)} rows x {len(df.columns)} columns")
+        print("-" * 100)
+        print(f"  read_csv + to_datetime: {default_time * 1000:6.2f} ms | typed parse: {cold_time * 1000:6.2f} ms | "
+              f"cached: {cached_time * 1000:6.2f} ms")
+        print(f"  Memory: {inferred.memory_usage(deep=True).sum() / 1024:.1f} KB inferred -> "
+              f"{df.memory_usage(deep=True).sum() / 1024:.1f} KB typed")
+    print("=" * 100)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Watch mode: recompute what a schedule edit affects as soon as the edit lands.
+
+The watcher polls the schedule and venue inputs with os.stat (size and
+mtime), so an idle loop costs a handful of stat calls per POLL_SECONDS and
+never imports pandas. A burst of edits is debounced: recomputation starts
+once no file has changed for DEBOUNCE_SECONDS (or MAX_DELAY_SECONDS after
+the first edit of a long burst). Each batch runs in a fresh subprocess,
+which picks up edited code such as the venue table and returns its memory
+when done.
+
+Watched inputs and what a change recomputes:
+  - PIPELINE_INPUTS (the Notre Dame schedule in fix_virginia_geocoding.py,
+    venues.py, the road graph): build_graph.build(), which reruns only the
+    stages whose inputs changed: travel, fatigue, validation, the figures
+    and reports.
+  - INGESTED_DIR/<team>_<yyyy>_<yy>.csv (schedule_ingest.py output): that
+    team's travel and fatigue rows, validation and dataset partitions, then
+    the rollup cube's changed partitions. A venues.py edit reprices every
+    ingested team.
+
+Old and new travel tables are compared with schedule_diff.fatigue_impact, so
+only the games whose fatigue changed are reported (direct or propagated).
+A game that newly reaches VERY HIGH raises an alert, printed and appended
+to ALERT_FILE.
+
+Usage:
+    python3 schedule_watch.py                  # watch until Ctrl-C
+    python3 schedule_watch.py --once           # recompute everything watched, once
+    python3 schedule_watch.py --poll 5 --debounce 10
+"""
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+import time
+
+POLL_SECONDS = 1.0
+DEBOUNCE_SECONDS = 2.0
+MAX_DELAY_SECONDS = 30.0
+
+PIPELINE_INPUTS = ['fix_virginia_geocoding.py', 'venues.py', 'road_graph.gr']
+VENUE_FILE = 'venues.py'
+INGESTED_DIR = 'ingested_schedules'  # schedule_ingest.OUTPUT_DIR (not imported: the idle loop stays pandas-free)
+ALERT_FILE = 'fatigue_alerts.log'
+ALERT_LEVEL = 'VERY HIGH'
+
+
+def watched_files():
+    """Every schedule / venue input currently watched"""
+    return PIPELINE_INPUTS + sorted(glob.glob(os.path.join(INGESTED_DIR, '*.csv')))
+
+
+def snapshot(paths):
+    """{path: (size, mtime_ns)}, None for missing files"""
+    stamps = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stamps[path] = (stat.st_size, stat.st_mtime_ns)
+        except FileNotFoundError:
+            stamps[path] = None
+    return stamps
+
+
+def changed_paths(before, after):
+    """Paths added, removed or modified between two snapshots"""
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def watch(poll_seconds=POLL_SECONDS, debounce_seconds=DEBOUNCE_SECONDS, max_delay_seconds=MAX_DELAY_SECONDS):
+    """Poll forever, running one debounced update subprocess per burst of edits"""
+    stamps = snapshot(watched_files())
+    pending, first_change, last_change = set(), None, None
+    print(f"Watching {len(stamps)} file(s) every {poll_seconds:g}s (debounce {debounce_seconds:g}s)", flush=True)
+    while True:
+        time.sleep(poll_seconds)
+        current = snapshot(watched_files())
+        changes = changed_paths(stamps, current)
+        stamps = current
+        now = time.monotonic()
+        if changes:
+            pending |= changes
+            first_change = first_change or now
+            last_change = now
+        if pending and (now - last_change >= debounce_seconds or now - first_change >= max_delay_seconds):
+            print(f"\n{time.strftime('%Y-%m-%d %H:%M:%S')} - {len(pending)} changed: {', '.join(sorted(pending))}",
+                  flush=True)
+            subprocess.run([sys.executable, os.path.abspath(__file__), '--update', *sorted(pending)])
+            pending, first_change, last_change = set(), None, None
+
+
+def impact_alerts(old, new, label):
+    """(fatigue impact table or None, alert lines) for games that newly reach ALERT_LEVEL in the new table"""
+    import pandas as pd
+    import schedule_diff
+
+    if old is None or old.empty:
+        impact = None
+        scored = new.reset_index(drop=True).assign(Previous_Level=None)
+    else:
+        impact = schedule_diff.fatigue_impact(old, new)
+        _, old_keyed, scored = schedule_diff.keyed(old, new)
+        old_levels = pd.Series(schedule_diff.fatigue_table(old_keyed)['Fatigue_Level'].to_numpy(),
+                               index=old_keyed['Game_Key'])
+        scored = scored.assign(Previous_Level=scored['Game_Key'].map(old_levels))
+    scored = pd.concat([scored, schedule_diff.fatigue_table(scored)[['Overall_Fatigue_Score', 'Fatigue_Level']]],
+                       axis=1)
+    newly = scored[(scored['Fatigue_Level'] == ALERT_LEVEL) & (scored['Previous_Level'] != ALERT_LEVEL)]
+    alerts = [f"{label}: {row['Game_Date']} {row['Home_Away']} vs {row['Opponent']} is now {ALERT_LEVEL} "
+              f"(score {row['Overall_Fatigue_Score']}, "
+              f"{'was ' + row['Previous_Level'] if isinstance(row['Previous_Level'], str) else 'new game'})"
+              for _, row in newly.iterrows()]
+    return impact, alerts
+
+
+def update_pipeline():
+    """Rebuild the stale pipeline stages; returns (stage results, fatigue impact, alerts)"""
+    import build_graph
+    import schedule_diff
+
+    travel_file = build_graph.TRAVEL_FILE
+    old = schedule_diff.read_table(travel_file) if os.path.exists(travel_file) else None
+    results = build_graph.build()
+    new = schedule_diff.read_table(travel_file)
+    impact, alerts = impact_alerts(old, new, 'Notre Dame')
+    return results, impact, alerts
+
+
+def update_team(path):
+    """Recompute one ingested team's travel, fatigue, validation and dataset partitions"""
+    import pandas as pd
+    import schedule_diff
+    import schedule_ingest
+    import season_dataset
+    import travel_engine
+    from venues import HOME_LOCATION, team_venues
+
+    team, season = schedule_ingest.ingested_team(path)
+    home = team_venues.get(team, HOME_LOCATION)
+    partition = season_dataset.partition_path(travel_engine.SPORT, season, team)
+    travel_path = os.path.join(partition, 'travel.csv')
+    old = schedule_diff.read_table(travel_path) if os.path.exists(travel_path) else None
+
+    if os.path.exists(path):
+        games = pd.read_csv(path, keep_default_na=False).to_dict('records')
+    else:
+        games = []
+    games.sort(key=lambda game: game['date'])
+    travel_rows = travel_engine.build_travel_rows(games, home_location=home)
+    fatigue_rows = travel_engine.build_fatigue_rows(travel_rows)
+    validation = travel_engine.validate_schedule(travel_rows, fatigue_rows, home_location=home)
+    new = pd.DataFrame(travel_rows, columns=travel_engine.TRAVEL_FIELDS)
+    season_dataset.write_partition(new, 'travel', travel_engine.SPORT, season, team)
+    season_dataset.write_partition(pd.DataFrame(fatigue_rows, columns=travel_engine.FATIGUE_FIELDS), 'fatigue',
+                                   travel_engine.SPORT, season, team)
+    impact, alerts = impact_alerts(old, new, f"{team} {season}")
+    return team, season, validation, impact, alerts
+
+
+def update(paths):
+    """Recompute everything the changed paths affect and report it"""
+    import rollup_cube
+    import schedule_ingest
+
+    pipeline = [path for path in paths if path in PIPELINE_INPUTS]
+    teams = [path for path in paths
+             if os.path.dirname(path) == INGESTED_DIR and schedule_ingest.ingested_team(path)]
+    if VENUE_FILE in paths:
+        teams = sorted(set(teams) | {path for path in glob.glob(os.path.join(INGESTED_DIR, '*.csv'))
+                                     if schedule_ingest.ingested_team(path)})
+    alerts = []
+
+    print("=" * 100)
+    print(f"SCHEDULE WATCH - {len(paths)} CHANGED INPUT(S)")
+    print("=" * 100)
+    if pipeline:
+        start = time.perf_counter()
+        results, impact, pipeline_alerts = update_pipeline()
+        ran = [name for name, (status, _) in results.items() if status == 'ran']
+        failed = [name for name, (status, _) in results.items() if status in ('failed', 'blocked')]
+        print(f"\n🔁 Pipeline ({time.perf_counter() - start:.1f}s): ran {', '.join(ran) or 'nothing'}"
+              + (f" | ❌ {', '.join(failed)}" if failed else ""))
+        print_impact(impact)
+        alerts += pipeline_alerts
+
+    for path in teams:
+        team, season, validation, impact, team_alerts = update_team(path)
+        print(f"\n🏀 {team} {season} ({path}): "
+              f"{'valid' if validation['valid'] else str(len(validation['errors'])) + ' error(s)'}, "
+              f"{len(validation['warnings'])} warning(s)")
+        for error in validation['errors']:
+            print(f"  ❌ {error}")
+        print_impact(impact)
+        alerts += team_alerts
+    if teams:
+        rollup_cube.load_cube(verbose=True)
+
+    print(f"\n🚨 {len(alerts)} new {ALERT_LEVEL} alert(s)")
+    print("-" * 100)
+    stamp = time.strftime('%Y-%m-%d %H:%M:%S')
+    with open(ALERT_FILE, 'a') as f:
+        for alert in alerts:
+            print(f"  {alert}")
+            f.write(f"{stamp} {alert}\n")
+    print("=" * 100)
+    return alerts
+
+
+def print_impact(impact):
+    if impact is None:
+        print("  First run for this schedule: every game scored")
+        return
+    print(f"  {len(impact)} game(s) with changed fatigue")
+    for _, row in impact.iterrows():
+        print(f"    {row['Game_Date']} {row['Home_Away']:7s} vs {row['Opponent']:20s} "
+              f"{row['Old_Score']:3d} -> {row['New_Score']:3d} ({row['Old_Level']} -> {row['New_Level']}, {row['Cause']})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute affected outputs when schedule or venue inputs change")
+    parser.add_argument('--poll', type=float, default=POLL_SECONDS, help="seconds between polls")
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE_SECONDS, help="quiet seconds before recomputing")
+    parser.add_argument('--once', action='store_true', help="recompute every watched input once and exit")
+    parser.add_argument('--update', nargs='+', metavar='PATH', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.update or args.once:
+        update(args.update or watched_files())
+    else:
+        try:
+            watch(args.poll, args.debounce)
+        except KeyboardInterrupt:
+            print("\nStopped")
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Partitioned multi-season schedule dataset.
+
+Season files live in a hive-style layout partitioned by sport, season and team:
+
+    dataset/sport=womens_basketball/season=2025-2026/team=notre_dame/travel.csv
+                                                                    /fatigue.csv
+
+read_dataset() prunes partitions from the directory names alone, so a query
+like "ACC teams, 2019-2026, away games only" only opens the matching files:
+
+    read_dataset('travel', seasons=(2019, 2026), conference='ACC',
+                 where={'Home_Away': 'Away'})
+
+Seasons are identified by their starting year (2025 = the 2025-2026 season).
+"""
+
+import os
+import re
+import sys
+
+import pandas as pd
+
+DATASET_ROOT = 'dataset'
+KINDS = ('travel', 'fatigue')
+
+sports = {
+    'womens_basketball': "Women's Basketball",
+    'mens_basketball': "Men's Basketball",
+}
+
+# Legacy file prefixes (nd_womens_basketball_2025_2026.csv) -> team
+file_team_prefixes = {
+    'nd': 'Notre Dame',
+}
+
+# Legacy file suffixes -> dataset kind
+file_kinds = {
+    '': 'travel',
+    '_with_fatigue_metrics': 'fatigue',
+}
+
+# Conference membership by season start year: (conference, first season, last season or None)
+conference_membership = {
+    "Notre Dame": [("Big East", 1995, 2012), ("ACC", 2013, None)],
+    "Boston College": [("ACC", 2005, None)],
+    "California": [("Pac-12", 1959, 2023), ("ACC", 2024, None)],
+    "Clemson": [("ACC", 1953, None)],
+    "Duke": [("ACC", 1953, None)],
+    "Florida State": [("ACC", 1991, None)],
+    "Georgia Tech": [("ACC", 1979, None)],
+    "Louisville": [("AAC", 2013, 2013), ("ACC", 2014, None)],
+    "Miami": [("ACC", 2004, None)],
+    "NC State": [("ACC", 1953, None)],
+    "North Carolina": [("ACC", 1953, None)],
+    "Pittsburgh": [("Big East", 1982, 2012), ("ACC", 2013, None)],
+    "SMU": [("AAC", 2013, 2023), ("ACC", 2024, None)],
+    "Stanford": [("Pac-12", 1959, 2023), ("ACC", 2024, None)],
+    "Syracuse": [("Big East", 1979, 2012), ("ACC", 2013, None)],
+    "Virginia": [("ACC", 1953, None)],
+    "Virginia Tech": [("ACC", 2004, None)],
+    "Wake Forest": [("ACC", 1953, None)],
+    "Marquette": [("Big East", 2005, None)],
+    "UConn": [("AAC", 2013, 2019), ("Big East", 2020, None)],
+    "Penn State": [("Big Ten", 1992, None)],
+    "Michigan State": [("Big Ten", 1950, None)],
+    "Oklahoma": [("Big 12", 1996, 2023), ("SEC", 2024, None)],
+    "South Carolina": [("SEC", 1991, None)],
+    "Temple": [("AAC", 2013, None)],
+    "Western Michigan": [("MAC", 1948, None)],
+    "Niagara": [("MAAC", 1989, None)],
+    "Lehigh": [("Patriot", 1990, None)],
+    "UC Davis": [("Big West", 2007, None)],
+}
+
+
+def slugify(name):
+    """'Notre Dame' -> 'notre_dame'"""
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+
+def sport_key(sport):
+    """Partition key for a sport given by key or display name ("Women's Basketball" -> 'womens_basketball')"""
+    if sport in sports:
+        return sport
+    return next((key for key, name in sports.items() if name == sport), slugify(sport))
+
+
+def season_name(start_year):
+    """2025 -> '2025-2026'"""
+    return f"{start_year}-{start_year + 1}"
+
+
+def season_of(days):
+    """Season name for each day number (days since 1970-01-01; seasons start in August)"""
+    dates = pd.to_datetime(pd.Index(days, dtype='int64'), unit='D')
+    return [season_name(year) for year in dates.year - (dates.month < 8)]
+
+
+def season_start(season):
+    """Starting year of a season given as 2025, '2025', '2025-26' or '2025-2026'"""
+    return int(str(season)[:4])
+
+
+def conference_of(team, season):
+    """Conference a team played in during a season (None if unknown)"""
+    year = season_start(season)
+    for conference, first, last in conference_membership.get(team, []):
+        if first <= year and (last is None or year <= last):
+            return conference
+    return None
+
+
+def partition_path(sport, season, team, root=DATASET_ROOT):
+    """Directory of one sport / season / team partition"""
+    return os.path.join(root, f"sport={sport_key(sport)}", f"season={season_name(season_start(season))}",
+                        f"team={slugify(team)}")
+
+
+def write_partition(df, kind, sport, season, team, root=DATASET_ROOT):
+    """Write one team-season table into the dataset; returns the file path"""
+    if kind not in KINDS:
+        raise ValueError(f"Unknown dataset kind '{kind}' (expected one of {KINDS})")
+    directory = partition_path(sport, season, team, root)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{kind}.csv")
+    df.to_csv(path, index=False)
+    return path
+
+
+def _partition_values(directory, key):
+    """(value, path) for each key=value subdirectory"""
+    if not os.path.isdir(directory):
+        return []
+    prefix = f"{key}="
+    return sorted((entry.name[len(prefix):], entry.path) for entry in os.scandir(directory)
+                  if entry.is_dir() and entry.name.startswith(prefix))
+
+
+def _season_matches(season, seasons):
+    """seasons: None, an inclusive (first, last) start-year range, or a list of seasons"""
+    if seasons is None:
+        return True
+    year = season_start(season)
+    if isinstance(seasons, tuple) and len(seasons) == 2:
+        return seasons[0] <= year <= seasons[1]
+    return year in {season_start(s) for s in seasons}
+
+
+def list_partitions(root=DATASET_ROOT, sport=None, seasons=None, teams=None, conference=None):
+    """Partitions matching the predicates, pruned level by level from directory names"""
+    sport_keys = None if sport is None else {sport_key(s) for s in ([sport] if isinstance(sport, str) else sport)}
+    team_keys = None if teams is None else {slugify(t) for t in ([teams] if isinstance(teams, str) else teams)}
+    team_names = {slugify(name): name for name in conference_membership}
+
+    partitions = []
+    for key, sport_dir in _partition_values(root, 'sport'):
+        if sport_keys is not None and key not in sport_keys:
+            continue
+        for season, season_dir in _partition_values(sport_dir, 'season'):
+            if not _season_matches(season, seasons):
+                continue
+            for team_key, team_dir in _partition_values(season_dir, 'team'):
+                if team_keys is not None and team_key not in team_keys:
+                    continue
+                team = team_names.get(team_key, team_key)
+                if conference is not None and conference_of(team, season) != conference:
+                    continue
+                partitions.append({'sport': sports.get(key, key), 'season': season,
+                                   'team': team, 'path': team_dir})
+    return partitions
+
+
+def read_dataset(kind='travel', root=DATASET_ROOT, sport=None, seasons=None, teams=None,
+                 conference=None, where=None, columns=None):
+    """Concatenate the matching partitions' tables, tagged with Sport / Season / Team columns.
+
+    where maps column -> value (or list of values) and is applied to each file as it is read.
+    """
+    where = where or {}
+    # Filter columns are read even when not selected, then dropped
+    filter_only = [] if columns is None else [column for column in where if column not in columns]
+    usecols = None if columns is None else list(columns) + filter_only
+    frames = []
+    for partition in list_partitions(root, sport, seasons, teams, conference):
+        path = os.path.join(partition['path'], f"{kind}.csv")
+        if not os.path.exists(path):
+            continue
+        df = pd.read_csv(path, usecols=usecols)
+        for column, value in where.items():
+            df = df[df[column].isin(value if isinstance(value, (list, tuple, set)) else [value])]
+        df = df.drop(columns=filter_only)
+        df.insert(0, 'Team', partition['team'])
+        df.insert(0, 'Season', partition['season'])
+        if 'Sport' not in df.columns:
+            df.insert(0, 'Sport', partition['sport'])
+        frames.append(df)
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)
+
+
+def season_files(directory='.'):
+    """(kind, sport, season, team, path) for conventionally named season files (nd_womens_basketball_2025_2026*.csv)"""
+    pattern = re.compile(r'^(?P<prefix>[a-z]+)_(?P<sport>%s)_(?P<start>\d{4})_(?P<end>\d{4})(?P<suffix>.*)\.csv$'
+                         % '|'.join(sports))
+    for name in sorted(os.listdir(directory)):
+        match = pattern.match(name)
+        if not match or match['prefix'] not in file_team_prefixes or match['suffix'] not in file_kinds:
+            continue
+        yield (file_kinds[match['suffix']], sports[match['sport']], season_name(int(match['start'])),
+               file_team_prefixes[match['prefix']], os.path.join(directory, name))
+
+
+def import_season_files(directory='.', root=DATASET_ROOT):
+    """Copy conventionally named season files into the dataset"""
+    return [write_partition(pd.read_csv(path), kind, sport, season, team, root)
+            for kind, sport, season, team, path in season_files(directory)]
+
+
+if __name__ == "__main__":
+    root = sys.argv[1] if len(sys.argv) > 1 else DATASET_ROOT
+
+    written = import_season_files('.', root)
+    all_partitions = list_partitions(root)
+    query = dict(sport='womens_basketball', seasons=(2019, 2026), conference='ACC')
+    selected = list_partitions(root, **query)
+    away = read_dataset('travel', root, **query, where={'Home_Away': 'Away'})
+
+    print("=" * 100)
+    print("PARTITIONED SEASON DATASET")
+    print("=" * 100)
+    print(f"Imported {len(written)} season file(s) into {root}/")
+    for path in written:
+        print(f"  ✓ {path}")
+
+    print(f"\n🗂️  Partitions: {len(all_partitions)} total | "
+          f"{len(selected)} match ACC women's basketball 2019-2026")
+    print(f"Away games selected: {len(away)}")
+    if len(away):
+        print("\n📊 AWAY TRAVEL BY TEAM-SEASON")
+        print("-" * 100)
+        summary = away.groupby(['Team', 'Season']).agg(
+            Away_Games=('Game_Number', 'count'),
+            Miles=('Travel_Distance_Miles', 'sum'),
+            Hours=('Travel_Duration_Hours', 'sum'),
+        )
+        for (team, season), row in summary.iterrows():
+            print(f"  {team:20s} {season} | {row['Away_Games']:3.0f} away games | "
+                  f"{row['Miles']:8.1f} miles | {row['Hours']:6.1f} hours")
+    print("=" * 100)
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Time-indexed season queries: bisect point lookups and prefix-sum range totals.
+
+SeasonIndex holds the games of many team-seasons in one set of flat arrays.
+Every game is keyed by code * DAY_SPAN + day number, where code identifies
+the (sport, team, season) and the day number is days since 1970-01-01. The
+keys are sorted, so each team-season is one contiguous block and a date
+inside it is found with np.searchsorted. Miles, hours, timezones and the
+fatigue score have one running-sum array each over all blocks, so any date
+range of any team-season totals to two lookups:
+
+    total(miles, Jan 1 .. Feb 15) = prefix[hi] - prefix[lo]
+
+where lo and hi are the block positions of the range's first and last games.
+The batch methods (totals, latest_games) answer arrays of queries across
+teams and seasons with one searchsorted call.
+
+Fatigue scores come from the season's fatigue file when it has one, else
+schedule_diff.fatigue_table scores the travel table. The what-if service
+answers the same queries over HTTP (POST /query).
+
+Usage:
+    python3 season_index.py                                    # every season file in the tree
+    python3 season_index.py "Notre Dame" 2026-01-01 2026-02-15 # one range query
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import schedule_diff
+import season_timeline
+from game_records import day_number, iso_date
+
+DAY_SPAN = 1 << 20  # Day numbers below this (year 4840); keys stay exact in int64
+
+METRICS = {
+    'miles': 'Travel_Distance_Miles',
+    'hours': 'Travel_Duration_Hours',
+    'timezones': 'Timezones_Crossed',
+    'fatigue': 'Overall_Fatigue_Score',
+}
+
+
+def as_day(day):
+    """Day number for '2026-01-04', a date / Timestamp or a day number"""
+    if isinstance(day, (int, np.integer)):
+        return int(day)
+    return day_number(str(day)[:10])
+
+
+class SeasonIndex:
+    """Sorted game days and running metric sums for many team-seasons"""
+
+    def __init__(self, tables):
+        """tables: {(sport, team, season): (travel DataFrame, fatigue DataFrame or None)}"""
+        self.keys = sorted(tables)
+        self.codes = {key: code for code, key in enumerate(self.keys)}
+        frames = []
+        for code, key in enumerate(self.keys):
+            travel, fatigue = tables[key]
+            travel = travel.reset_index(drop=True)
+            scored = fatigue.reset_index(drop=True) if fatigue is not None else schedule_diff.fatigue_table(travel)
+            frames.append(pd.DataFrame({
+                'Code': code,
+                'Day': [as_day(d) for d in travel['Game_Date']],
+                'Game_Number': np.arange(1, len(travel) + 1),
+                'Opponent': travel['Opponent'].to_numpy(),
+                'Location': travel['Location'].to_numpy(),
+                'Home_Away': travel['Home_Away'].to_numpy(),
+                **{column: travel[column].to_numpy(dtype=float) for column in METRICS.values()
+                   if column in travel},
+                'Overall_Fatigue_Score': scored['Overall_Fatigue_Score'].to_numpy(dtype=float),
+                'Fatigue_Level': scored['Fatigue_Level'].to_numpy(),
+            }))
+        games = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=['Code', 'Day'])
+        games = games.sort_values(['Code', 'Day'], kind='stable', ignore_index=True)
+
+        self.games = games
+        self.sort_keys = games['Code'].to_numpy(dtype=np.int64) * DAY_SPAN + games['Day'].to_numpy(dtype=np.int64)
+        counts = np.bincount(games['Code'].to_numpy(dtype=np.int64), minlength=len(self.keys))
+        self.block_starts = np.concatenate([[0], np.cumsum(counts)])
+        self.prefix = {metric: np.concatenate([[0.0], np.cumsum(games[column].to_numpy(dtype=float))])
+                       for metric, column in METRICS.items()}
+
+    @classmethod
+    def from_sources(cls, directory='.', root=season_timeline.season_dataset.DATASET_ROOT):
+        """Index every travel file in the directory and the dataset, with its fatigue file when present"""
+        fatigue = season_timeline.season_sources('fatigue', directory, root)
+        return cls({key: (season_timeline.read_travel(path),
+                          season_timeline.read_travel(fatigue[key]) if key in fatigue else None)
+                    for key, path in season_timeline.travel_sources(directory, root).items()})
+
+    def __len__(self):
+        return len(self.games)
+
+    def resolve(self, team, season=None, sport=None):
+        """The one indexed (sport, team, season) matching a team name and optional season / sport"""
+        if isinstance(team, tuple):
+            sport, team, season = team
+        matches = [key for key in self.keys
+                   if key[1] == team and season in (None, key[2]) and sport in (None, key[0])]
+        if len(matches) != 1:
+            raise KeyError(f"{len(matches)} indexed seasons match team={team!r} season={season!r} sport={sport!r}")
+        return matches[0]
+
+    def _bounds(self, codes, starts, ends):
+        """Block positions [lo, hi) of the games from start to end (inclusive) of each code"""
+        codes = np.asarray(codes, dtype=np.int64)
+        lo = np.searchsorted(self.sort_keys, codes * DAY_SPAN + np.asarray(starts, dtype=np.int64), side='left')
+        hi = np.searchsorted(self.sort_keys, codes * DAY_SPAN + np.asarray(ends, dtype=np.int64), side='right')
+        return lo, np.maximum(hi, lo)
+
+    def totals(self, keys, metric, starts, ends):
+        """Metric totals over the games in [start, end] for arrays of keys, start days and end days"""
+        codes = [self.codes[key] for key in keys]
+        lo, hi = self._bounds(codes, [as_day(d) for d in starts], [as_day(d) for d in ends])
+        prefix = self.prefix[metric]
+        return prefix[hi] - prefix[lo]
+
+    def total(self, key, metric, start, end):
+        """Metric total over the games from start to end (inclusive)"""
+        return float(self.totals([key], metric, [start], [end])[0])
+
+    def latest_games(self, keys, days):
+        """Block positions of each key's last game on or before each day (-1 if none)"""
+        codes = np.array([self.codes[key] for key in keys], dtype=np.int64)
+        days = np.array([as_day(d) for d in days], dtype=np.int64)
+        position = np.searchsorted(self.sort_keys, codes * DAY_SPAN + days, side='right') - 1
+        return np.where(position >= self.block_starts[codes], position, -1)
+
+    def game_count(self, key):
+        """Number of games of a team-season"""
+        code = self.codes[key]
+        return int(self.block_starts[code + 1] - self.block_starts[code])
+
+    def game(self, key, number):
+        """Game `number` (1-based) of a team-season"""
+        code = self.codes[key]
+        start, end = self.block_starts[code], self.block_starts[code + 1]
+        if not 1 <= number <= end - start:
+            raise IndexError(f"{key[1]} {key[2]} has no game {number} ({end - start} games)")
+        return self._row(start + number - 1)
+
+    def at(self, key, day):
+        """State going into a date: the last game on or before it and season-to-date totals"""
+        position = int(self.latest_games([key], [day])[0])
+        start = self.block_starts[self.codes[key]]
+        end = position + 1 if position >= 0 else start
+        state = {'date': iso_date(as_day(day)), 'last_game': self._row(position) if position >= 0 else None}
+        for metric in METRICS:
+            state[f'season_{metric}'] = round(float(self.prefix[metric][end] - self.prefix[metric][start]), 2)
+        return state
+
+    def _row(self, position):
+        row = self.games.iloc[position]
+        return {
+            'game_number': int(row['Game_Number']),
+            'date': iso_date(row['Day']),
+            'opponent': row['Opponent'],
+            'location': row['Location'],
+            'home_away': row['Home_Away'],
+            **{metric: round(float(row[column]), 2) for metric, column in METRICS.items()},
+            'fatigue_level': row['Fatigue_Level'],
+        }
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    index = SeasonIndex.from_sources()
+    build_time = time.perf_counter() - start
+
+    print("=" * 100)
+    print("SEASON QUERY INDEX")
+    print("=" * 100)
+    print(f"Team-seasons: {len(index.keys)} | Games: {len(index)} | Built in {build_time * 1000:.1f} ms")
+
+    if len(sys.argv) == 4:
+        key = index.resolve(sys.argv[1])
+        print(f"\n🔎 {key[1]} {key[2]}, {sys.argv[2]} to {sys.argv[3]}")
+        print("-" * 100)
+        for metric in METRICS:
+            print(f"  {metric:10s} {index.total(key, metric, sys.argv[2], sys.argv[3]):10,.1f}")
+        print("=" * 100)
+        sys.exit()
+
+    for key in index.keys:
+        sport, team, season = key
+        first, last = index.game(key, 1), index.game(key, index.game_count(key))
+        print(f"\n🔎 {team} {sport} {season}: {first['date']} to {last['date']}")
+        print("-" * 100)
+        months = pd.date_range(first['date'][:8] + '01', last['date'], freq='MS')
+        month_ends = months + pd.offsets.MonthEnd(0)
+        miles = index.totals([key] * len(months), 'miles', months, month_ends)
+        hours = index.totals([key] * len(months), 'hours', months, month_ends)
+        for month, month_miles, month_hours in zip(months, miles, hours):
+            print(f"  {month:%b %Y}: {month_miles:8,.1f} miles | {month_hours:5.1f} hours")
+        print(f"  Jan 1 - Feb 15: {index.total(key, 'miles', f'{season[5:]}-01-01', f'{season[5:]}-02-15'):,.1f} miles")
+        if index.game_count(key) >= 22:
+            eve = as_day(index.game(key, 22)['date']) - 1
+            state = index.at(key, eve)
+            last_game = state['last_game']
+            print(f"  Day before game 22 ({state['date']}): last played game {last_game['game_number']} "
+                  f"vs {last_game['opponent']} (fatigue {last_game['fatigue']:.0f}, {last_game['fatigue_level']}) | "
+                  f"season {state['season_miles']:,.1f} miles, {state['season_hours']:.1f} hours")
+
+    # Batch timing: the same queries against the index and against DataFrame filtering
+    rng = np.random.default_rng(7)
+    n_queries = 100_000
+    keys = [index.keys[i] for i in rng.integers(len(index.keys), size=n_queries)]
+    days = index.games['Day'].to_numpy()
+    starts = rng.integers(days.min() - 5, days.max() + 5, size=n_queries)
+    ends = starts + rng.integers(0, 60, size=n_queries)
+    start = time.perf_counter()
+    totals = index.totals(keys, 'miles', starts, ends)
+    batch_time = time.perf_counter() - start
+
+    sample = 1000
+    start = time.perf_counter()
+    games = index.games
+    for key, first_day, last_day, expected in zip(keys[:sample], starts[:sample], ends[:sample], totals[:sample]):
+        rows = games[(games['Code'] == index.codes[key]) & games['Day'].between(first_day, last_day)]
+        assert abs(rows['Travel_Distance_Miles'].sum() - expected) < 1e-6
+    filter_time = (time.perf_counter() - start) / sample * n_queries
+    print(f"\n⏱️  {n_queries:,} range totals: {batch_time * 1000:.1f} ms batched | "
+          f"~{filter_time:.1f} s by DataFrame filtering (extrapolated from {sample:,})")
+    print("=" * 100)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Daily team-location timeline for a season.
+
+One TIMELINE_DTYPE entry per calendar day from the day before the first game
+to the day after the last: the venue the team sleeps at, whether it travels
+that day, the local UTC offset, hours traveled and the game played (if any).
+Day i of the array is first_day + i, so any date is answered with one index
+computation instead of replaying the schedule.
+
+The timeline follows travel_engine's movement model: a team flies to an away
+game the day before it (straight from the previous venue on a road trip,
+never earlier than the previous game day) and returns home the day after its
+last away game before a home game or the end of the season. Outbound hours
+are the travel CSV's Travel_Duration_Hours; return legs are priced with
+travel_engine.calculate_travel_metrics.
+
+Per-game rest days, travel-free days, timezone adaptation and nights away
+from home are read from the array with prefix sums.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import season_dataset
+import travel_engine
+from game_records import StringTable, day_number, iso_date
+from venues import HOME_LOCATION, city_coords, team_venues, timezone_offsets, DEFAULT_TIMEZONE
+
+NO_GAME = -1
+TIMELINE_DTYPE = np.dtype([
+    ('venue', np.uint16),        # Where the team sleeps (index into the venue table)
+    ('traveling', np.bool_),
+    ('utc_offset', np.int8),
+    ('travel_hours', np.float32),
+    ('game', np.int16),          # Row of the game played that day, NO_GAME if none
+])
+
+
+class TeamTimeline:
+    """Where a team is on every day of one season"""
+
+    def __init__(self, data, first_day, game_days, home, venues):
+        self.data = data
+        self.first_day = first_day
+        self.game_days = game_days
+        self.home = home
+        self.venues = venues
+
+    @classmethod
+    def from_travel(cls, df, home_location=HOME_LOCATION):
+        """Build from a travel DataFrame (Game_Date, Location, Home_Away, Travel_Duration_Hours) in date order"""
+        venues = StringTable(city_coords)
+        home = venues.code(home_location)
+        game_days = np.array([day_number(str(d)[:10]) for d in df['Game_Date']], dtype=np.int64)
+        away = (df['Home_Away'] == 'Away').to_numpy()
+        location = np.where(away, venues.encode(list(df['Location'])), home)
+        first_day, last_day = game_days[0] - 1, game_days[-1] + 1
+        offset_days = game_days - first_day
+
+        # Moves: (day, venue, hours); outbound on the eve of each away game, home the day after a road trip
+        previous_location = np.concatenate([[home], location[:-1]])
+        previous_day = np.concatenate([[offset_days[0] - 1], offset_days[:-1]])
+        outbound = away & (location != previous_location)
+        returning = np.append(~away[1:], True) & away
+        return_legs = [(venues.values[v], home_location) for v in location[returning]]
+        _, return_hours, _ = travel_engine.calculate_travel_metrics(return_legs) if return_legs else ([], [], [])
+
+        move_days = np.concatenate([np.maximum(previous_day, offset_days - 1)[outbound], offset_days[returning] + 1])
+        move_venues = np.concatenate([location[outbound], np.full(returning.sum(), home)])
+        move_hours = np.concatenate([df['Travel_Duration_Hours'].to_numpy(dtype=float)[outbound],
+                                     np.asarray(return_hours, dtype=float)])
+        # A return home and the next outbound leg can share a day: the return comes first
+        is_outbound = np.concatenate([np.ones(outbound.sum(), dtype=bool), np.zeros(returning.sum(), dtype=bool)])
+        order = np.lexsort((is_outbound, move_days))
+        move_days, move_venues, move_hours = move_days[order], move_venues[order], move_hours[order]
+
+        n_days = last_day - first_day + 1
+        days = np.arange(n_days)
+        latest = np.searchsorted(move_days, days, side='right') - 1
+        offsets = np.array([timezone_offsets.get(v, DEFAULT_TIMEZONE) for v in venues.values], dtype=np.int8)
+
+        data = np.zeros(n_days, dtype=TIMELINE_DTYPE)
+        data['venue'] = np.where(latest >= 0, move_venues[np.maximum(latest, 0)], home)
+        data['traveling'][move_days] = True
+        np.add.at(data['travel_hours'], move_days, move_hours)
+        data['utc_offset'] = offsets[data['venue']]
+        data['game'] = NO_GAME
+        data['game'][offset_days] = np.arange(len(game_days))
+        return cls(data, first_day, game_days, home, venues)
+
+    def __len__(self):
+        return len(self.data)
+
+    def index(self, day):
+        """Array position of a date ('2026-01-04', date or day number); IndexError outside the season"""
+        if not isinstance(day, (int, np.integer)):
+            day = day_number(str(day)[:10])
+        i = int(day) - self.first_day
+        if not 0 <= i < len(self.data):
+            raise IndexError(f"{iso_date(day)} is outside the timeline "
+                             f"({iso_date(self.first_day)} to {iso_date(self.first_day + len(self.data) - 1)})")
+        return i
+
+    def on(self, day):
+        """Team state on one date"""
+        entry = self.data[self.index(day)]
+        return {
+            'date': iso_date(self.first_day + self.index(day)),
+            'venue': self.venues.values[entry['venue']],
+            'traveling': bool(entry['traveling']),
+            'utc_offset': int(entry['utc_offset']),
+            'travel_hours': round(float(entry['travel_hours']), 2),
+            'game': None if entry['game'] == NO_GAME else int(entry['game']),
+        }
+
+    def away_nights(self):
+        """Boolean per day: the team sleeps away from home"""
+        return self.data['venue'] != self.home
+
+    def game_metrics(self):
+        """Per-game rest, travel-free days, timezone adaptation and nights away, read from the daily array"""
+        data = self.data
+        positions = self.game_days - self.first_day
+        days = np.arange(len(data))
+
+        # Prefix sums: counts over any day range are two lookups
+        free = np.concatenate([[0], np.cumsum(~data['traveling'] & (data['game'] == NO_GAME))])
+        away = np.concatenate([[0], np.cumsum(self.away_nights())])
+        hours = np.concatenate([[0.0], np.cumsum(data['travel_hours'], dtype=float)])
+
+        previous = np.concatenate([[positions[0]], positions[:-1]])
+        shifted = np.concatenate([[False], data['utc_offset'][1:] != data['utc_offset'][:-1]])
+        last_shift = np.maximum.accumulate(np.where(shifted, days, 0))
+        home_offset = timezone_offsets.get(self.venues.values[self.home], DEFAULT_TIMEZONE)
+        week_start = np.maximum(positions - 7, 0)
+
+        return pd.DataFrame({
+            'Game_Date': [iso_date(d) for d in self.game_days],
+            'Venue': self.venues.decode(data['venue'][positions]),
+            'Days_Rest_Since_Last': np.where(np.arange(len(positions)) == 0, 0, positions - previous),
+            'Travel_Free_Days': free[positions] - free[np.minimum(previous + 1, positions)],
+            'Travel_Hours_Since_Last': (hours[positions + 1] - hours[previous + 1]).round(2),
+            'UTC_Offset': data['utc_offset'][positions].astype(int),
+            'Offset_From_Home': data['utc_offset'][positions].astype(int) - home_offset,
+            'Days_At_Offset': positions - last_shift[positions],
+            'Nights_Away_Last_7': away[positions] - away[week_start],
+            'Nights_Away_Season': away[positions],
+        })
+
+
+def season_sources(kind, directory='.', root=season_dataset.DATASET_ROOT):
+    """{(sport, team, season): file} of one kind ('travel' or 'fatigue'); working-directory season files take precedence"""
+    sources = {}
+    for file_kind, sport, season, team, path in season_dataset.season_files(directory):
+        if file_kind == kind:
+            sources[(sport, team, season)] = path
+    for partition in season_dataset.list_partitions(root):
+        path = os.path.join(partition['path'], f'{kind}.csv')
+        key = (partition['sport'], partition['team'], partition['season'])
+        if os.path.exists(path) and key not in sources:
+            sources[key] = path
+    return dict(sorted(sources.items()))
+
+
+def travel_sources(directory='.', root=season_dataset.DATASET_ROOT):
+    """{(sport, team, season): travel file}; working-directory season files take precedence"""
+    return season_sources('travel', directory, root)
+
+
+def read_travel(path):
+    """Travel table (the 'None' travel mode stays a string)"""
+    return pd.read_csv(path, keep_default_na=False, na_values=[''])
+
+
+def season_timelines(directory='.', root=season_dataset.DATASET_ROOT):
+    """{(sport, team, season): TeamTimeline} for every travel file in the directory and the dataset"""
+    return {key: TeamTimeline.from_travel(read_travel(path), team_venues.get(key[1], HOME_LOCATION))
+            for key, path in travel_sources(directory, root).items()}
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    timelines = season_timelines()
+    elapsed = time.perf_counter() - start
+
+    print("=" * 100)
+    print("DAILY TEAM-LOCATION TIMELINES")
+    print("=" * 100)
+    print(f"Team-seasons: {len(timelines)} | Built in {elapsed * 1000:.1f} ms")
+
+    for (sport, team, season), timeline in timelines.items():
+        metrics = timeline.game_metrics()
+        nights_away = int(timeline.away_nights().sum())
+        travel_days = int(timeline.data['traveling'].sum())
+        print(f"\n🗓️  {team} {sport} {season}: {len(timeline)} days | {travel_days} travel days | "
+              f"{nights_away} nights away | {timeline.data['travel_hours'].sum():.1f} travel hours")
+        print("-" * 100)
+        for query in sys.argv[1:]:
+            print(f"  {query}: {timeline.on(query)}")
+        print(f"  Most nights away in a week: {metrics['Nights_Away_Last_7'].max()} "
+              f"(before {metrics.loc[metrics['Nights_Away_Last_7'].idxmax(), 'Game_Date']})")
+        unadapted = metrics[(metrics['Offset_From_Home'] != 0) & (metrics['Days_At_Offset'] <= 1)]
+        print(f"  Games within a day of a timezone change: {len(unadapted)}")
+        for _, row in unadapted.iterrows():
+            print(f"    {row['Game_Date']} at {row['Venue']:20s} UTC{row['UTC_Offset']:+d} "
+                  f"({row['Offset_From_Home']:+d} h from home, {row['Days_At_Offset']} day(s) there)")
+        tight = metrics[(metrics.index > 0) & (metrics['Travel_Free_Days'] == 0)]
+        print(f"  Games with no travel-free day since the previous game: {len(tight)}")
+    print("=" * 100)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+schedule_ingest against a local fixture server: parsing, ETag / 304 refreshes
+and keep-alive connections the server dropped.
+
+Usage:
+    python3 -m pytest -q test_schedule_ingest.py
+"""
+
+import asyncio
+import hashlib
+
+import pytest
+
+import schedule_ingest
+
+FIXTURE_PAGE = """
+<ul>
+  <li class="sidearm-schedule-game sidearm-schedule-home-game">
+    <div class="sidearm-schedule-game-opponent-date">Nov 5 (Wed)</div>
+    <div class="sidearm-schedule-game-opponent-name">vs Lehigh</div>
+    <div class="sidearm-schedule-game-location">South Bend, Ind. / Purcell Pavilion</div>
+  </li>
+  <li class="sidearm-schedule-game sidearm-schedule-away-game">
+    <div class="sidearm-schedule-game-opponent-date">Jan 29 (Thu)</div>
+    <div class="sidearm-schedule-game-opponent-name">at California</div>
+    <div class="sidearm-schedule-game-location">Berkeley, Calif.</div>
+  </li>
+</ul>
+"""
+
+
+class FixtureServer:
+    """HTTP/1.1 server for one page with an ETag; optionally drops each connection after one response"""
+
+    def __init__(self, page=FIXTURE_PAGE, drop_after_response=False, respond=True):
+        self.page = page
+        self.drop_after_response = drop_after_response
+        self.respond = respond
+        self.requests = []
+        self.connections = 0
+        self.closed_by_client = False
+
+    @property
+    def etag(self):
+        return '"%s"' % hashlib.sha256(self.page.encode()).hexdigest()[:16]
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                self.requests.append(headers)
+                if not self.respond:
+                    self.closed_by_client = await reader.read() == b''
+                    break
+                if headers.get('if-none-match') == self.etag:
+                    writer.write(f"HTTP/1.1 304 Not Modified\r\nETag: {self.etag}\r\n\r\n".encode())
+                else:
+                    body = self.page.encode()
+                    writer.write(f"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+                                 f"ETag: {self.etag}\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+                await writer.drain()
+                if self.drop_after_response:
+                    break  # Without Connection: close, so the client keeps a connection that is gone
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        self.url = f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}/schedule"
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+
+
+def test_conditional_refresh(tmp_path):
+    async def run():
+        async with FixtureServer() as server:
+            programs = {'Notre Dame': server.url}
+            first = await schedule_ingest.ingest_all(programs, cache_dir=tmp_path)
+            second = await schedule_ingest.ingest_all(programs, cache_dir=tmp_path)
+            server.page = FIXTURE_PAGE.replace('Jan 29', 'Jan 30')
+            third = await schedule_ingest.ingest_all(programs, cache_dir=tmp_path)
+            return server, first['Notre Dame'], second['Notre Dame'], third['Notre Dame']
+
+    server, (games, outcome), (cached_games, cached_outcome), (new_games, new_outcome) = asyncio.run(run())
+    assert outcome == 'parsed'
+    assert games == [
+        {'date': '2025-11-05', 'opponent': 'Lehigh', 'location': 'South Bend, IN', 'home_away': 'Home'},
+        {'date': '2026-01-29', 'opponent': 'California', 'location': 'Berkeley, CA', 'home_away': 'Away'},
+    ]
+    assert 'if-none-match' not in server.requests[0]
+    assert server.requests[1]['if-none-match'] == server.requests[2]['if-none-match']
+    assert (cached_games, cached_outcome) == (games, 'not modified')
+    assert new_outcome == 'parsed' and new_games[1]['date'] == '2026-01-30'
+
+
+def test_dropped_keep_alive_connections_are_retried():
+    async def run():
+        async with FixtureServer(drop_after_response=True) as server:
+            pool = schedule_ingest.HttpPool(per_host=4)
+            rounds = []
+            for _ in range(3):
+                responses = await asyncio.wait_for(asyncio.gather(*(pool.get(server.url) for _ in range(8))), 10)
+                rounds.append([status for _, status, _, _ in responses])
+                await asyncio.sleep(0.05)  # Let the server's closes reach the idle connections
+            await pool.close()
+            return server, rounds
+
+    server, rounds = asyncio.run(run())
+    assert rounds == [[200] * 8] * 3
+    assert server.connections > 4  # Later rounds had to replace the dropped connections
+
+
+def test_timeout_closes_the_connection(monkeypatch):
+    monkeypatch.setattr(schedule_ingest, 'TIMEOUT_SECONDS', 0.2)
+
+    async def run():
+        async with FixtureServer(respond=False) as server:
+            pool = schedule_ingest.HttpPool()
+            with pytest.raises(asyncio.TimeoutError):
+                await pool.get(server.url)
+            await asyncio.sleep(0.05)
+            return server, pool
+
+    server, pool = asyncio.run(run())
+    assert server.closed_by_client
+    assert all(not connections for connections in pool.idle.values())
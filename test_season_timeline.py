@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+TeamTimeline movement model: road trips, returns home and same-day turnarounds.
+
+Usage:
+    python3 -m pytest -q test_season_timeline.py
+"""
+
+import pandas as pd
+
+import season_timeline
+
+
+def timeline(games):
+    """Timeline for (date, location, home_away, travel hours) tuples"""
+    df = pd.DataFrame(games, columns=['Game_Date', 'Location', 'Home_Away', 'Travel_Duration_Hours'])
+    return season_timeline.TeamTimeline.from_travel(df)
+
+
+def test_road_trip_and_return():
+    t = timeline([
+        ('2026-01-01', 'South Bend, IN', 'Home', 0.0),
+        ('2026-01-04', 'Durham, NC', 'Away', 5.1),
+        ('2026-01-08', 'South Bend, IN', 'Home', 0.0),
+    ])
+    assert t.on('2026-01-03')['venue'] == 'Durham, NC' and t.on('2026-01-03')['traveling']
+    assert t.on('2026-01-04')['venue'] == 'Durham, NC' and t.on('2026-01-04')['game'] == 1
+    assert t.on('2026-01-05')['venue'] == 'South Bend, IN' and t.on('2026-01-05')['traveling']
+
+
+def test_home_game_then_away_next_day():
+    # Back from Durham on the day of the home game, off to Atlanta the same evening
+    t = timeline([
+        ('2026-01-01', 'South Bend, IN', 'Home', 0.0),
+        ('2026-01-03', 'Durham, NC', 'Away', 5.1),
+        ('2026-01-04', 'South Bend, IN', 'Home', 0.0),
+        ('2026-01-05', 'Atlanta, GA', 'Away', 5.3),
+    ])
+    turnaround = t.on('2026-01-04')
+    assert turnaround['venue'] == 'Atlanta, GA'
+    assert turnaround['traveling'] and turnaround['game'] == 2
+    game_day = t.on('2026-01-05')
+    assert game_day['venue'] == 'Atlanta, GA' and game_day['game'] == 3
+    assert not game_day['traveling']
+    assert t.on('2026-01-06')['venue'] == 'South Bend, IN'
+
+    metrics = t.game_metrics()
+    assert metrics.loc[3, 'Venue'] == 'Atlanta, GA'
+    assert metrics.loc[3, 'Travel_Hours_Since_Last'] == 0.0
+    assert metrics.loc[2, 'Travel_Hours_Since_Last'] > 5.3  # Durham return and Atlanta outbound
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo travel-delay simulation for fatigue score distributions.
+
+Samples a delay (and possible cancellation) for every travel leg across many
+scenarios at once, converts the lost time into lost rest before each game,
+and rescores fatigue for every scenario x game in one NumPy computation.
+Teams are scheduled to arrive the evening before; a delay that pushes
+arrival past midnight costs a night's sleep, i.e. one rest day.
+Scenarios are split into fixed-size chunks, each with its own RNG stream
+spawned from one seed, so results are reproducible for any worker count.
+"""
+
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import fatigue_model
+import schedule_loader
+
+# Delay distribution per travel mode (hours); cancellations rebook the next day
+DELAY_MODELS = {
+    'Bus': {'distribution': 'exponential', 'mean_hours': 0.4, 'cancel_prob': 0.002},
+    'Commercial': {'distribution': 'lognormal', 'median_hours': 0.6, 'sigma': 1.1, 'cancel_prob': 0.02},
+    'Charter': {'distribution': 'lognormal', 'median_hours': 0.3, 'sigma': 0.8, 'cancel_prob': 0.005},
+}
+REBOOK_HOURS = 24
+MIDNIGHT_BUFFER_HOURS = 6  # Scheduled 6 pm arrival -> 6 hours of slack before losing a night
+
+# Winter storms scale delay size and cancellation odds
+WINTER_MONTHS = {12, 1, 2}
+WINTER_MULTIPLIER = 1.5
+SNOW_BELT_MULTIPLIER = {
+    'Storrs, CT': 2.0,
+    'Syracuse, NY': 2.5,
+    'Boston, MA': 1.8,
+    'Milwaukee, WI': 1.6,
+    'University Park, PA': 1.6,
+}
+
+N_SCENARIOS = 100_000
+SCENARIOS_PER_STREAM = 10_000
+SEED = 2025
+PERCENTILES = [5, 25, 50, 75, 95]
+
+
+def leg_parameters(locations, modes, months):
+    """Per-game delay scale and cancellation probability (zero for games without travel)"""
+    scale = np.ones(len(modes))
+    cancel_prob = np.zeros(len(modes))
+    for i, (location, mode, month) in enumerate(zip(locations, modes, months)):
+        if mode not in DELAY_MODELS:
+            scale[i] = 0.0
+            continue
+        weather = 1.0
+        if month in WINTER_MONTHS:
+            weather = WINTER_MULTIPLIER * SNOW_BELT_MULTIPLIER.get(location, 1.0)
+        scale[i] = weather
+        cancel_prob[i] = min(1.0, DELAY_MODELS[mode]['cancel_prob'] * weather)
+    return scale, cancel_prob
+
+
+def sample_delays(rng, n_scenarios, modes, scale, cancel_prob):
+    """Delay hours for every scenario x game"""
+    delays = np.zeros((n_scenarios, len(modes)))
+    for mode, params in DELAY_MODELS.items():
+        cols = np.flatnonzero(np.asarray(modes) == mode)
+        if len(cols) == 0:
+            continue
+        shape = (n_scenarios, len(cols))
+        if params['distribution'] == 'exponential':
+            base = rng.exponential(params['mean_hours'], shape)
+        elif params['distribution'] == 'lognormal':
+            base = rng.lognormal(math.log(params['median_hours']), params['sigma'], shape)
+        elif params['distribution'] == 'gamma':
+            base = rng.gamma(params['shape'], params['scale_hours'], shape)
+        else:
+            raise ValueError(f"Unknown delay distribution '{params['distribution']}' for {mode}")
+        delays[:, cols] = base * scale[cols]
+    cancelled = rng.random(delays.shape) < cancel_prob
+    return delays + cancelled * REBOOK_HOURS
+
+
+def simulate_chunk(seed_sequence, n_scenarios, schedule):
+    """Fatigue scores (scenarios x games) for one RNG stream"""
+    rng = np.random.default_rng(seed_sequence)
+    delays = sample_delays(rng, n_scenarios, schedule['modes'], schedule['scale'], schedule['cancel_prob'])
+    lost_days = np.floor((delays + 24 - MIDNIGHT_BUFFER_HOURS) / 24)
+    effective_rest = np.maximum(0, schedule['days_rest'] - lost_days)
+    rest = fatigue_model.rest_component(effective_rest)
+    return fatigue_model.fatigue_score(schedule['static_fatigue'], 0, rest, 0).astype(np.int16)
+
+
+def simulate(schedule, n_scenarios=N_SCENARIOS, seed=SEED, workers=None):
+    """Simulated fatigue scores for every scenario x game"""
+    n_streams = max(1, math.ceil(n_scenarios / SCENARIOS_PER_STREAM))
+    streams = np.random.SeedSequence(seed).spawn(n_streams)
+    sizes = [min(SCENARIOS_PER_STREAM, n_scenarios - i * SCENARIOS_PER_STREAM) for i in range(n_streams)]
+    workers = min(workers or os.cpu_count() or 1, n_streams)
+
+    if workers == 1:
+        chunks = [simulate_chunk(s, n, schedule) for s, n in zip(streams, sizes)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(simulate_chunk, streams, sizes, [schedule] * n_streams))
+    return np.concatenate(chunks)
+
+
+def load_schedule(base_file, fatigue_file):
+    """Per-game arrays the simulation needs, from the travel and fatigue CSVs"""
+    base_df = schedule_loader.load_csv(base_file)
+    fatigue_df = schedule_loader.load_csv(fatigue_file)
+    df = fatigue_df.merge(base_df[['Game_Number', 'Location', 'Travel_Mode']], on='Game_Number', how='left')
+
+    components = fatigue_model.score_schedule(
+        df['Travel_Distance_Miles'].values,
+        df['Timezones_Crossed'].values,
+        df['Days_Rest_Since_Last'].values,
+        (df['Home_Away'] == 'Away').values,
+    )
+    static_fatigue = (components['Travel_Fatigue_Component']
+                      + components['Timezone_Fatigue_Component']
+                      + components['Consecutive_Game_Fatigue'])
+    modes = df['Travel_Mode'].fillna('None').values
+    scale, cancel_prob = leg_parameters(df['Location'].values, modes, df['Game_Date'].dt.month.values)
+    schedule = {
+        'days_rest': df['Days_Rest_Since_Last'].values.astype(float),
+        'static_fatigue': static_fatigue,
+        'modes': modes,
+        'scale': scale,
+        'cancel_prob': cancel_prob,
+    }
+    return df, schedule
+
+
+def percentile_bands(df, scores):
+    """Per-game percentile bands and VERY HIGH probability"""
+    bands = df[['Game_Number', 'Game_Date', 'Opponent', 'Home_Away', 'Overall_Fatigue_Score']].copy()
+    bands['Game_Date'] = bands['Game_Date'].dt.date
+    for p, values in zip(PERCENTILES, np.percentile(scores, PERCENTILES, axis=0)):
+        bands[f'Fatigue_P{p}'] = values
+    bands['Fatigue_Mean'] = scores.mean(axis=0).round(2)
+    bands['Prob_Very_High'] = (scores >= 70).mean(axis=0).round(4)
+    return bands
+
+
+if __name__ == "__main__":
+    n_scenarios = int(sys.argv[1]) if len(sys.argv) > 1 else N_SCENARIOS
+    output_file = 'nd_womens_basketball_2025_2026_fatigue_simulation.csv'
+
+    df, schedule = load_schedule('nd_womens_basketball_2025_2026.csv',
+                                 'nd_womens_basketball_2025_2026_with_fatigue_metrics.csv')
+    start = time.perf_counter()
+    scores = simulate(schedule, n_scenarios)
+    elapsed = time.perf_counter() - start
+    bands = percentile_bands(df, scores)
+    bands.to_csv(output_file, index=False)
+
+    print("=" * 100)
+    print("TRAVEL DELAY SIMULATION - NOTRE DAME WOMEN'S BASKETBALL 2025-2026")
+    print("=" * 100)
+    print(f"Scenarios: {n_scenarios:,} | Games: {scores.shape[1]} | Seed: {SEED} | Time: {elapsed:.2f}s")
+
+    print("\n🌨️  GAMES MOST EXPOSED TO TRAVEL DELAYS")
+    print("-" * 100)
+    bands['Expected_Increase'] = bands['Fatigue_Mean'] - bands['Overall_Fatigue_Score']
+    exposed = bands[bands['Expected_Increase'] > 0].nlargest(10, 'Expected_Increase')
+    if len(exposed) > 0:
+        for _, row in exposed.iterrows():
+            print(f"Game {row['Game_Number']:2.0f} | {row['Game_Date']} | {row['Opponent']:20s} | "
+                  f"Base: {row['Overall_Fatigue_Score']:3.0f} | P5-P95: {row['Fatigue_P5']:3.0f}-{row['Fatigue_P95']:3.0f} | "
+                  f"Mean: {row['Fatigue_Mean']:5.1f} | P(VERY HIGH): {100 * row['Prob_Very_High']:5.1f}%")
+    else:
+        print("No game's fatigue score is sensitive to simulated delays")
+
+    print("\n" + "=" * 100)
+    print(f"✓ Percentile bands saved to: {output_file}")
+    print("=" * 100)
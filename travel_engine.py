@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Schedule -> travel rows -> fatigue rows, in memory.
+
+The same computation fix_virginia_geocoding.py and generate_fatigue_metrics.py
+write to CSV, packaged as functions over plain lists of dicts so long-running
+callers (the what-if service) can evaluate schedules without pandas or files.
+"""
+
+from datetime import date
+from itertools import accumulate
+
+import fatigue_model
+import road_routing
+import travel_modes
+from venues import (HOME_LOCATION, calculate_distance, city_coords, count_timezones_crossed,
+                    get_travel_direction)
+
+SPORT = "Women's Basketball"
+
+TRAVEL_FIELDS = [
+    "Game_Number",
+    "Sport",
+    "Opponent",
+    "Game_Date",
+    "Location",
+    "Home_Away",
+    "Travel_Distance_Miles",
+    "Travel_Duration_Hours",
+    "Timezones_Crossed",
+    "Travel_Direction",
+    "Travel_Mode",
+]
+
+FATIGUE_FIELDS = [
+    'Game_Number',
+    'Game_Date',
+    'Opponent',
+    'Home_Away',
+    'Days_Rest_Since_Last',
+    'Travel_Distance_Miles',
+    'Travel_Duration_Hours',
+    'Timezones_Crossed',
+    'Travel_Direction',
+    'Cumulative_Distance_Miles',
+    'Cumulative_Hours',
+    'Travel_Fatigue_Component',
+    'Timezone_Fatigue_Component',
+    'Rest_Fatigue_Component',
+    'Consecutive_Game_Fatigue',
+    'Overall_Fatigue_Score',
+    'Fatigue_Level',
+]
+
+_road_drive_times = None
+_distance_table = None
+
+
+def distance_table():
+    """Haversine miles for every venue pair, computed once per process"""
+    global _distance_table
+    if _distance_table is None:
+        _distance_table = {
+            (origin, destination): calculate_distance(city_coords[origin], city_coords[destination])
+            for origin in city_coords for destination in city_coords
+        }
+    return _distance_table
+
+
+def road_drive_times():
+    """Road drive times for short-haul venue pairs, computed once per process"""
+    global _road_drive_times
+    if _road_drive_times is None:
+        _road_drive_times = road_routing.short_haul_drive_times(city_coords)
+    return _road_drive_times
+
+
+def calculate_travel_metrics(legs):
+    """Calculate travel distance, duration and mode for a batch of (origin, destination) legs"""
+    drive_times = road_drive_times()
+    pair_miles = distance_table()
+    distances = []
+    drive_hours = []
+    for origin, destination in legs:
+        if origin not in city_coords or destination not in city_coords:
+            distances.append(0.0)
+            drive_hours.append(float('nan'))
+            continue
+
+        # Calculate distance in miles
+        distances.append(pair_miles[(origin, destination)])
+        drive_hours.append(drive_times.get((origin, destination), (float('nan'),))[0])
+
+    # Pick bus / commercial / charter for every leg at once
+    modes, travel_times, _ = travel_modes.choose_modes(distances, drive_hours)
+    return distances, travel_times, modes
+
+
+def build_travel_rows(games, home_location=HOME_LOCATION, sport=SPORT):
+    """Travel rows (TRAVEL_FIELDS) for a list of {date, opponent, location, home_away} games"""
+    rows = []
+    legs = []
+    current_location = home_location  # Home games return the team home
+
+    for game_number, game in enumerate(games, 1):
+        location = game["location"]
+        home_away = game["home_away"]
+
+        if home_away == "Away":
+            legs.append((current_location, location))
+            travel_direction = get_travel_direction(current_location, location) \
+                if current_location in city_coords and location in city_coords else "Unknown"
+            timezones = count_timezones_crossed(current_location, location)
+            current_location = location
+        else:
+            # Home games have no travel
+            legs.append((home_location, home_location))
+            travel_direction = "Home"
+            timezones = 0
+            current_location = home_location
+
+        rows.append({
+            "Game_Number": game_number,
+            "Sport": sport,
+            "Opponent": game["opponent"],
+            "Game_Date": game["date"],
+            "Location": location,
+            "Home_Away": home_away,
+            "Travel_Distance_Miles": 0,
+            "Travel_Duration_Hours": 0,
+            "Timezones_Crossed": timezones,
+            "Travel_Direction": travel_direction,
+            "Travel_Mode": travel_modes.NO_TRAVEL_MODE,
+        })
+
+    # Distance, duration and mode for all legs in one vectorized pass
+    distances, travel_times, modes = calculate_travel_metrics(legs)
+    for row, distance, travel_time, mode in zip(rows, distances, travel_times, modes):
+        row["Travel_Distance_Miles"] = round(distance, 1) if distance else 0
+        row["Travel_Duration_Hours"] = round(float(travel_time), 2) if travel_time else 0
+        row["Travel_Mode"] = str(mode)
+    return rows
+
+
+def build_fatigue_rows(travel_rows):
+    """Fatigue rows (FATIGUE_FIELDS) for travel rows, scored with fatigue_model.FATIGUE_SPEC"""
+    if not travel_rows:
+        return []
+    day_numbers = [date.fromisoformat(row["Game_Date"]).toordinal() for row in travel_rows]
+    days_rest = fatigue_model.days_rest_from_dates(day_numbers)
+    miles = [row["Travel_Distance_Miles"] for row in travel_rows]
+    hours = [row["Travel_Duration_Hours"] for row in travel_rows]
+    components = fatigue_model.score_schedule(
+        miles,
+        [row["Timezones_Crossed"] for row in travel_rows],
+        days_rest,
+        [row["Home_Away"] == "Away" for row in travel_rows],
+    )
+    levels = fatigue_model.fatigue_level(components['Overall_Fatigue_Score'])
+
+    rows = []
+    for i, (row, cum_miles, cum_hours) in enumerate(zip(travel_rows, accumulate(miles), accumulate(hours))):
+        fatigue_row = {field: row[field] for field in FATIGUE_FIELDS if field in row}
+        fatigue_row['Days_Rest_Since_Last'] = int(days_rest[i])
+        fatigue_row['Cumulative_Distance_Miles'] = round(cum_miles, 1)
+        fatigue_row['Cumulative_Hours'] = round(cum_hours, 1)
+        for column, values in components.items():
+            fatigue_row[column] = int(values[i])
+        fatigue_row['Fatigue_Level'] = str(levels[i])
+        rows.append({field: fatigue_row[field] for field in FATIGUE_FIELDS})
+    return rows
+
+
+def validate_schedule(travel_rows, fatigue_rows, home_location=HOME_LOCATION):
+    """Schedule sanity checks; returns {'valid', 'errors', 'warnings'}"""
+    errors = []
+    warnings = []
+    previous_date = None
+    for travel, fatigue in zip(travel_rows, fatigue_rows):
+        label = f"Game {travel['Game_Number']} ({travel['Opponent']})"
+        if travel['Location'] not in city_coords:
+            errors.append(f"{label}: unknown location '{travel['Location']}'")
+        if travel['Home_Away'] not in ('Home', 'Away', 'Neutral'):
+            errors.append(f"{label}: invalid Home/Away value '{travel['Home_Away']}'")
+        if travel['Home_Away'] == 'Home' and travel['Location'] != home_location:
+            errors.append(f"{label}: home game listed at '{travel['Location']}'")
+
+        game_date = date.fromisoformat(travel['Game_Date'])
+        if previous_date is not None:
+            if game_date <= previous_date:
+                errors.append(f"{label}: date {game_date} is not after the previous game ({previous_date})")
+            elif (game_date - previous_date).days == 1:
+                warnings.append(f"{label}: back-to-back game")
+        previous_date = game_date
+
+        if fatigue['Fatigue_Level'] == 'VERY HIGH':
+            warnings.append(f"{label}: VERY HIGH fatigue (score {fatigue['Overall_Fatigue_Score']})")
+
+    return {'valid': not errors, 'errors': errors, 'warnings': warnings}
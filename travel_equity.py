@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+League-wide travel equity across every member of a conference.
+
+Two views:
+  - Round robin: every member plays every other member home and away. Venue
+    distances come from one vectorized all-pairs matrix (venues.distance_matrix),
+    hours from the travel-mode choice and fatigue from scoring all teams'
+    home/away sequences as one batch, so the structural burden of each
+    member's geography is compared on equal terms.
+  - Actual schedules: teams whose season fatigue files are available (working
+    directory season files and dataset/ partitions) are compared on their
+    real schedules.
+
+Miles are one-way per away game, as in the travel CSVs. Inequality is reported
+as the Gini coefficient, coefficient of variation and max / min ratio of each
+metric across teams, plus pairwise gaps between teams.
+
+Usage:
+    python3 travel_equity.py                         # ACC, 2025-2026
+    python3 travel_equity.py --conference ACC --season 2024-2025
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import fatigue_model
+import rollup_cube
+import season_dataset
+import travel_engine
+import travel_modes
+import venues
+
+CONFERENCE = 'ACC'
+SEASON = '2025-2026'
+ASSUMED_REST_DAYS = 3  # Days between games in the round-robin comparison
+HIGH_LEVELS = ['HIGH', 'VERY HIGH']
+
+# Per-team metrics the inequality summary covers
+EQUITY_METRICS = ['Total_Miles', 'Miles_Per_Game', 'Total_Hours', 'Timezones_Crossed', 'Fatigue_Mean',
+                  'High_Fatigue_Games']
+
+
+def conference_members(conference=CONFERENCE, season=SEASON):
+    """Teams in the conference that season with a known home venue"""
+    return sorted(team for team in season_dataset.conference_membership
+                  if season_dataset.conference_of(team, season) == conference and team in venues.team_venues)
+
+
+def all_pairs_travel(teams):
+    """(miles, hours, timezones) teams x teams arrays for team i travelling to team j's venue"""
+    cities = [venues.team_venues[team] for team in teams]
+    miles = venues.distance_matrix([venues.city_coords[city] for city in cities])
+    drive_times = travel_engine.road_drive_times()
+    drive_hours = np.array([[drive_times.get((a, b), (np.nan,))[0] for b in cities] for a in cities])
+    _, hours, _ = travel_modes.choose_modes(miles.ravel(), drive_hours.ravel())
+    offsets = np.array([venues.timezone_offsets.get(city, venues.DEFAULT_TIMEZONE) for city in cities])
+    timezones = np.abs(offsets[:, None] - offsets[None, :])
+    return miles, hours.reshape(miles.shape), timezones
+
+
+def round_robin_equity(teams):
+    """Per-team metrics for a home-and-away round robin among the teams"""
+    n = len(teams)
+    miles, hours, timezones = all_pairs_travel(teams)
+    opponents = np.array([[j for j in range(n) if j != i] for i in range(n)])
+    rows = np.arange(n)[:, None]
+
+    # Alternating home / away sequences for every team, scored as one (teams x games) batch
+    games = 2 * (n - 1)
+    sequence_miles = np.zeros((n, games))
+    sequence_timezones = np.zeros((n, games), dtype=int)
+    is_away = np.zeros((n, games), dtype=bool)
+    sequence_miles[:, 1::2] = miles[rows, opponents]
+    sequence_timezones[:, 1::2] = timezones[rows, opponents]
+    is_away[:, 1::2] = True
+    days_rest = np.full((n, games), ASSUMED_REST_DAYS)
+    scores = fatigue_model.score_schedule(sequence_miles, sequence_timezones, days_rest, is_away)['Overall_Fatigue_Score']
+
+    return pd.DataFrame({
+        'Team': teams,
+        'Games': games,
+        'Away_Games': n - 1,
+        'Total_Miles': miles.sum(axis=1).round(1),
+        'Miles_Per_Game': (miles.sum(axis=1) / games).round(1),
+        'Total_Hours': hours.sum(axis=1).round(2),
+        'Hours_Per_Game': (hours.sum(axis=1) / games).round(2),
+        'Timezones_Crossed': timezones.sum(axis=1),
+        'Fatigue_Mean': scores.mean(axis=1).round(1),
+        'Fatigue_P50': np.percentile(scores, 50, axis=1).round(1),
+        'Fatigue_P90': np.percentile(scores, 90, axis=1).round(1),
+        'Fatigue_Max': scores.max(axis=1),
+        'High_Fatigue_Games': np.isin(fatigue_model.fatigue_level(scores), HIGH_LEVELS).sum(axis=1),
+    })
+
+
+def schedule_equity(conference=CONFERENCE, season=SEASON):
+    """Per-team metrics from the actual season fatigue files of conference members"""
+    records = []
+    for (sport, team, team_season), path in sorted(rollup_cube.cube_sources().items()):
+        if team_season != season_dataset.season_name(season_dataset.season_start(season)):
+            continue
+        if season_dataset.conference_of(team, team_season) != conference:
+            continue
+        df = pd.read_csv(path)
+        scores = df['Overall_Fatigue_Score'].to_numpy()
+        records.append({
+            'Team': team,
+            'Games': len(df),
+            'Away_Games': int((df['Home_Away'] == 'Away').sum()),
+            'Total_Miles': round(df['Travel_Distance_Miles'].sum(), 1),
+            'Miles_Per_Game': round(df['Travel_Distance_Miles'].mean(), 1),
+            'Total_Hours': round(df['Travel_Duration_Hours'].sum(), 2),
+            'Hours_Per_Game': round(df['Travel_Duration_Hours'].mean(), 2),
+            'Timezones_Crossed': int(df['Timezones_Crossed'].sum()),
+            'Fatigue_Mean': round(scores.mean(), 1),
+            'Fatigue_P50': round(np.percentile(scores, 50), 1),
+            'Fatigue_P90': round(np.percentile(scores, 90), 1),
+            'Fatigue_Max': scores.max(),
+            'High_Fatigue_Games': int(df['Fatigue_Level'].isin(HIGH_LEVELS).sum()),
+        })
+    return pd.DataFrame(records)
+
+
+def gini(values):
+    """Gini coefficient (0 = equal, 1 = one team carries everything)"""
+    values = np.sort(np.asarray(values, dtype=float))
+    n = len(values)
+    if n == 0 or values.sum() == 0:
+        return 0.0
+    ranks = np.arange(1, n + 1)
+    return float(((2 * ranks - n - 1) * values).sum() / (n * values.sum()))
+
+
+def inequality(table, metrics=EQUITY_METRICS):
+    """Gini, coefficient of variation, max / min ratio and extreme teams for each metric"""
+    records = []
+    for metric in metrics:
+        values = table[metric].to_numpy(dtype=float)
+        records.append({
+            'Metric': metric,
+            'Gini': round(gini(values), 3),
+            'CV': round(values.std() / values.mean(), 3) if values.mean() else 0.0,
+            'Max_Min_Ratio': round(values.max() / values.min(), 2) if values.min() else float('inf'),
+            'Lowest': table['Team'].iloc[values.argmin()],
+            'Highest': table['Team'].iloc[values.argmax()],
+        })
+    return pd.DataFrame(records)
+
+
+def pairwise(table, metric='Total_Miles'):
+    """teams x teams DataFrame of metric(row team) - metric(column team)"""
+    values = table[metric].to_numpy(dtype=float)
+    return pd.DataFrame(values[:, None] - values[None, :], index=table['Team'], columns=table['Team'])
+
+
+def print_table(table):
+    for _, row in table.sort_values('Total_Miles', ascending=False).iterrows():
+        print(f"  {row['Team']:16s} {row['Games']:3d} games ({row['Away_Games']:2d} away) | "
+              f"{row['Total_Miles']:8,.0f} mi ({row['Miles_Per_Game']:5.0f}/game) | {row['Total_Hours']:6.1f} hrs | "
+              f"TZ {row['Timezones_Crossed']:2d} | Fatigue avg {row['Fatigue_Mean']:4.1f} "
+              f"p90 {row['Fatigue_P90']:4.0f} max {row['Fatigue_Max']:3.0f} | HIGH+ {row['High_Fatigue_Games']:2d}")
+
+
+def print_inequality(table):
+    for _, row in inequality(table).iterrows():
+        print(f"  {row['Metric']:20s} Gini {row['Gini']:.3f} | CV {row['CV']:.3f} | "
+              f"max/min {row['Max_Min_Ratio']:5.2f} | lowest {row['Lowest']} | highest {row['Highest']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Travel equity across a conference's members")
+    parser.add_argument('--conference', default=CONFERENCE)
+    parser.add_argument('--season', default=SEASON)
+    args = parser.parse_args()
+    season = season_dataset.season_name(season_dataset.season_start(args.season))
+
+    start = time.perf_counter()
+    teams = conference_members(args.conference, season)
+    structural = round_robin_equity(teams)
+    gaps = pairwise(structural)
+    elapsed = time.perf_counter() - start
+    actual = schedule_equity(args.conference, season)
+
+    output_file = f"{season_dataset.slugify(args.conference)}_travel_equity_{season.replace('-', '_')}.csv"
+    structural.to_csv(output_file, index=False)
+
+    print("=" * 100)
+    print(f"TRAVEL EQUITY - {args.conference} {season} ({len(teams)} members)")
+    print("=" * 100)
+    print(f"Home-and-away round robin: {len(teams) * (len(teams) - 1)} trips, "
+          f"{ASSUMED_REST_DAYS} days rest between games | computed in {elapsed * 1000:.1f} ms")
+
+    print("\n🗺️  ROUND-ROBIN TRAVEL BURDEN BY TEAM")
+    print("-" * 100)
+    print_table(structural)
+
+    print("\n⚖️  INEQUALITY ACROSS MEMBERS")
+    print("-" * 100)
+    print_inequality(structural)
+
+    print("\n↔️  LARGEST PAIRWISE MILE GAPS")
+    print("-" * 100)
+    pairs = gaps.stack()
+    for (heavier, lighter), gap in pairs[pairs > 0].sort_values(ascending=False).head(10).items():
+        print(f"  {heavier:16s} travels {gap:7,.0f} more miles than {lighter}")
+    for team in actual['Team'] if not actual.empty else []:
+        if team in gaps.index:
+            row = gaps.loc[team].drop(team)
+            print(f"  {team}: travels more than {(row > 0).sum()} of {len(row)} members "
+                  f"(gap range {row.min():+,.0f} to {row.max():+,.0f} mi)")
+
+    print(f"\n📋 ACTUAL SCHEDULES ({len(actual)} of {len(teams)} members have season files)")
+    print("-" * 100)
+    if actual.empty:
+        print("  none")
+    else:
+        print_table(actual)
+        if len(actual) > 1:
+            print_inequality(actual)
+
+    print(f"\n✅ Per-team round-robin metrics saved to: {output_file}")
+    print("=" * 100)
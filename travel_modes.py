@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Travel mode-choice engine for bus, commercial flight and charter legs.
+
+Each mode has a configurable time and cost table. For every leg the engine
+picks the feasible mode with the lowest weighted cost:
+
+    dollars + VALUE_OF_TIME_PER_HOUR * hours
+
+The choice is vectorized with NumPy, so all legs of all teams can be decided
+in a single call.
+
+Crossovers with the default tables: the bus takes legs up to about 500
+miles and a commercial flight anything longer, matching the original
+hardcoded switch. A charter saves 2.5 hours of airport overhead over a
+commercial flight but costs about $17 more per mile, so it is only chosen
+when time is valued above about $2,150 per hour: at value_of_time=2500 it
+takes legs of ~280-400 miles, at 4000 ~190-600 miles. The __main__ sweep
+prints these bands.
+"""
+
+import numpy as np
+
+# Per-mode time and cost tables (costs are for the whole travel party)
+TRAVEL_MODES = {
+    "Bus": {
+        "speed_mph": 55,          # Average road speed
+        "overhead_hours": 0.0,    # Loading, rest stops already in the average speed
+        "fixed_cost": 0.0,
+        "cost_per_mile": 4.0,     # Motorcoach charter rate
+        "max_miles": 800,         # Longest leg a bus is considered for
+    },
+    "Commercial": {
+        "speed_mph": 500,
+        "overhead_hours": 4.0,    # Airport, security, ground transportation
+        "fixed_cost": 3750.0,     # 25 seats x $150 base fare
+        "cost_per_mile": 3.0,     # 25 seats x $0.12 per mile
+        "max_miles": None,
+    },
+    "Charter": {
+        "speed_mph": 450,
+        "overhead_hours": 1.5,    # FBO boarding and ground transportation
+        "fixed_cost": 3000.0,     # Positioning the aircraft and crew to the departure airport
+        "cost_per_mile": 20.0,    # ~$9,000 per flight hour for a 737-class jet at 450 mph
+        "max_miles": None,
+    },
+}
+
+VALUE_OF_TIME_PER_HOUR = 800  # Travel-party dollars per hour spent traveling (25 people x ~$32)
+NO_TRAVEL_MODE = "None"       # Recorded for legs with no travel (home games)
+
+
+def choose_modes(distance_miles, drive_hours=None, modes=None, value_of_time=VALUE_OF_TIME_PER_HOUR):
+    """Pick the best mode for every leg at once; returns (mode names, hours, cost) arrays.
+
+    drive_hours optionally overrides the bus time per leg (e.g. road-network
+    drive times); NaN entries fall back to distance / bus speed.
+    """
+    modes = TRAVEL_MODES if modes is None else modes
+    names = list(modes)
+    distance = np.asarray(distance_miles, dtype=float).reshape(-1)
+
+    speed = np.array([modes[m]["speed_mph"] for m in names], dtype=float)
+    overhead = np.array([modes[m]["overhead_hours"] for m in names], dtype=float)
+    fixed_cost = np.array([modes[m]["fixed_cost"] for m in names], dtype=float)
+    cost_per_mile = np.array([modes[m]["cost_per_mile"] for m in names], dtype=float)
+    max_miles = np.array([np.inf if modes[m].get("max_miles") is None else modes[m]["max_miles"]
+                          for m in names], dtype=float)
+
+    # legs x modes tables
+    hours = overhead + distance[:, None] / speed
+    if drive_hours is not None and "Bus" in modes:
+        routed = np.asarray(drive_hours, dtype=float).reshape(-1)
+        bus = names.index("Bus")
+        hours[:, bus] = np.where(np.isnan(routed), hours[:, bus], routed + overhead[bus])
+    cost = fixed_cost + distance[:, None] * cost_per_mile
+
+    score = cost + value_of_time * hours
+    score[distance[:, None] > max_miles] = np.inf
+    choice = np.argmin(score, axis=1)
+
+    legs = np.arange(len(distance))
+    travels = distance > 0
+    chosen_names = np.where(travels, np.array(names, dtype=object)[choice], NO_TRAVEL_MODE)
+    chosen_hours = np.where(travels, hours[legs, choice], 0.0)
+    chosen_cost = np.where(travels, cost[legs, choice], 0.0)
+    return chosen_names, chosen_hours, chosen_cost
+
+
+def choose_mode(distance, drive_hours=None):
+    """Scalar convenience wrapper around choose_modes; returns (mode, hours, cost)"""
+    names, hours, cost = choose_modes([distance], None if drive_hours is None else [drive_hours])
+    return names[0], float(hours[0]), float(cost[0])
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("TRAVEL MODE CHOICE BY LEG DISTANCE")
+    print("=" * 80)
+    sample = np.array([50, 150, 300, 450, 500, 550, 800, 1200, 2000, 2600])
+    names, hours, cost = choose_modes(sample)
+    for d, m, h, c in zip(sample, names, hours, cost):
+        print(f"  {d:5.0f} mi → {m:10s} {h:5.2f} hrs  ${c:>9,.0f}")
+
+    print("\nMODE BANDS BY VALUE OF TIME")
+    print("-" * 80)
+    miles = np.arange(1, 3001)
+    for value_of_time in [VALUE_OF_TIME_PER_HOUR, 1500, 2150, 2500, 3000, 4000]:
+        names, _, _ = choose_modes(miles, value_of_time=value_of_time)
+        bands = [f"{m} {miles[names == m].min()}-{miles[names == m].max()} mi"
+                 for m in TRAVEL_MODES if (names == m).any()]
+        print(f"  ${value_of_time:>5,}/hr: {' | '.join(bands)}")
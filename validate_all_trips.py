@@ -4,49 +4,16 @@ Comprehensive validation script to audit all travel calculations
 and ensure location tracking is accurate for every trip.
 """
 
-import pandas as pd
-import math
+import road_routing
+import schedule_loader
+import travel_modes
+from venues import calculate_distance, city_coords  # City coordinates (university locations)
 
-def calculate_distance(coord1, coord2):
-    """Calculate distance between two coordinates using Haversine formula (returns miles)"""
-    lat1, lon1 = coord1
-    lat2, lon2 = coord2
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-    c = 2 * math.asin(math.sqrt(a))
-    r = 3959  # Radius of Earth in miles
-    return c * r
-
-# City coordinates (university locations)
-city_coords = {
-    "South Bend, IN": (41.7033, -86.2390),  # Notre Dame
-    "Milwaukee, WI": (43.0396, -87.9073),   # Marquette
-    "University Park, PA": (40.8135, -77.8601),  # Penn State
-    "Norman, OK": (35.2087, -97.4867),      # Oklahoma
-    "Columbia, SC": (34.0007, -81.0348),    # South Carolina
-    "Boston, MA": (42.3601, -71.0589),      # Boston College
-    "Winston-Salem, NC": (36.0999, -80.2442),  # Wake Forest
-    "Syracuse, NY": (43.0481, -76.1474),    # Syracuse University
-    "Philadelphia, PA": (39.9526, -75.1652),    # Temple University
-    "Atlanta, GA": (33.7490, -84.3880),     # Georgia Tech
-    "Durham, NC": (35.9940, -78.8986),      # Duke University
-    "Louisville, KY": (38.2527, -85.7585),  # University of Louisville
-    "Tallahassee, FL": (30.4383, -84.2807),     # Florida State
-    "Clemson, SC": (34.6834, -82.8374),     # Clemson University
-    "Dallas, TX": (32.7767, -96.7970),      # SMU
-    "Blacksburg, VA": (37.2295, -80.4139),  # Virginia Tech
-    "Berkeley, CA": (37.8722, -122.2597),   # UC Berkeley
-    "Palo Alto, CA": (37.4419, -122.1430),  # Stanford
-    "Charlottesville, VA": (38.0293, -78.4767),  # University of Virginia
-    "Storrs, CT": (41.8086, -72.2470),      # UConn
-    "Coral Gables, FL": (25.7217, -80.2764),    # University of Miami
-}
+# Road drive times for short-haul venue pairs (empty unless a local road graph is present)
+road_drive_times = road_routing.short_haul_drive_times(city_coords)
 
 # Load the schedule
-df = pd.read_csv('nd_womens_basketball_2025_2026.csv')
-df['Game_Date'] = pd.to_datetime(df['Game_Date'])
+df = schedule_loader.load_csv('nd_womens_basketball_2025_2026.csv')
 
 print("=" * 100)
 print("COMPREHENSIVE TRIP VALIDATION - NOTRE DAME WOMEN'S BASKETBALL 2025-2026")
@@ -84,20 +51,20 @@ for idx, row in df.iterrows():
     # Calculate expected distance and duration
     expected_distance = calculate_distance(current_location_coords, game_location_coords)
     
-    # Estimate travel time
-    if expected_distance < 500:
-        expected_duration = expected_distance / 55  # Driving
-    else:
-        expected_duration = (expected_distance / 500) + 4  # Flying + airports
+    # Estimate travel time with the same mode-choice engine as the schedule generator
+    drive_hours = road_drive_times.get((current_location, game_location), (None,))[0]
+    expected_mode, expected_duration, _ = travel_modes.choose_mode(expected_distance, drive_hours)
     
     # For home games, distance should be 0
     if home_away == "Home":
         expected_distance = 0
         expected_duration = 0
+        expected_mode = travel_modes.NO_TRAVEL_MODE
     
     # Check if CSV matches expected
     distance_match = abs(csv_distance - expected_distance) < 50  # Allow 50 mile tolerance
     duration_match = abs(csv_duration - expected_duration) < 1.0  # Allow 1 hour tolerance
+    mode_match = row.get('Travel_Mode') == expected_mode  # A file without modes fails the check
     
     # Update current location based on game type
     if home_away == "Away":
@@ -109,7 +76,7 @@ for idx, row in df.iterrows():
         next_location_coords = city_coords["South Bend, IN"]
     
     # Create validation record
-    status = "✅" if (home_away == "Home" or (distance_match and duration_match)) else "⚠️ "
+    status = "✅" if (home_away == "Home" or (distance_match and duration_match and mode_match)) else "⚠️ "
     
     if home_away == "Home":
         validation_details.append(
@@ -120,13 +87,15 @@ for idx, row in df.iterrows():
         distance_diff = csv_distance - expected_distance
         duration_diff = csv_duration - expected_duration
         
-        if not distance_match or not duration_match:
+        if not distance_match or not duration_match or not mode_match:
             status = "⚠️ "
             issues_found.append({
                 'game': game_num,
                 'opponent': opponent,
                 'from': current_location,
                 'to': game_location,
+                'csv_mode': row.get('Travel_Mode', 'missing'),
+                'expected_mode': expected_mode,
                 'csv_distance': csv_distance,
                 'expected_distance': expected_distance,
                 'distance_diff': distance_diff,
@@ -170,6 +139,7 @@ if issues_found:
             print(f"   CSV Duration: {issue['csv_duration']:.2f} hrs")
             print(f"   Expected: {issue['expected_duration']:.2f} hrs")
             print(f"   Difference: {issue['duration_diff']:+.2f} hrs")
+            print(f"   CSV Mode: {issue['csv_mode']} (expected {issue['expected_mode']})")
         else:
             print(f"   Issue: {issue['issue']}")
         print()
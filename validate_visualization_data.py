@@ -4,10 +4,12 @@ Comprehensive validation script for visualization data integrity
 Checks fatigue metrics, cumulative calculations, and all derived metrics
 """
 
-import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
 import warnings
+
+import schedule_diff
+import schedule_loader
+
 warnings.filterwarnings('ignore')
 
 print("=" * 100)
@@ -16,11 +18,8 @@ print("=" * 100)
 print()
 
 # Load data
-base_df = pd.read_csv('nd_womens_basketball_2025_2026.csv')
-fatigue_df = pd.read_csv('nd_womens_basketball_2025_2026_with_fatigue_metrics.csv')
-
-base_df['Game_Date'] = pd.to_datetime(base_df['Game_Date'])
-fatigue_df['Game_Date'] = pd.to_datetime(fatigue_df['Game_Date'])
+base_df = schedule_loader.load_csv('nd_womens_basketball_2025_2026.csv')
+fatigue_df = schedule_loader.load_csv('nd_womens_basketball_2025_2026_with_fatigue_metrics.csv')
 
 validation_errors = []
 validation_warnings = []
@@ -35,42 +34,48 @@ if len(base_df) != len(fatigue_df):
 else:
     print(f"✅ Game count consistent: {len(base_df)} games")
 
+# Checks 2-6 match games on opponent / home-away / occurrence (schedule_diff) rather than
+# row position, so an inserted or moved game is reported once instead of shifting every later row
+diff = schedule_diff.diff_tables(base_df, fatigue_df, columns=['Travel_Distance_Miles', 'Travel_Duration_Hours'])
+changes = diff['changes']
+unmatched_opponents = set(diff['removed']['Opponent']) | set(diff['added']['Opponent'])
+site_changed = set(diff['removed']['Opponent']) & set(diff['added']['Opponent'])
+
 # Check 2: Date consistency
-if not (base_df['Game_Date'] == fatigue_df['Game_Date']).all():
-    validation_errors.append("Game dates don't match between base and fatigue CSVs")
-    print(f"❌ Game dates don't match between CSVs")
+if len(diff['moved']):
+    validation_errors.append(f"{len(diff['moved'])} game dates don't match between base and fatigue CSVs")
+    print(f"❌ Game dates don't match between CSVs: "
+          f"{', '.join(diff['moved']['Opponent'] + ' ' + diff['moved']['Old_Date'].astype(str).str[:10] + ' vs ' + diff['moved']['New_Date'].astype(str).str[:10])}")
 else:
     print(f"✅ Game dates consistent across both files")
 
 # Check 3: Opponent consistency
-if not (base_df['Opponent'] == fatigue_df['Opponent']).all():
+if unmatched_opponents - site_changed:
     validation_errors.append("Opponents don't match between base and fatigue CSVs")
-    print(f"❌ Opponents don't match between CSVs")
+    print(f"❌ Opponents don't match between CSVs: {', '.join(sorted(unmatched_opponents - site_changed))}")
 else:
     print(f"✅ Opponents consistent across both files")
 
 # Check 4: Distance consistency
-distance_diff = abs(base_df['Travel_Distance_Miles'] - fatigue_df['Travel_Distance_Miles'])
-if (distance_diff > 0.1).any():
-    mismatches = (distance_diff > 0.1).sum()
+if (changes['Column'] == 'Travel_Distance_Miles').any():
+    mismatches = (changes['Column'] == 'Travel_Distance_Miles').sum()
     validation_warnings.append(f"{mismatches} games have distance mismatches between CSVs")
     print(f"⚠️  {mismatches} games have distance mismatches (tolerance: >0.1 mi)")
 else:
     print(f"✅ Travel distances consistent (within 0.1 mile tolerance)")
 
 # Check 5: Duration consistency
-duration_diff = abs(base_df['Travel_Duration_Hours'] - fatigue_df['Travel_Duration_Hours'])
-if (duration_diff > 0.01).any():
-    mismatches = (duration_diff > 0.01).sum()
+if (changes['Column'] == 'Travel_Duration_Hours').any():
+    mismatches = (changes['Column'] == 'Travel_Duration_Hours').sum()
     validation_warnings.append(f"{mismatches} games have duration mismatches")
     print(f"⚠️  {mismatches} games have duration mismatches (tolerance: >0.01 hrs)")
 else:
     print(f"✅ Travel durations consistent (within 0.01 hour tolerance)")
 
 # Check 6: Home/Away consistency
-if not (base_df['Home_Away'] == fatigue_df['Home_Away']).all():
+if site_changed:
     validation_errors.append("Home/Away designation doesn't match between CSVs")
-    print(f"❌ Home/Away doesn't match between CSVs")
+    print(f"❌ Home/Away doesn't match between CSVs: {', '.join(sorted(site_changed))}")
 else:
     print(f"✅ Home/Away consistent across both files")
 
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Venue tables and geometry shared by the schedule, validation and service code.
+"""
+
+import math
+
+import numpy as np
+
+HOME_LOCATION = "South Bend, IN"
+DEFAULT_TIMEZONE = -6  # Central
+
+# City coordinates (CORRECTED: University locations, not state centroids)
+city_coords = {
+    "South Bend, IN": (41.7033, -86.2390),  # Notre Dame
+    "Milwaukee, WI": (43.0396, -87.9073),   # Marquette
+    "University Park, PA": (40.8135, -77.8601),  # Penn State
+    "Norman, OK": (35.2087, -97.4867),      # Oklahoma
+    "Columbia, SC": (34.0007, -81.0348),    # South Carolina
+    "Boston, MA": (42.3601, -71.0589),      # Boston College area
+    "Winston-Salem, NC": (36.0999, -80.2442),  # Wake Forest
+    "Syracuse, NY": (43.0481, -76.1474),    # Syracuse University
+    "Philadelphia, PA": (39.9526, -75.1652),    # Temple University
+    "Atlanta, GA": (33.7490, -84.3880),     # Georgia Tech
+    "Durham, NC": (35.9940, -78.8986),      # Duke University
+    "Louisville, KY": (38.2527, -85.7585),  # University of Louisville
+    "Tallahassee, FL": (30.4383, -84.2807),     # Florida State
+    "Clemson, SC": (34.6834, -82.8374),     # Clemson University
+    "Dallas, TX": (32.7767, -96.7970),      # SMU
+    "Blacksburg, VA": (37.2295, -80.4139),  # Virginia Tech
+    "Berkeley, CA": (37.8722, -122.2597),   # UC Berkeley
+    "Palo Alto, CA": (37.4419, -122.1430),  # Stanford
+    "Charlottesville, VA": (38.0293, -78.4767),  # **FIXED: University of Virginia, not state of Virginia**
+    "Storrs, CT": (41.8086, -72.2470),      # UConn
+    "Coral Gables, FL": (25.7217, -80.2764),    # University of Miami
+    "Raleigh, NC": (35.7847, -78.6821),     # NC State
+    "Chapel Hill, NC": (35.9049, -79.0469), # North Carolina
+    "Pittsburgh, PA": (40.4444, -79.9608),  # University of Pittsburgh
+    # Postseason sites (conference tournament, NCAA host campuses, regionals, Final Four)
+    "Greensboro, NC": (36.0594, -79.8253),  # Greensboro Coliseum
+    "Iowa City, IA": (41.6611, -91.5302),   # Iowa
+    "Austin, TX": (30.2849, -97.7341),      # Texas
+    "Los Angeles, CA": (34.0689, -118.4452),    # UCLA
+    "Fort Worth, TX": (32.7555, -97.3308),  # Regional
+    "Sacramento, CA": (38.5816, -121.4944), # Regional
+    "Phoenix, AZ": (33.4484, -112.0740),    # Final Four
+}
+
+# Timezone offsets from UTC (Eastern Standard Time = -5, Central = -6, Mountain = -7, Pacific = -8)
+timezone_offsets = {
+    "South Bend, IN": -6,  # Central
+    "Milwaukee, WI": -6,   # Central
+    "University Park, PA": -5, # Eastern
+    "Norman, OK": -6,      # Central
+    "Columbia, SC": -5,    # Eastern
+    "Boston, MA": -5,      # Eastern
+    "Winston-Salem, NC": -5,   # Eastern
+    "Syracuse, NY": -5,    # Eastern
+    "Philadelphia, PA": -5,     # Eastern
+    "Atlanta, GA": -5,     # Eastern
+    "Durham, NC": -5,      # Eastern
+    "Louisville, KY": -6,  # Central
+    "Tallahassee, FL": -5, # Eastern
+    "Clemson, SC": -5,     # Eastern
+    "Dallas, TX": -6,      # Central
+    "Blacksburg, VA": -5,  # Eastern
+    "Berkeley, CA": -8,    # Pacific
+    "Palo Alto, CA": -8,   # Pacific
+    "Charlottesville, VA": -5, # Eastern (FIXED)
+    "Storrs, CT": -5,      # Eastern
+    "Coral Gables, FL": -5,    # Eastern
+    "Raleigh, NC": -5,     # Eastern
+    "Chapel Hill, NC": -5, # Eastern
+    "Pittsburgh, PA": -5,  # Eastern
+    "Greensboro, NC": -5,  # Eastern
+    "Iowa City, IA": -6,   # Central
+    "Austin, TX": -6,      # Central
+    "Los Angeles, CA": -8, # Pacific
+    "Fort Worth, TX": -6,  # Central
+    "Sacramento, CA": -8,  # Pacific
+    "Phoenix, AZ": -7,     # Mountain
+}
+
+# Home venue of each program (conference members and Notre Dame's opponents)
+team_venues = {
+    "Notre Dame": "South Bend, IN",
+    "Boston College": "Boston, MA",
+    "California": "Berkeley, CA",
+    "Clemson": "Clemson, SC",
+    "Duke": "Durham, NC",
+    "Florida State": "Tallahassee, FL",
+    "Georgia Tech": "Atlanta, GA",
+    "Louisville": "Louisville, KY",
+    "Miami": "Coral Gables, FL",
+    "NC State": "Raleigh, NC",
+    "North Carolina": "Chapel Hill, NC",
+    "Pittsburgh": "Pittsburgh, PA",
+    "SMU": "Dallas, TX",
+    "Stanford": "Palo Alto, CA",
+    "Syracuse": "Syracuse, NY",
+    "Virginia": "Charlottesville, VA",
+    "Virginia Tech": "Blacksburg, VA",
+    "Wake Forest": "Winston-Salem, NC",
+    "Marquette": "Milwaukee, WI",
+    "UConn": "Storrs, CT",
+    "Penn State": "University Park, PA",
+    "Oklahoma": "Norman, OK",
+    "South Carolina": "Columbia, SC",
+    "Temple": "Philadelphia, PA",
+}
+
+
+def calculate_distance(coord1, coord2):
+    """Calculate distance between two coordinates using Haversine formula (returns miles)"""
+    lat1, lon1 = coord1
+    lat2, lon2 = coord2
+
+    # Convert to radians
+    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+
+    # Haversine formula
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
+    c = 2 * math.asin(math.sqrt(a))
+    r = 3959  # Radius of Earth in miles
+
+    return c * r
+
+
+def distance_matrix(coords):
+    """All-pairs Haversine distances (miles) for an (n x 2) array of lat/lon, vectorized"""
+    radians = np.radians(np.asarray(coords, dtype=float))
+    lat = radians[:, 0]
+    lon = radians[:, 1]
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = np.sin(dlat/2)**2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon/2)**2
+    return 2 * np.arcsin(np.sqrt(np.clip(a, 0, 1))) * 3959
+
+
+def get_travel_direction(origin, destination):
+    """Determine travel direction"""
+    if origin == destination:
+        return "Home"
+
+    origin_coords = city_coords[origin]
+    dest_coords = city_coords[destination]
+
+    lat_diff = dest_coords[0] - origin_coords[0]
+    lon_diff = dest_coords[1] - origin_coords[1]
+
+    # Determine primary direction
+    if abs(lat_diff) > abs(lon_diff):
+        return "North" if lat_diff > 0 else "South"
+    else:
+        return "Eastbound" if lon_diff > 0 else "Westbound"
+
+
+def count_timezones_crossed(origin, destination):
+    """Count how many timezones are crossed"""
+    origin_tz = timezone_offsets.get(origin, DEFAULT_TIMEZONE)
+    dest_tz = timezone_offsets.get(destination, DEFAULT_TIMEZONE)
+    return abs(origin_tz - dest_tz)
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Local what-if service for schedule edits.
+
+A long-running asyncio HTTP server (standard library only, bound to
+localhost) that loads the venue tables, pair distances and baseline schedule
+once, then answers schedule queries from warm in-memory state:
+
+    GET  /health              liveness check
+    GET  /baseline            travel + fatigue rows and validation for the current schedule
+    POST /evaluate            {"games": [...]} and/or {"edits": [...]} -> same shape as /baseline
+    POST /query               season index lookups over every season file (season_index.py)
+
+Games are {"date", "opponent", "location", "home_away"} objects. Edits are
+applied in order to the posted games (or the baseline schedule):
+
+    {"op": "swap", "games": [3, 8]}                       swap the dates of two games
+    {"op": "move", "game": 12, "date": "2026-01-03"}      reschedule a game
+    {"op": "relocate", "game": 5, "location": "Dallas, TX", "home_away": "Away"}
+    {"op": "add", "game": {...}}
+    {"op": "remove", "game": 17}
+
+Game numbers refer to the schedule before any edits. The edited schedule is
+re-sorted by date before it is scored.
+
+Query bodies name a team (plus "season" / "sport" when it has several) and
+one lookup:
+
+    {"team": "Notre Dame", "start": "2026-01-01", "end": "2026-02-15"}   range totals (optional "metric")
+    {"team": "Notre Dame", "date": "2026-01-28"}                         state going into a date
+    {"team": "Notre Dame", "game": 22}                                   one game
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import time
+from collections import OrderedDict
+
+import season_index
+import travel_engine
+
+HOST = '127.0.0.1'
+PORT = 8765
+SCHEDULE_FILE = 'nd_womens_basketball_2025_2026.csv'
+CACHE_SIZE = 1024
+MAX_BODY_BYTES = 1_000_000
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+def load_games(schedule_file=SCHEDULE_FILE):
+    """Baseline games from a travel CSV"""
+    with open(schedule_file, newline='') as f:
+        return [{'date': row['Game_Date'], 'opponent': row['Opponent'],
+                 'location': row['Location'], 'home_away': row['Home_Away']}
+                for row in csv.DictReader(f)]
+
+
+def apply_edits(games, edits):
+    """Apply what-if edits to a copy of the games; returns the date-sorted result"""
+    games = [dict(game) for game in games]
+    removed = set()
+
+    def game_at(number):
+        if not isinstance(number, int) or not 1 <= number <= len(games) or number - 1 in removed:
+            raise ValueError(f"No game number {number!r} in the schedule")
+        return games[number - 1]
+
+    for edit in edits:
+        op = edit.get('op')
+        if op == 'swap':
+            first, second = (game_at(n) for n in edit['games'])
+            first['date'], second['date'] = second['date'], first['date']
+        elif op == 'move':
+            game_at(edit['game'])['date'] = edit['date']
+        elif op == 'relocate':
+            game = game_at(edit['game'])
+            game['location'] = edit['location']
+            game['home_away'] = edit.get('home_away', game['home_away'])
+        elif op == 'add':
+            games.append(parse_game(edit['game']))
+        elif op == 'remove':
+            game_at(edit['game'])
+            removed.add(edit['game'] - 1)
+        else:
+            raise ValueError(f"Unknown edit op {op!r}")
+
+    kept = [game for i, game in enumerate(games) if i not in removed]
+    return sorted(kept, key=lambda game: game['date'])
+
+
+def parse_game(game):
+    """Validate one posted game object"""
+    try:
+        return {key: str(game[key]) for key in ('date', 'opponent', 'location', 'home_away')}
+    except (KeyError, TypeError):
+        raise ValueError("Each game needs 'date', 'opponent', 'location' and 'home_away'")
+
+
+class WhatIfEngine:
+    """Warm schedule evaluator with an LRU cache of encoded responses"""
+
+    def __init__(self, schedule_file=SCHEDULE_FILE, cache_size=CACHE_SIZE):
+        # Load venue pair distances and road drive times once
+        travel_engine.distance_table()
+        travel_engine.road_drive_times()
+        self.baseline_games = load_games(schedule_file)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.baseline = self.response(self.baseline_games)
+        self.season_index = None
+
+    def evaluate(self, games):
+        """Travel rows, fatigue rows and validation for a list of games"""
+        travel_rows = travel_engine.build_travel_rows(games)
+        fatigue_rows = travel_engine.build_fatigue_rows(travel_rows)
+        return {
+            'travel': travel_rows,
+            'fatigue': fatigue_rows,
+            'validation': travel_engine.validate_schedule(travel_rows, fatigue_rows),
+        }
+
+    def response(self, games):
+        """JSON-encoded evaluation of a list of games, served from the cache when possible"""
+        key = tuple((g['date'], g['opponent'], g['location'], g['home_away']) for g in games)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        encoded = json.dumps(self.evaluate(games), separators=(',', ':')).encode()
+        self.cache[key] = encoded
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return encoded
+
+    def query(self, request):
+        """Answer one season index query (the index is built on first use)"""
+        if self.season_index is None:
+            self.season_index = season_index.SeasonIndex.from_sources()
+        index = self.season_index
+        key = index.resolve(request['team'], request.get('season'), request.get('sport'))
+        answer = {'sport': key[0], 'team': key[1], 'season': key[2]}
+        if 'date' in request:
+            return {**answer, **index.at(key, request['date'])}
+        if 'game' in request:
+            return {**answer, 'game': index.game(key, int(request['game']))}
+        metrics = [request['metric']] if 'metric' in request else list(season_index.METRICS)
+        for metric in metrics:
+            if metric not in season_index.METRICS:
+                raise ValueError(f"Unknown metric {metric!r}; use one of {', '.join(season_index.METRICS)}")
+        return {**answer, 'start': request['start'], 'end': request['end'],
+                'totals': {metric: round(index.total(key, metric, request['start'], request['end']), 2)
+                           for metric in metrics}}
+
+    def handle(self, method, path, body):
+        """Route one request; returns (status, payload dict or pre-encoded JSON bytes)"""
+        if path == '/health':
+            return 200, {'status': 'ok', 'cached_schedules': len(self.cache)}
+        if path == '/baseline':
+            return 200, self.baseline
+        if path not in ('/evaluate', '/query'):
+            return 404, {'error': f"Unknown path {path}"}
+        if method != 'POST':
+            return 405, {'error': f"Use POST for {path}"}
+
+        try:
+            request = json.loads(body or b'{}')
+            if not isinstance(request, dict):
+                raise ValueError("Request body must be a JSON object")
+            if path == '/query':
+                return 200, self.query(request)
+            games = [parse_game(g) for g in request['games']] if 'games' in request else self.baseline_games
+            games = apply_edits(games, request.get('edits', []))
+            return 200, self.response(games)
+        except (ValueError, KeyError, TypeError, IndexError) as e:
+            return 400, {'error': str(e)}
+
+
+async def handle_connection(engine, reader, writer):
+    """Serve HTTP/1.1 requests (with keep-alive) on one connection"""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            try:
+                method, target, version = request_line.decode('latin-1').split()
+            except ValueError:
+                break
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            try:
+                length = int(headers.get('content-length', 0))
+            except ValueError:
+                length = -1
+            # The body of an unreadable or oversized request is left unread, so its connection is closed
+            discard = length < 0 or length > MAX_BODY_BYTES
+            if length < 0:
+                status, payload = 400, {'error': "Malformed Content-Length header"}
+            elif length > MAX_BODY_BYTES:
+                status, payload = 413, {'error': "Request body too large"}
+            else:
+                body = await reader.readexactly(length) if length else b''
+                try:
+                    status, payload = engine.handle(method, target.split('?', 1)[0], body)
+                except Exception as e:
+                    status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+
+            data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+            keep_alive = (headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                          and not discard)
+            writer.write(
+                f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+            )
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(engine, host=HOST, port=PORT):
+    """Start the service; returns the asyncio server"""
+    return await asyncio.start_server(lambda r, w: handle_connection(engine, r, w), host, port)
+
+
+async def benchmark(engine, requests, concurrency, port):
+    """Fire what-if requests at a local server and report latency percentiles"""
+    server = await start_server(engine, HOST, port)
+    n_games = len(engine.baseline_games)
+    latencies = []
+
+    async def client(worker):
+        reader, writer = await asyncio.open_connection(HOST, port)
+        for i in range(worker, requests, concurrency):
+            # Distinct swaps so most requests miss the cache
+            a, b = 1 + i % n_games, 1 + (i * 7 + 3) % n_games
+            body = json.dumps({'edits': [{'op': 'swap', 'games': [a, b]},
+                                         {'op': 'move', 'game': a, 'date': f"2026-03-{1 + i % 28:02d}"}]})
+            start = time.perf_counter()
+            writer.write(f"POST /evaluate HTTP/1.1\r\nHost: {HOST}\r\nContent-Length: {len(body)}\r\n\r\n"
+                         f"{body}".encode())
+            await writer.drain()
+            await reader.readline()
+            length = 0
+            while (line := await reader.readline()) not in (b'\r\n', b''):
+                if line.lower().startswith(b'content-length:'):
+                    length = int(line.split(b':')[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+        writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(w) for w in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    server.close()
+    await server.wait_closed()
+
+    latencies.sort()
+    pct = lambda p: 1000 * latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))]
+    print(f"Requests: {len(latencies):,} | Concurrency: {concurrency} | Throughput: {len(latencies) / elapsed:,.0f}/s")
+    print(f"Latency p50: {pct(50):.2f} ms | p95: {pct(95):.2f} ms | p99: {pct(99):.2f} ms | max: {1000 * latencies[-1]:.2f} ms")
+
+
+async def serve(engine, host, port):
+    """Run the service until interrupted"""
+    server = await start_server(engine, host, port)
+    print(f"✓ What-if service listening on http://{host}:{port} "
+          f"({len(engine.baseline_games)} baseline games loaded)")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local what-if HTTP service for schedule edits")
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--schedule', default=SCHEDULE_FILE)
+    parser.add_argument('--bench', type=int, metavar='N', help="Run N benchmark requests and exit")
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    engine = WhatIfEngine(args.schedule)
+    try:
+        if args.bench:
+            asyncio.run(benchmark(engine, args.bench, args.concurrency, args.port))
+        else:
+            asyncio.run(serve(engine, HOST, args.port))
+    except KeyboardInterrupt:
+        pass